@@ -7,63 +7,667 @@ Display fun ASCII art animations
 import time
 import os
 import sys
+from collections import OrderedDict, deque
+
+from braille import BRAILLE_DOTS, BRAILLE_TABLE
+from netpbm import iter_ppm_images
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; Life falls back to pure Python
+    np = None
+
+
+if os.name == 'nt':
+    # An empty system() call switches the Windows console into VT mode,
+    # so the ANSI escapes below work there too
+    os.system('')
+
+CLEAR = "\033[2J\033[H"
+HOME = "\033[H"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
 
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR)
+    sys.stdout.flush()
+
+
+def move_cursor(row, col):
+    """Move the cursor to a 1-based row and column"""
+    sys.stdout.write(f"\033[{row};{col}H")
+
+
+class FrameStats:
+    """Frame timing measurements collected by FrameEngine"""
+    
+    def __init__(self, history=1000):
+        self.frames = 0
+        self.dropped = 0
+        self.started = None
+        self.finished = None
+        self.frame_times = deque(maxlen=history)
+    
+    def fps(self):
+        """Frames actually shown per second"""
+        if self.started is None or self.frames == 0:
+            return 0.0
+        end = self.finished if self.finished is not None else time.monotonic_ns()
+        return self.frames / max((end - self.started) / 1e9, 1e-9)
+    
+    def summary(self):
+        """One-line report of FPS, frame time and drops"""
+        if not self.frame_times:
+            return "no frames rendered"
+        ordered = sorted(self.frame_times)
+        mean = sum(ordered) / len(ordered)
+        p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+        return (f"{self.frames} frames at {self.fps():.1f} fps, frame time "
+                f"avg {mean / 1e6:.3f} ms, p95 {p95 / 1e6:.3f} ms, "
+                f"max {ordered[-1] / 1e6:.3f} ms, dropped {self.dropped}")
+
+
+class FrameEngine:
+    """Fixed-timestep animation loop on monotonic deadlines.
+    
+    Frame n is due at start + n / fps whatever the cost of drawing, so
+    the frame rate no longer depends on how long print takes. When the
+    loop falls more than a frame behind, late frames are dropped (the
+    simulation still advances) instead of slowing the animation down.
+    """
+    
+    MAX_CATCH_UP = 5
+    
+    def __init__(self, fps=20, out=None):
+        self.fps = fps
+        self.step_ns = int(1_000_000_000 / fps)
+        self.out = out or sys.stdout
+        self.stats = FrameStats()
+    
+    def _draw(self, frame, began=None):
+        began = time.monotonic_ns() if began is None else began
+        if frame:
+            self.out.write(frame)
+            self.out.flush()
+        self.stats.frame_times.append(time.monotonic_ns() - began)
+        self.stats.frames += 1
+    
+    def _wait(self, deadline):
+        remaining = deadline - time.monotonic_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1_000_000_000)
+    
+    def play(self, frames, render=None, duration=None):
+        """Show an iterable of frames at the fixed frame rate.
+        
+        Late frames are skipped, so each frame must redraw everything it
+        shows. With `render`, frames are raw items and render(item) is
+        only called for the frames actually drawn, which is where
+        incremental output such as Screen.frame() diffs belongs.
+        `duration(item)` gives a frame's own display time in seconds
+        (None for the engine's 1 / fps), for clips with per-frame delays.
+        """
+        def length(item):
+            seconds = duration(item) if duration is not None else None
+            return int(seconds * 1_000_000_000) if seconds else self.step_ns
+        
+        frames = iter(frames)
+        self.stats.started = due = time.monotonic_ns()
+        try:
+            for frame in frames:
+                # Skip frames whose slot has already passed, but never the last one
+                for _ in range(self.MAX_CATCH_UP):
+                    if time.monotonic_ns() < due + length(frame):
+                        break
+                    upcoming = next(frames, None)
+                    if upcoming is None:
+                        break
+                    due += length(frame)
+                    frame = upcoming
+                    self.stats.dropped += 1
+                
+                self._wait(due)
+                # Time rendering as part of the frame, like run() does
+                began = time.monotonic_ns()
+                self._draw(render(frame) if render is not None else frame, began)
+                due += length(frame)
+            self._wait(due)
+        finally:
+            self.stats.finished = time.monotonic_ns()
+        return self.stats
+    
+    def run(self, update, render, frames=None):
+        """Drive a simulation: update() once per step, render() -> frame.
+        
+        `update` returns False to stop. Under load several updates run
+        back to back and only the last state is rendered.
+        """
+        self.stats.started = start = time.monotonic_ns()
+        tick = 0
+        try:
+            while frames is None or tick < frames:
+                if update() is False:
+                    break
+                tick += 1
+                
+                behind = (time.monotonic_ns() - (start + tick * self.step_ns)) // self.step_ns
+                if frames is not None:
+                    behind = min(behind, frames - tick)
+                for _ in range(min(behind, self.MAX_CATCH_UP)):
+                    if update() is False:
+                        return self.stats
+                    tick += 1
+                    self.stats.dropped += 1
+                
+                self._wait(start + (tick - 1) * self.step_ns)
+                began = time.monotonic_ns()
+                self._draw(render(), began)
+        finally:
+            self.stats.finished = time.monotonic_ns()
+        return self.stats
+
+
+class Screen:
+    """Double-buffered block of terminal cells.
+    
+    Drawing goes into the back buffer. frame() compares it with the front
+    buffer (what the terminal currently shows), emits the cheapest cursor
+    moves plus the changed runs as one string, then swaps. Short unchanged
+    gaps are rewritten instead of skipped when that is fewer bytes.
+    Positions are relative to the block's top-left corner, so a Screen
+    can sit inline below other output.
+    """
+    
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.back = [' '] * (cols * rows)
+        self.front = [None] * (cols * rows)
+        self.cx = 0
+        self.cy = 0
+        self.bytes_written = 0
+        self.frames = 0
+    
+    def open(self):
+        """Reserve the block's rows below the cursor and home onto it"""
+        setup = "\r" + "\n" * (self.rows - 1)
+        if self.rows > 1:
+            setup += f"\033[{self.rows - 1}A"
+        self.cx = self.cy = 0
+        return HIDE_CURSOR + setup
+    
+    def close(self):
+        """Park the cursor on the line after the block"""
+        down = self.rows - 1 - self.cy
+        return (f"\033[{down}B" if down > 0 else "") + "\r\n" + SHOW_CURSOR
+    
+    def clear(self):
+        """Blank the back buffer"""
+        self.back[:] = [' '] * len(self.back)
+    
+    def put(self, x, y, char):
+        """Set one cell, ignoring anything outside the block"""
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            self.back[y * self.cols + x] = char
+    
+    def text(self, x, y, string):
+        """Write a string starting at (x, y), clipped to the block"""
+        if not 0 <= y < self.rows:
+            return
+        start = max(x, 0)
+        string = string[start - x:self.cols - x]
+        i = y * self.cols + start
+        self.back[i:i + len(string)] = string
+    
+    def _move(self, x, y):
+        parts = []
+        if y > self.cy:
+            parts.append(f"\033[{y - self.cy}B")
+        elif y < self.cy:
+            parts.append(f"\033[{self.cy - y}A")
+        
+        if self.cx is None or x < self.cx:
+            # Column unknown (after writing the last column) or moving left
+            back = "\r" + (f"\033[{x}C" if x else "")
+            if self.cx is not None:
+                left = f"\033[{self.cx - x}D"
+                back = left if len(left) < len(back) else back
+            parts.append(back)
+        elif x > self.cx:
+            parts.append(f"\033[{x - self.cx}C")
+        return "".join(parts)
+    
+    def frame(self):
+        """Return the escape string that turns the front buffer into the back"""
+        out = []
+        cols = self.cols
+        back, front = self.back, self.front
+        
+        for y in range(self.rows):
+            start = y * cols
+            if back[start:start + cols] == front[start:start + cols]:
+                continue
+            
+            x = 0
+            while x < cols:
+                if back[start + x] == front[start + x]:
+                    x += 1
+                    continue
+                
+                # Extend the run while unchanged gaps are cheaper to rewrite
+                end = x + 1
+                scan = end
+                while scan < cols:
+                    if back[start + scan] != front[start + scan]:
+                        end = scan + 1
+                    elif scan - end >= 4:
+                        break
+                    scan += 1
+                
+                out.append(self._move(x, y))
+                out.append("".join(back[start + x:start + end]))
+                self.cy = y
+                self.cx = end if end < cols else None
+                x = end
+        
+        self.front[:] = back
+        self.frames += 1
+        frame = "".join(out)
+        self.bytes_written += len(frame.encode())
+        return frame
+    
+    def present(self):
+        """Send the changes to the terminal in a single os.write"""
+        data = self.frame().encode()
+        sys.stdout.flush()
+        while data:
+            data = data[os.write(sys.stdout.fileno(), data):]
+
+
+class Sprite:
+    """A piece of ASCII art with a position, velocity and depth.
+    
+    `art` is a string (multi-line is fine) or a list of strings to cycle
+    through at `frame_rate` frames per second. Velocities are in cells
+    per second. `edges` decides what happens at the screen border:
+    "clip" lets the sprite leave, "bounce" reflects it and "wrap" brings
+    it back on the other side.
+    """
+    
+    def __init__(self, art, x=0.0, y=0.0, vx=0.0, vy=0.0, z=0,
+                 frame_rate=0, edges="clip", transparent=" "):
+        frames = [art] if isinstance(art, str) else list(art)
+        # Pre-render every frame once as the list of opaque cells
+        self.frames = [tuple((dx, dy, char)
+                             for dy, line in enumerate(frame.split("\n"))
+                             for dx, char in enumerate(line) if char != transparent)
+                       for frame in frames]
+        self.width = max(len(line) for frame in frames for line in frame.split("\n"))
+        self.height = max(frame.count("\n") + 1 for frame in frames)
+        self.x, self.y = x, y
+        self.vx, self.vy = vx, vy
+        self.z = z
+        self.frame_rate = frame_rate
+        self.edges = edges
+        self.age = 0.0
+    
+    def step(self, dt, cols, rows):
+        """Advance the sprite by dt seconds inside a cols x rows screen"""
+        self.age += dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        
+        if self.edges == "bounce":
+            right, bottom = max(cols - self.width, 0), max(rows - self.height, 0)
+            if self.x < 0 or self.x > right:
+                self.vx = -self.vx
+                self.x = -self.x if self.x < 0 else 2 * right - self.x
+            if self.y < 0 or self.y > bottom:
+                self.vy = -self.vy
+                self.y = -self.y if self.y < 0 else 2 * bottom - self.y
+        elif self.edges == "wrap":
+            self.x %= cols
+            self.y %= rows
+    
+    def state(self):
+        """What the sprite looks like right now: (column, row, frame)"""
+        frame = int(self.age * self.frame_rate) % len(self.frames) if self.frame_rate else 0
+        return int(self.x // 1), int(self.y // 1), frame
+
+
+class Compositor:
+    """Draws sprites into a Screen's back buffer in z order.
+    
+    Each sprite's placed cells (screen index, character) are cached by
+    the sprite and its state, so a sprite that stands still or comes
+    back to a position is never clipped or wrapped again, whatever the
+    other sprites are doing. A frame is the background plus those cells.
+    """
+    
+    def __init__(self, screen, background=None, cache_size=4096):
+        self.screen = screen
+        self.background = list(background or [' '] * (screen.cols * screen.rows))
+        self.sprites = []
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+    
+    def add(self, sprite):
+        """Add a sprite; higher z is drawn on top"""
+        self.sprites.append(sprite)
+        self.sprites.sort(key=lambda s: s.z)
+        return sprite
+    
+    def remove(self, sprite):
+        """Take a sprite out of the scene"""
+        self.sprites.remove(sprite)
+        # Entries are keyed by id(), which a new sprite could reuse
+        self.cache.clear()
+    
+    def step(self, dt):
+        """Move every sprite forward by dt seconds"""
+        cols, rows = self.screen.cols, self.screen.rows
+        for sprite in self.sprites:
+            sprite.step(dt, cols, rows)
+    
+    def _place(self, sprite, ox, oy, frame):
+        """Screen indices and characters of a sprite drawn at (ox, oy)"""
+        cols, rows = self.screen.cols, self.screen.rows
+        wrap = sprite.edges == "wrap"
+        placed = []
+        for dx, dy, char in sprite.frames[frame]:
+            x, y = ox + dx, oy + dy
+            if wrap:
+                x, y = x % cols, y % rows
+            elif not (0 <= x < cols and 0 <= y < rows):
+                continue
+            placed.append((y * cols + x, char))
+        return tuple(placed)
+    
+    def compose(self):
+        """Fill the screen's back buffer with the current scene"""
+        back = self.screen.back
+        back[:] = self.background
+        cache = self.cache
+        for sprite in self.sprites:
+            state = sprite.state()
+            key = (id(sprite),) + state
+            placed = cache.get(key)
+            if placed is None:
+                self.misses += 1
+                placed = cache[key] = self._place(sprite, *state)
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+            else:
+                self.hits += 1
+                cache.move_to_end(key)
+            for i, char in placed:
+                back[i] = char
+    
+    def cache_summary(self):
+        total = self.hits + self.misses
+        rate = 100 * self.hits / total if total else 0
+        return f"{self.hits}/{total} sprite draws from cache ({rate:.0f}%)"
+
+
+LIFE_RULES = {
+    "life": "B3/S23",
+    "highlife": "B36/S23",
+    "seeds": "B2/S",
+    "day & night": "B3678/S34678",
+    "maze": "B3/S12345",
+    "replicator": "B1357/S1357",
+}
+
+# Top cell + 2 * bottom cell -> half-block character
+HALF_BLOCK_TABLE = {0: ' ', 1: '▀', 2: '▄', 3: '█'}
+
+
+def parse_rule(rule):
+    """Parse "B3/S23" notation into (birth counts, survival counts)"""
+    rule = LIFE_RULES.get(rule.lower(), rule).upper()
+    try:
+        birth, survive = rule.split("/")
+        if not (birth.startswith("B") and survive.startswith("S")):
+            raise ValueError
+        # A cell has at most 8 neighbors
+        if not set(birth[1:] + survive[1:]) <= set("012345678"):
+            raise ValueError
+        return frozenset(map(int, birth[1:])), frozenset(map(int, survive[1:]))
+    except ValueError:
+        raise ValueError(f"Invalid rule {rule!r}, expected something like B3/S23")
+
+
+class LifeGrid:
+    """Life-like cellular automaton on a toroidal grid.
+    
+    With NumPy a generation is one vectorized step: neighbor counts come
+    from rolled copies of the grid (rows first, then columns, so four
+    rolls instead of eight) and the rule is applied with a handful of
+    whole-array comparisons. Without NumPy each row is a bytearray and
+    the same column-sum trick runs in plain Python, which is fine for
+    terminal-sized grids.
+    """
+    
+    def __init__(self, width, height, rule="B3/S23", density=0.3, seed=None):
+        import random
+        
+        self.width = width
+        self.height = height
+        self.birth, self.survive = parse_rule(rule)
+        self.generation = 0
+        # Cell value after the step, indexed by neighbors + 9 * alive
+        self.table = [0] * 18
+        for n in self.birth:
+            self.table[n] = 1
+        for n in self.survive:
+            self.table[9 + n] = 1
+        
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            self.cells = (rng.random((height, width)) < density).astype(np.uint8)
+            self.live_codes = [code for code, alive in enumerate(self.table) if alive]
+        else:
+            rng = random.Random(seed)
+            self.cells = [bytearray(rng.random() < density for _ in range(width))
+                          for _ in range(height)]
+    
+    def step(self):
+        """Advance one generation"""
+        if np is not None:
+            cells = self.cells
+            rows = cells + np.roll(cells, 1, 0)
+            rows += np.roll(cells, -1, 0)
+            counts = rows + np.roll(rows, 1, 1)
+            counts += np.roll(rows, -1, 1)
+            # The 3x3 sum includes the cell itself; this turns it into
+            # neighbors + 9 * alive, the index into self.table
+            counts += cells << 3
+            alive = np.zeros(cells.shape, dtype=bool)
+            for code in self.live_codes:
+                alive |= counts == code
+            self.cells = alive.view(np.uint8)
+        else:
+            table = bytes(self.table)
+            cells = self.cells
+            height = self.height
+            new = []
+            for y in range(height):
+                row = cells[y]
+                column = list(map(sum, zip(cells[y - 1], row, cells[(y + 1) % height])))
+                # 3x3 sums via the column sums of the neighbours left and right
+                total = map(sum, zip(column[-1:] + column[:-1], column, column[1:] + column[:1]))
+                new.append(bytearray(table[t + (alive << 3)] for t, alive in zip(total, row)))
+            self.cells = new
+        self.generation += 1
+    
+    def population(self):
+        if np is not None:
+            return int(self.cells.sum(dtype=np.int64))
+        return sum(map(sum, self.cells))
+    
+    def _window(self, x, y, width, height):
+        """Cells of a width x height window, wrapping around the torus"""
+        xs = [(x + i) % self.width for i in range(width)]
+        ys = [(y + i) % self.height for i in range(height)]
+        if np is not None:
+            return self.cells[np.ix_(ys, xs)]
+        return [bytes(self.cells[row][col] for col in xs) for row in ys]
+    
+    def render(self, x, y, cols, rows, mode="braille"):
+        """Lines of text showing the viewport at (x, y), cols x rows characters.
+        
+        "braille" packs 2x4 cells per character, "halfblock" 1x2.
+        """
+        if mode == "braille":
+            cells = self._window(x, y, cols * 2, rows * 4)
+            table = BRAILLE_TABLE
+            if np is not None:
+                weights = np.array(BRAILLE_DOTS, dtype=np.uint8).reshape(1, 4, 1, 2)
+                codes = (cells.reshape(rows, 4, cols, 2) * weights).sum(axis=(1, 3), dtype=np.uint8)
+            else:
+                codes = []
+                for r in range(rows):
+                    band = cells[r * 4:r * 4 + 4]
+                    codes.append(bytes(
+                        sum(BRAILLE_DOTS[dy][dx]
+                            for dy in range(4) for dx in range(2) if band[dy][c * 2 + dx])
+                        for c in range(cols)))
+        else:
+            cells = self._window(x, y, cols, rows * 2)
+            table = HALF_BLOCK_TABLE
+            if np is not None:
+                codes = cells[0::2] + (cells[1::2] << 1)
+            else:
+                codes = [bytes(top + 2 * bottom for top, bottom in zip(cells[r], cells[r + 1]))
+                         for r in range(0, rows * 2, 2)]
+        
+        return [bytes(line).decode('latin-1').translate(table) for line in codes]
+
+
+def show_stats(stats):
+    """Print the measured frame statistics after an animation"""
+    print(f"\n📏 {stats.summary()}")
 
 
 def animate_spinner():
     """Spinning animation"""
     frames = ['|', '/', '-', '\\']
     print("\n⭐ Spinner Animation (Press Ctrl+C to stop)\n")
+    engine = FrameEngine(fps=10)
     try:
-        for _ in range(20):
-            for frame in frames:
-                print(f"\r  {frame} Loading... {frame}", end='', flush=True)
-                time.sleep(0.1)
+        engine.play(f"\r  {frame} Loading... {frame}" for _ in range(20) for frame in frames)
     except KeyboardInterrupt:
         print("\r  ✓ Complete!     ")
+    show_stats(engine.stats)
 
 
 def animate_bouncing_ball():
     """Bouncing ball animation"""
     print("\n⚽ Bouncing Ball (Press Ctrl+C to stop)\n")
+    fps = 20
+    engine = FrameEngine(fps=fps)
+    screen = Screen(11, 1)
+    scene = Compositor(screen)
+    scene.add(Sprite("o", vx=20, edges="bounce"))
+    
+    def update():
+        scene.step(1 / fps)
+    
+    def render():
+        scene.compose()
+        return screen.frame()
+    
+    sys.stdout.write(screen.open())
     try:
-        for _ in range(3):
-            # Ball going down
-            for i in range(10):
-                print("\r" + " " * i + "o", end='', flush=True)
-                time.sleep(0.05)
-            # Ball going up
-            for i in range(10, 0, -1):
-                print("\r" + " " * i + "o", end='', flush=True)
-                time.sleep(0.05)
+        engine.run(update, render, frames=60)
     except KeyboardInterrupt:
-        print("\n")
+        pass
+    print(screen.close(), end='')
+    show_stats(engine.stats)
 
 
 def animate_wave():
     """Wave animation"""
     print("\n🌊 Wave Animation (Press Ctrl+C to stop)\n")
+    fps = 10
+    engine = FrameEngine(fps=fps)
+    wave = "~-~-~-~-~-~-~-~-~-~-"
+    screen = Screen(len(wave), 1)
+    scene = Compositor(screen)
+    scene.add(Sprite(wave, vx=-fps, edges="wrap"))
+    
+    def update():
+        scene.step(1 / fps)
+    
+    def render():
+        scene.compose()
+        return screen.frame()
+    
+    sys.stdout.write(screen.open())
+    try:
+        engine.run(update, render, frames=15 * len(wave))
+    except KeyboardInterrupt:
+        pass
+    print(screen.close(), end='')
+    show_stats(engine.stats)
+
+
+def animate_fullscreen_bounce(seconds=5, fps=60, count=30):
+    """Dozens of sprites bouncing around the whole terminal at 60 fps"""
+    import shutil
+    import random
+    
+    size = shutil.get_terminal_size()
+    cols, rows = max(size.columns - 1, 20), max(size.lines - 3, 8)
+    screen = Screen(cols, rows)
+    
+    border = [' '] * (cols * rows)
+    border[:cols] = border[-cols:] = "+" + "-" * (cols - 2) + "+"
+    for y in range(1, rows - 1):
+        border[y * cols] = border[y * cols + cols - 1] = "|"
+    scene = Compositor(screen, background=border)
+    
+    shapes = ["O", "o", "@", "<>", ["*", "+", "x", "+"], ["(o)", "(-)"]]
+    for _ in range(count):
+        scene.add(Sprite(random.choice(shapes),
+                         x=random.uniform(1, cols - 4), y=random.uniform(1, rows - 2),
+                         vx=random.choice([-1, 1]) * random.uniform(10, 40),
+                         vy=random.choice([-1, 1]) * random.uniform(5, 20),
+                         z=random.randint(0, 3), frame_rate=6, edges="bounce"))
+    
+    def update():
+        scene.step(1 / fps)
+    
+    def render():
+        scene.compose()
+        return screen.frame()
+    
+    engine = FrameEngine(fps=fps)
+    sys.stdout.write(CLEAR + screen.open())
     try:
-        wave = "~-~-~-~-~-~-~-~-~-~-"
-        for _ in range(15):
-            for i in range(len(wave)):
-                print(f"\r{wave[i:] + wave[:i]}", end='', flush=True)
-                time.sleep(0.1)
+        engine.run(update, render, frames=seconds * fps)
     except KeyboardInterrupt:
-        print("\n")
+        pass
+    print(screen.close(), end='')
+    
+    full_redraw = (cols + 2) * rows * screen.frames
+    show_stats(engine.stats)
+    print(f"📦 Output: {screen.bytes_written:,} bytes in {screen.frames} writes "
+          f"(full redraws would be about {full_redraw:,} bytes)")
+    print(f"🧩 {count} sprites, {scene.cache_summary()}")
 
 
 def animate_typing_text():
     """Typing text animation"""
     text = "Hello! This is a typing animation effect..."
     print("\n⌨️  Typing Animation\n")
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(0.05)
+    # Each frame is the whole line so far, so a dropped frame only skips
+    # ahead instead of losing characters
+    FrameEngine(fps=20).play(f"\r{text[:i]}" for i in range(1, len(text) + 1))
     print("\n")
     time.sleep(1)
 
@@ -71,13 +675,381 @@ def animate_typing_text():
 def animate_progress_bar():
     """Progress bar animation"""
     print("\n📊 Progress Bar\n")
-    for i in range(101):
-        bar_length = 30
-        filled = int(bar_length * i / 100)
-        bar = '█' * filled + '░' * (bar_length - filled)
-        print(f"\r  [{bar}] {i}%", end='', flush=True)
-        time.sleep(0.03)
+    bar_length = 30
+    
+    def frames():
+        for i in range(101):
+            filled = int(bar_length * i / 100)
+            bar = '█' * filled + '░' * (bar_length - filled)
+            yield f"\r  [{bar}] {i}%"
+    
+    engine = FrameEngine(fps=33)
+    engine.play(frames())
     print("\n")
+    show_stats(engine.stats)
+
+
+def animate_life(rule=None, seconds=30, fps=15, mode="braille"):
+    """Conway's Life (or another Life-like rule) on a wrap-around grid"""
+    import shutil
+    
+    if rule is None:
+        print("\nRules: " + ", ".join(f"{name} ({r})" for name, r in LIFE_RULES.items()))
+        rule = input("Rule name or B/S notation [life]: ").strip() or "life"
+    try:
+        parse_rule(rule)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    size = shutil.get_terminal_size()
+    cols, rows = max(size.columns - 1, 20), max(size.lines - 4, 8)
+    per_col, per_row = (2, 4) if mode == "braille" else (1, 2)
+    # The grid is larger than the viewport; what scrolls off wraps around
+    grid = LifeGrid(cols * per_col * 2, rows * per_row * 2, rule=rule)
+    screen = Screen(cols, rows + 1)
+    
+    def update():
+        grid.step()
+    
+    def render():
+        for y, line in enumerate(grid.render(0, 0, cols, rows, mode)):
+            screen.text(0, y, line)
+        status = (f" gen {grid.generation}  {rule}  {grid.width}x{grid.height}  "
+                  f"population {grid.population():,}")
+        screen.text(0, rows, status.ljust(cols))
+        return screen.frame()
+    
+    engine = FrameEngine(fps=fps)
+    sys.stdout.write(CLEAR + screen.open())
+    try:
+        engine.run(update, render, frames=seconds * fps)
+    except KeyboardInterrupt:
+        pass
+    print(screen.close(), end='')
+    show_stats(engine.stats)
+
+
+def benchmark_life(size=None, generations=20, rule="B3/S23"):
+    """Headless Life benchmark: generations per second on a size x size grid.
+    
+    The default grid is 4096x4096 with NumPy and 256x256 without, where
+    the big grid would take minutes.
+    """
+    if size is None:
+        size = 4096 if np is not None else 256
+    backend = "NumPy" if np is not None else "pure Python"
+    print(f"\n🧬 Life benchmark: {size}x{size} grid, {rule}, {backend}")
+    grid = LifeGrid(size, size, rule=rule, seed=1)
+    started = time.perf_counter()
+    for _ in range(generations):
+        grid.step()
+    elapsed = time.perf_counter() - started
+    rate = generations / elapsed
+    print(f"   {generations} generations in {elapsed:.2f}s = {rate:.1f} gen/s "
+          f"({rate * size * size / 1e6:,.0f}M cells/s)")
+    return rate
+
+
+ASCII_RAMP = " .:-=+*#%@"
+# Luminance byte -> ramp character, used with bytes.translate
+LUMA_TABLE = bytes(ord(ASCII_RAMP[v * len(ASCII_RAMP) // 256]) for v in range(256))
+
+
+def iter_ppm_frames(path):
+    """Yield (width, height, channels, pixels, delay) from raw PPM/PGM.
+    
+    `path` is one file of concatenated P6/P5 images or a directory of
+    them (see netpbm.iter_ppm_images). PPM has no timing, so delay is
+    always None.
+    """
+    for image in iter_ppm_images(path):
+        yield image + (None,)
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) < size:
+        raise ValueError("Truncated GIF data")
+    return data
+
+
+def _lzw_decode(data, min_code_size):
+    """Decompress GIF image data into a bytearray of palette indices"""
+    if not 1 <= min_code_size <= 11:
+        raise ValueError("Corrupt GIF data")
+    clear = 1 << min_code_size
+    end = clear + 1
+    base = [bytes([i]) for i in range(clear)] + [b"", b""]
+    table = base[:]
+    code_size = min_code_size + 1
+    mask = (1 << code_size) - 1
+    out = bytearray()
+    prev = None
+    bits = nbits = 0
+    
+    for byte in data:
+        bits |= byte << nbits
+        nbits += 8
+        while nbits >= code_size:
+            code = bits & mask
+            bits >>= code_size
+            nbits -= code_size
+            
+            if code == clear:
+                table = base[:]
+                code_size = min_code_size + 1
+                mask = (1 << code_size) - 1
+                prev = None
+                continue
+            if code == end:
+                return out
+            
+            if code < len(table):
+                entry = table[code]
+                if prev is not None and len(table) < 4096:
+                    table.append(prev + entry[:1])
+            elif code == len(table) and prev is not None:
+                entry = prev + prev[:1]
+                table.append(entry)
+            else:
+                raise ValueError("Corrupt GIF data")
+            out += entry
+            prev = entry
+            
+            if len(table) == mask + 1 and code_size < 12:
+                code_size += 1
+                mask = (1 << code_size) - 1
+    return out
+
+
+def _read_sub_blocks(f):
+    chunks = []
+    while True:
+        size = _read_exact(f, 1)[0]
+        if size == 0:
+            return b"".join(chunks)
+        chunks.append(_read_exact(f, size))
+
+
+def iter_gif_frames(path):
+    """Yield (width, height, 3, rgb pixels, delay seconds) for each GIF frame.
+    
+    A small pure-Python decoder: global/local palettes, transparency,
+    interlacing and the common disposal methods. Each frame is the fully
+    composited canvas.
+    """
+    with open(path, "rb") as f:
+        if f.read(6) not in (b"GIF87a", b"GIF89a"):
+            raise ValueError(f"{path} is not a GIF file")
+        header = _read_exact(f, 7)
+        width = header[0] | header[1] << 8
+        height = header[2] | header[3] << 8
+        if not (width and height):
+            raise ValueError(f"{path}: empty image")
+        flags = header[4]
+        global_palette = _read_exact(f, 3 << ((flags & 7) + 1)) if flags & 0x80 else None
+        
+        canvas = bytearray(width * height * 3)
+        delay, transparent, disposal = None, None, 0
+        
+        while True:
+            block = f.read(1)
+            if not block or block == b";":
+                return
+            
+            if block == b"!":
+                label = _read_exact(f, 1)
+                data = _read_sub_blocks(f)
+                if label == b"\xf9" and len(data) >= 4:
+                    disposal = (data[0] >> 2) & 7
+                    delay = (data[1] | data[2] << 8) / 100 or None
+                    transparent = data[3] if data[0] & 1 else None
+                continue
+            if block != b",":
+                raise ValueError(f"{path}: unexpected block {block!r}")
+            
+            desc = _read_exact(f, 9)
+            left, top = desc[0] | desc[1] << 8, desc[2] | desc[3] << 8
+            w, h = desc[4] | desc[5] << 8, desc[6] | desc[7] << 8
+            palette = _read_exact(f, 3 << ((desc[8] & 7) + 1)) if desc[8] & 0x80 else global_palette
+            if palette is None:
+                raise ValueError(f"{path}: frame without a color table")
+            min_code_size = _read_exact(f, 1)[0]
+            indices = _lzw_decode(_read_sub_blocks(f), min_code_size)
+            indices += bytes(w * h - len(indices))
+            
+            row_order = range(h)
+            if desc[8] & 0x40:
+                # Interlaced rows arrive as every 8th from 0, 8th from 4, 4th from 2, 2nd from 1
+                row_order = [y for start, step in ((0, 8), (4, 8), (2, 4), (1, 2))
+                             for y in range(start, h, step)]
+            
+            saved = bytes(canvas) if disposal == 3 else None
+            colors = [palette[i * 3:i * 3 + 3] for i in range(len(palette) // 3)]
+            colors += [b"\0\0\0"] * (256 - len(colors))
+            for src, y in enumerate(row_order):
+                if not 0 <= top + y < height:
+                    continue
+                row = indices[src * w:(src + 1) * w]
+                visible = min(w, width - left)
+                offset = ((top + y) * width + left) * 3
+                if transparent is None or transparent not in row:
+                    canvas[offset:offset + visible * 3] = b"".join(map(colors.__getitem__, row[:visible]))
+                else:
+                    for x in range(visible):
+                        if row[x] != transparent:
+                            canvas[offset + x * 3:offset + x * 3 + 3] = colors[row[x]]
+            
+            yield width, height, 3, bytes(canvas), delay
+            
+            if disposal == 2:
+                blank = bytes(min(w, width - left) * 3)
+                for y in range(top, min(top + h, height)):
+                    offset = (y * width + left) * 3
+                    canvas[offset:offset + len(blank)] = blank
+            elif saved is not None:
+                canvas[:] = saved
+            delay, transparent, disposal = None, None, 0
+
+
+def frame_to_ascii(width, height, channels, pixels, cols, rows):
+    """Block-average a frame down to cols x rows and map luminance to text"""
+    bw, bh = max(width // cols, 1), max(height // rows, 1)
+    cols, rows = min(cols, width // bw), min(rows, height // bh)
+    
+    if np is not None:
+        image = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, channels)
+        image = image[:rows * bh, :cols * bw].astype(np.uint32)
+        if channels == 3:
+            luma = (image[..., 0] * 299 + image[..., 1] * 587 + image[..., 2] * 114) // 1000
+        else:
+            luma = image[..., 0]
+        cells = luma.reshape(rows, bh, cols, bw).mean(axis=(1, 3)).astype(np.uint8)
+        return [row.tobytes().translate(LUMA_TABLE).decode("ascii") for row in cells]
+    
+    if channels == 3:
+        luma = bytes((pixels[i] * 299 + pixels[i + 1] * 587 + pixels[i + 2] * 114) // 1000
+                     for i in range(0, len(pixels), 3))
+    else:
+        luma = pixels
+    area = bw * bh
+    lines = []
+    for r in range(rows):
+        sums = [0] * cols
+        for y in range(r * bh, (r + 1) * bh):
+            line = luma[y * width:y * width + cols * bw]
+            for c in range(cols):
+                sums[c] += sum(line[c * bw:(c + 1) * bw])
+        lines.append(bytes(total // area for total in sums).translate(LUMA_TABLE).decode("ascii"))
+    return lines
+
+
+class FramePrefetcher:
+    """Runs a frame iterator on a background thread behind a bounded queue.
+    
+    Decoding and conversion happen ahead of playback, up to `depth`
+    frames, so a slow frame doesn't stall the display. Errors raised by
+    the producer are re-raised in the consumer.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, frames, depth=8):
+        import queue
+        import threading
+        
+        self.queue = queue.Queue(maxsize=depth)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._produce, args=(frames,), daemon=True)
+        self.thread.start()
+    
+    def _produce(self, frames):
+        import queue
+        
+        item = self._DONE
+        try:
+            for frame in frames:
+                while not self.stopped.is_set():
+                    try:
+                        self.queue.put(frame, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if self.stopped.is_set():
+                    return
+        except Exception as e:
+            item = e
+        self.queue.put(item)
+    
+    def __iter__(self):
+        while True:
+            item = self.queue.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    
+    def close(self):
+        self.stopped.set()
+
+
+def play_clip(path=None, fps=None, loops=1):
+    """Play a GIF or raw PPM sequence as an ASCII animation"""
+    import itertools
+    import shutil
+    
+    if path is None:
+        path = input("\nPath to a .gif, .ppm file or folder of .ppm frames: ").strip()
+    if not os.path.exists(path):
+        print(f"❌ {path} not found")
+        return
+    
+    size = shutil.get_terminal_size()
+    max_cols, max_rows = max(size.columns - 1, 20), max(size.lines - 3, 8)
+    is_gif = path.lower().endswith(".gif")
+    
+    def converted():
+        for _ in range(loops):
+            frames = iter_gif_frames(path) if is_gif else iter_ppm_frames(path)
+            for width, height, channels, pixels, delay in frames:
+                # Characters are about twice as tall as they are wide
+                cols = min(max_cols, width)
+                rows = min(max_rows, max(1, height * cols // width // 2))
+                cols = max(1, min(cols, width * rows * 2 // height))
+                yield frame_to_ascii(width, height, channels, pixels, cols, rows), delay
+    
+    prefetch = FramePrefetcher(converted())
+    frames = iter(prefetch)
+    try:
+        first = next(frames, None)
+        if first is None:
+            print("❌ No frames found")
+            return
+        # A fixed fps overrides the clip's own frame delays
+        engine = FrameEngine(fps=fps or 10)
+        screen = Screen(max_cols, max_rows)
+        
+        def render(item):
+            lines, _ = item
+            screen.clear()
+            for y, line in enumerate(lines):
+                screen.text(0, y, line)
+            return screen.frame()
+        
+        sys.stdout.write(CLEAR + screen.open())
+        try:
+            engine.play(itertools.chain([first], frames), render=render,
+                        duration=None if fps else (lambda item: item[1]))
+        except KeyboardInterrupt:
+            pass
+        print(screen.close(), end='')
+        show_stats(engine.stats)
+    except ValueError as e:
+        print(f"❌ Could not decode clip: {e}")
+    finally:
+        prefetch.close()
 
 
 def run():
@@ -88,6 +1060,10 @@ def run():
         ("Wave", animate_wave),
         ("Typing Text", animate_typing_text),
         ("Progress Bar", animate_progress_bar),
+        ("Full-Screen Bounce (60 fps)", animate_fullscreen_bounce),
+        ("Game of Life", animate_life),
+        ("Life Benchmark", benchmark_life),
+        ("Play GIF / PPM Clip", play_clip),
     ]
     
     while True:
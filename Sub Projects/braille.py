@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Braille
+Bit layout of the 2x4 braille dot cell used for high-resolution text graphics
+"""
+
+
+# Bit for the dot at (x % 2, y % 4) inside a braille cell
+BRAILLE_DOTS = (
+    (0x01, 0x08),
+    (0x02, 0x10),
+    (0x04, 0x20),
+    (0x40, 0x80),
+)
+
+# Maps a cell's bitmask (as a latin-1 character) to its braille character
+BRAILLE_TABLE = {i: 0x2800 + i for i in range(256)}
@@ -4,8 +4,18 @@ Coin Flip Simulator
 Flip a coin and track your results
 """
 
+import os
 import random
+import re
 import time
+from collections import Counter
+
+from monte_carlo import simulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; experiments fall back to random.Random
+    np = None
 
 
 def flip_coin():
@@ -22,6 +32,266 @@ def animate_flip():
     print("\r" + " " * 20, end='\r')  # Clear the line
 
 
+class FlipStats:
+    """Heads counts and longest runs over many trials of N flips"""
+    
+    def __init__(self, flips):
+        self.flips = flips
+        self.trials = 0
+        self.heads = Counter()
+        self.longest = Counter()
+    
+    def merge(self, other):
+        self.trials += other.trials
+        self.heads.update(other.heads)
+        self.longest.update(other.longest)
+        return self
+    
+    def mean_heads(self):
+        return sum(h * n for h, n in self.heads.items()) / self.trials
+
+
+class CoinExperiment:
+    """Picklable job for the Monte Carlo runner: trials of `flips` flips each"""
+    
+    def __init__(self, flips=100):
+        self.flips = flips
+    
+    def __call__(self, trials, rng):
+        stats = FlipStats(self.flips)
+        stats.trials = trials
+        if np is not None:
+            rows = max(1, (1 << 22) // self.flips)
+            for start in range(0, trials, rows):
+                flips = rng.integers(0, 2, size=(min(rows, trials - start), self.flips), dtype=np.int8)
+                stats.heads.update(dict(enumerate(np.bincount(flips.sum(axis=1)).tolist())))
+                # Walk the columns once, tracking every row's current run
+                run = np.ones(len(flips), dtype=np.int32)
+                best = run.copy()
+                for col in range(1, self.flips):
+                    same = flips[:, col] == flips[:, col - 1]
+                    run = np.where(same, run + 1, 1)
+                    np.maximum(best, run, out=best)
+                stats.longest.update(dict(enumerate(np.bincount(best).tolist())))
+            stats.heads = +stats.heads
+            stats.longest = +stats.longest
+        else:
+            for _ in range(trials):
+                bits = format(rng.getrandbits(self.flips), f"0{self.flips}b")
+                stats.heads[bits.count("1")] += 1
+                stats.longest[max(map(len, re.findall("0+|1+", bits)))] += 1
+        return stats
+
+
+# Flips analysed per block: 4M flips is 512 KiB of random bytes
+FLIP_BLOCK = 1 << 22
+# Set bits in each byte value, for counting heads without unpacking
+BYTE_HEADS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8) if np is not None else None
+
+
+class FlipRuns:
+    """Head count and streak lengths over one contiguous stretch of flips.
+    
+    The runs at either end may continue into a neighbouring stretch, so
+    they are kept apart (`first`, `last` as (side, length), side 1 for
+    heads) and only settled when stretches are merged in order. That
+    lets blocks, and whole chunks from other processes, be combined
+    without losing a streak that crosses a boundary.
+    """
+    
+    def __init__(self):
+        self.flips = 0
+        self.heads = 0
+        self.first = None
+        self.last = None
+        self.single = False  # True when the whole stretch is one run
+        self.runs = (Counter(), Counter())  # tails, heads: run length -> count
+    
+    @classmethod
+    def from_block(cls, block, count):
+        """Analyse `count` flips packed little-endian into bytes (bit i = flip i)"""
+        stretch = cls()
+        stretch.flips = count
+        if np is not None:
+            packed = np.frombuffer(block, dtype=np.uint8)
+            whole, extra = divmod(count, 8)
+            stretch.heads = int(BYTE_HEADS[packed[:whole]].sum(dtype=np.int64))
+            if extra:
+                stretch.heads += _popcount(int(packed[whole]) & ((1 << extra) - 1))
+            bits = np.unpackbits(packed, bitorder="little")[:count].view(bool)
+            # Run-length encode: every flip that differs from the one before starts a run
+            edges = np.flatnonzero(bits[1:] ^ bits[:-1]) + 1
+            side = int(bits[0])
+            if not len(edges):
+                stretch.first = stretch.last = (side, count)
+                stretch.single = True
+                return stretch
+            stretch.first = (side, int(edges[0]))
+            stretch.last = (int(bits[-1]), count - int(edges[-1]))
+            # Runs alternate sides, so the inner runs split by position
+            inner = np.diff(edges)
+            for offset, run_side in ((0, 1 - side), (1, side)):
+                counts = np.bincount(inner[offset::2])
+                stretch.runs[run_side].update({n: int(c) for n, c in enumerate(counts) if c})
+            return stretch
+        
+        full = (1 << count) - 1
+        value = int.from_bytes(block, "little") & full
+        stretch.heads = _popcount(value)
+        for side, bits in ((1, value), (0, ~value & full)):
+            # After k AND-shifts, bit i of `longer` is set while flips i..i+k
+            # all match `side`. A run of length L keeps L - k such bits, so
+            # each step drops the popcount by one per run longer than k
+            at_least = []
+            longer = bits
+            total = _popcount(longer)
+            while longer:
+                longer &= longer >> 1
+                remaining = _popcount(longer)
+                at_least.append(total - remaining)
+                total = remaining
+            at_least.append(0)
+            for k in range(len(at_least) - 1):
+                if at_least[k] != at_least[k + 1]:
+                    stretch.runs[side][k + 1] = at_least[k] - at_least[k + 1]
+        
+        # Trailing run (the first flips) and leading run (the last flips)
+        low = value & 1
+        if low:
+            low_len = (value ^ (value + 1)).bit_length() - 1
+        else:
+            low_len = (value & -value).bit_length() - 1 if value else count
+        high = value >> (count - 1) & 1
+        high_len = count - ((~value & full).bit_length() if high else value.bit_length())
+        stretch.first, stretch.last = (low, low_len), (high, high_len)
+        stretch.single = low_len == count
+        
+        # The end runs are still open, so take them back out of the settled counts
+        ends = [stretch.first] if stretch.single else [stretch.first, stretch.last]
+        for side, length in ends:
+            stretch.runs[side][length] -= 1
+        for counts in stretch.runs:
+            counts += Counter()  # In-place add drops the entries that fell to zero
+        return stretch
+    
+    def merge(self, other):
+        """Append the stretch of flips that directly follows this one"""
+        if not other.flips:
+            return self
+        if not self.flips:
+            self.__dict__.update(other.__dict__)
+            self.runs = (Counter(other.runs[0]), Counter(other.runs[1]))
+            return self
+        
+        for side in (0, 1):
+            self.runs[side].update(other.runs[side])
+        side, length = self.last
+        if other.first[0] == side:
+            joined = (side, length + other.first[1])
+            if self.single and other.single:
+                self.first = self.last = joined
+            elif self.single:
+                self.first, self.last, self.single = joined, other.last, False
+            elif other.single:
+                self.last = joined
+            else:
+                self.runs[side][joined[1]] += 1
+                self.last = other.last
+        else:
+            if not self.single:
+                self.runs[side][length] += 1
+            if not other.single:
+                self.runs[other.first[0]][other.first[1]] += 1
+            self.last, self.single = other.last, False
+        self.flips += other.flips
+        self.heads += other.heads
+        return self
+    
+    def streaks(self):
+        """Settled run counts for (tails, heads), including both end runs"""
+        runs = (Counter(self.runs[0]), Counter(self.runs[1]))
+        if self.flips:
+            runs[self.first[0]][self.first[1]] += 1
+            if not self.single:
+                runs[self.last[0]][self.last[1]] += 1
+        return runs
+    
+    def longest(self):
+        """Longest (tails, heads) streaks"""
+        return tuple(max(counts, default=0) for counts in self.streaks())
+
+
+def _popcount(value):
+    return value.bit_count() if hasattr(value, "bit_count") else bin(value).count("1")
+
+
+def _random_bytes(rng, size):
+    if rng is None:
+        return os.urandom(size)
+    if hasattr(rng, "bytes"):
+        return rng.bytes(size)
+    return rng.getrandbits(size * 8).to_bytes(size, "little")
+
+
+def flip_many(count, rng=None):
+    """Flip `count` coins as packed bits -> FlipRuns.
+    
+    `rng` is a NumPy Generator, a random.Random or None for os.urandom.
+    Memory use stays at a few blocks however many flips are requested.
+    """
+    total = FlipRuns()
+    done = 0
+    while done < count:
+        n = min(FLIP_BLOCK, count - done)
+        total.merge(FlipRuns.from_block(_random_bytes(rng, (n + 7) // 8), n))
+        done += n
+    return total
+
+
+class BulkFlipExperiment:
+    """Picklable job for the Monte Carlo runner: one long sequence of flips"""
+    
+    def __call__(self, flips, rng):
+        return flip_many(flips, rng)
+
+
+def simulate_many_flips(count, seed=None, workers=None):
+    """Flip `count` coins across processes -> (FlipRuns, seed, seconds).
+    
+    Chunks are merged in order, so streaks that cross chunk boundaries
+    are still counted exactly and a seed reproduces the same result.
+    """
+    return simulate(BulkFlipExperiment(), count, seed, workers, chunk_size=FLIP_BLOCK * 16)
+
+
+def simulate_flips(flips=100, trials=1_000_000, seed=None, workers=None):
+    """Run coin experiments across processes -> (FlipStats, seed, seconds)"""
+    return simulate(CoinExperiment(flips), trials, seed, workers)
+
+
+def show_flip_experiment():
+    """Ask for an experiment, run it in parallel and summarize it"""
+    try:
+        flips = int(input("\nFlips per trial (Enter for 100): ").strip() or 100)
+        trials = int(input("Number of trials (Enter for 1,000,000): ").strip() or 1_000_000)
+        seed = input("Seed for a repeatable run (optional): ").strip()
+        if flips < 1 or trials < 1:
+            raise ValueError
+    except ValueError:
+        print("❌ Invalid input! Please enter positive numbers.")
+        return
+    
+    stats, seed, seconds = simulate_flips(flips, trials, int(seed) if seed else None)
+    print(f"\n✅ {trials:,} trials of {flips} flips (seed {seed}) in {seconds:.2f}s")
+    print(f"   Average heads: {stats.mean_heads():.3f}")
+    if flips % 2 == 0:
+        print(f"   Exactly half heads: {100 * stats.heads[flips // 2] / trials:.2f}%")
+    print("   Longest streak in a trial:")
+    common = sorted(stats.longest.items(), key=lambda item: -item[1])[:8]
+    for length, count in sorted(common):
+        print(f"     {length:3} in a row: {100 * count / trials:6.2f}%")
+
+
 def run():
     """Main function for coin flip"""
     heads_count = 0
@@ -45,6 +315,7 @@ def run():
         print("  1. Flip the coin")
         print("  2. Flip multiple times")
         print("  3. Reset statistics")
+        print("  4. Run an experiment (many trials)")
         print("  0. Return to Main Menu")
         
         choice = input("\nYour choice: ").strip()
@@ -69,30 +340,27 @@ def run():
         
         elif choice == "2":
             try:
-                num_flips = int(input("\nHow many times to flip? (1-1000): ").strip())
-                if 1 <= num_flips <= 1000:
-                    print(f"\n🪙 Flipping {num_flips} times...")
-                    time.sleep(0.5)
-                    
-                    temp_heads = 0
-                    temp_tails = 0
+                num_flips = int(input("\nHow many times to flip? (1-10,000,000,000): ").strip())
+                if 1 <= num_flips <= 10_000_000_000:
+                    print(f"\n🪙 Flipping {num_flips:,} times...")
                     
-                    for _ in range(num_flips):
-                        result = flip_coin()
-                        if result == "Heads":
-                            temp_heads += 1
-                        else:
-                            temp_tails += 1
+                    result, _, seconds = simulate_many_flips(num_flips)
+                    temp_heads = result.heads
+                    temp_tails = num_flips - temp_heads
+                    longest_tails, longest_heads = result.longest()
                     
                     heads_count += temp_heads
                     tails_count += temp_tails
                     total_flips += num_flips
                     
                     print(f"\n✅ Results:")
-                    print(f"   Heads: {temp_heads}")
-                    print(f"   Tails: {temp_tails}")
+                    print(f"   Heads: {temp_heads:,}")
+                    print(f"   Tails: {temp_tails:,}")
+                    print(f"   Longest streaks: {longest_heads} heads, {longest_tails} tails")
+                    if num_flips >= 1_000_000:
+                        print(f"   ⚡ {num_flips / seconds / 1e6:,.0f}M flips/s")
                 else:
-                    print("❌ Please enter a number between 1 and 1000.")
+                    print("❌ Please enter a number between 1 and 10,000,000,000.")
             except ValueError:
                 print("❌ Invalid input! Please enter a number.")
             
@@ -109,6 +377,10 @@ def run():
                 print("❌ Reset cancelled.")
             time.sleep(1)
         
+        elif choice == "4":
+            show_flip_experiment()
+            input("\nPress Enter to continue...")
+        
         else:
             print("❌ Invalid choice!")
             time.sleep(1)
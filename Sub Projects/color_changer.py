@@ -4,7 +4,20 @@ Color Changer
 Display text in different colors using ANSI escape codes
 """
 
+import os
+import struct
 import time
+import zlib
+from collections import namedtuple
+from functools import lru_cache
+
+from netpbm import read_ppm
+from text_width import pad
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the image paths fall back to pure Python
+    np = None
 
 
 class Colors:
@@ -46,37 +59,494 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# fg/bg are None, a palette index (0-255) or an (r, g, b) tuple
+Style = namedtuple("Style", "fg bg bold underline", defaults=(None, None, False, False))
+PLAIN = Style()
+
+# xterm's default RGB values for the 16 basic colors
+ANSI16_RGB = [
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+]
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+PALETTE_256 = (ANSI16_RGB
+               + [(r, g, b) for r in CUBE_LEVELS for g in CUBE_LEVELS for b in CUBE_LEVELS]
+               + [(8 + 10 * i,) * 3 for i in range(24)])
+
+
+def detect_color_mode():
+    """Best color mode the terminal claims to support: truecolor, 256 or 16"""
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return "truecolor"
+    if "256color" in os.environ.get("TERM", ""):
+        return "256"
+    return "16"
+
+
+def _nearest(rgb, candidates):
+    r, g, b = rgb
+    return min(range(len(candidates)),
+               key=lambda i: (candidates[i][0] - r) ** 2 + (candidates[i][1] - g) ** 2
+                             + (candidates[i][2] - b) ** 2)
+
+
+def _build_lut(mode):
+    """Nearest palette index for every color at 5 bits per channel"""
+    centers = [(v << 3) + 4 for v in range(32)]
+    if mode == "16":
+        return bytes(_nearest((r, g, b), ANSI16_RGB)
+                     for r in centers for g in centers for b in centers)
+    
+    # 256 colors: the nearest cube level per channel, or the nearest gray,
+    # whichever is closer. No search over the whole palette is needed.
+    level = [min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - v)) for v in centers]
+    lut = bytearray(32768)
+    i = 0
+    for r in centers:
+        for g in centers:
+            for b in centers:
+                cube = 16 + 36 * level[r >> 3] + 6 * level[g >> 3] + level[b >> 3]
+                gray = 232 + min(max((r + g + b) // 3 - 3, 0) // 10, 23)
+                lut[i] = min((cube, gray), key=lambda c: (PALETTE_256[c][0] - r) ** 2
+                             + (PALETTE_256[c][1] - g) ** 2 + (PALETTE_256[c][2] - b) ** 2)
+                i += 1
+    return bytes(lut)
+
+
+_LUTS = {}
+
+
+def quantize(rgb, mode):
+    """Palette index for an (r, g, b) color in "256" or "16" color mode"""
+    lut = _LUTS.get(mode)
+    if lut is None:
+        lut = _LUTS[mode] = _build_lut(mode)
+    r, g, b = rgb
+    return lut[(r >> 3) << 10 | (g >> 3) << 5 | b >> 3]
+
+
+@lru_cache(maxsize=4096)
+def resolve_style(style, mode):
+    """Reduce a style's colors to what `mode` can show"""
+    def convert(color):
+        if color is None or mode == "truecolor":
+            return color
+        if isinstance(color, tuple):
+            return quantize(color, mode)
+        if mode == "16" and color >= 16:
+            return quantize(PALETTE_256[color], mode)
+        return color
+    
+    return style._replace(fg=convert(style.fg), bg=convert(style.bg))
+
+
+def _color_params(color, background):
+    if isinstance(color, tuple):
+        return f"{48 if background else 38};2;{color[0]};{color[1]};{color[2]}"
+    if color < 16:
+        base = (40 if background else 30) if color < 8 else (100 if background else 90)
+        return str(base + color % 8)
+    return f"{48 if background else 38};5;{color}"
+
+
+@lru_cache(maxsize=4096)
+def style_code(style, mode="truecolor", previous=PLAIN):
+    """The shortest escape sequence that switches from `previous` to `style`"""
+    style, previous = resolve_style(style, mode), resolve_style(previous, mode)
+    if style == PLAIN:
+        return Colors.RESET
+    
+    params = []
+    if ((previous.bold and not style.bold) or (previous.underline and not style.underline)
+            or (previous.fg is not None and style.fg is None)
+            or (previous.bg is not None and style.bg is None)):
+        # Something has to be switched off; start over from a reset
+        params.append("0")
+        previous = PLAIN
+    if style.bold and not previous.bold:
+        params.append("1")
+    if style.underline and not previous.underline:
+        params.append("4")
+    if style.fg != previous.fg:
+        params.append(_color_params(style.fg, False))
+    if style.bg != previous.bg:
+        params.append(_color_params(style.bg, True))
+    return f"\033[{';'.join(params)}m" if params else ""
+
+
+def render_styled(segments, mode=None):
+    """Join (text, Style) segments with as few escape sequences as possible.
+    
+    Styles are first reduced to the colors the mode can show, so runs
+    that quantize to the same color merge. Whitespace that would look the
+    same in any foreground color keeps whatever style is already active.
+    """
+    mode = mode or detect_color_mode()
+    out = []
+    current = PLAIN
+    for text, style in segments:
+        if not text:
+            continue
+        style = resolve_style(style, mode)
+        if style != current:
+            invisible = (text.isspace() and style.bg == current.bg
+                         and not (style.underline or current.underline))
+            if not invisible:
+                out.append(style_code(style, mode, current))
+                current = style
+        out.append(text)
+    if current != PLAIN:
+        out.append(Colors.RESET)
+    return "".join(out)
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _unfilter(raw, height, stride, bpp):
+    """Undo PNG's per-scanline filters"""
+    if np is not None:
+        return _unfilter_wavefront(raw, height, stride, bpp)
+    
+    out = bytearray(height * stride)
+    prev = bytearray(stride)
+    pos = 0
+    for y in range(height):
+        kind = raw[pos]
+        line = bytearray(raw[pos + 1:pos + 1 + stride])
+        pos += stride + 1
+        
+        if kind == 1:  # Sub
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif kind == 2:  # Up
+            line = bytearray((a + b) & 0xFF for a, b in zip(line, prev))
+        elif kind == 3:  # Average
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif kind == 4:  # Paeth
+            for i in range(stride):
+                if i >= bpp:
+                    line[i] = (line[i] + _paeth(line[i - bpp], prev[i], prev[i - bpp])) & 0xFF
+                else:
+                    line[i] = (line[i] + prev[i]) & 0xFF
+        elif kind != 0:
+            raise ValueError(f"Unknown PNG filter type {kind}")
+        
+        out[y * stride:(y + 1) * stride] = line
+        prev = line
+    return out
+
+
+def _unfilter_wavefront(raw, height, stride, bpp):
+    """NumPy version of _unfilter, one anti-diagonal of pixels at a time.
+    
+    A pixel only depends on its left, upper and upper-left neighbours,
+    so every pixel on the diagonal y + x = d can be reconstructed at
+    once from diagonals d - 1 and d - 2, whatever filter each row uses.
+    Rows are skewed (row y shifted right by y) so diagonals become plain
+    column slices: about width + height vector steps instead of a
+    Python loop over every byte of the Average and Paeth rows.
+    """
+    width = stride // bpp  # pixels per row (bytes when samples are under 8 bits)
+    lines = np.frombuffer(raw, dtype=np.uint8, count=height * (stride + 1)).reshape(height, stride + 1)
+    kinds = lines[:, 0]
+    if kinds.max() > 4:
+        raise ValueError(f"Unknown PNG filter type {kinds.max()}")
+    
+    # Skewed arrays with a zero border: row y + 1 and column y + x + 2 hold
+    # pixel (x, y), so the left/up/up-left neighbours outside the image are 0
+    rows = np.arange(height)[:, None]
+    columns = rows + np.arange(width) + 2
+    filtered = np.zeros((height + 1, height + width + 2, bpp), dtype=np.int16)
+    filtered[rows + 1, columns] = lines[:, 1:].reshape(height, width, bpp)
+    out = np.zeros_like(filtered)
+    
+    masks = [(kinds == kind).astype(np.int16)[:, None] for kind in range(5)]
+    for d in range(height + width - 1):
+        top, bottom = max(0, d - width + 1), min(height - 1, d)
+        col = d + 2
+        a = out[top + 1:bottom + 2, col - 1]  # left
+        b = out[top:bottom + 1, col - 1]      # up
+        c = out[top:bottom + 1, col - 2]      # up-left
+        
+        p = a + b - c
+        pa, pb, pc = np.abs(p - a), np.abs(p - b), np.abs(p - c)
+        paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        predicted = (masks[1][top:bottom + 1] * a + masks[2][top:bottom + 1] * b
+                     + masks[3][top:bottom + 1] * ((a + b) >> 1) + masks[4][top:bottom + 1] * paeth)
+        out[top + 1:bottom + 2, col] = (filtered[top + 1:bottom + 2, col] + predicted) & 0xFF
+    
+    return bytearray(out[rows + 1, columns].astype(np.uint8).tobytes())
+
+
+# Bit depths allowed for each PNG color type
+PNG_DEPTHS = {0: (1, 2, 4, 8, 16), 2: (8, 16), 3: (1, 2, 4, 8), 4: (8, 16), 6: (8, 16)}
+
+
+def read_png(path):
+    """Decode a non-interlaced PNG -> (width, height, channels, pixels).
+    
+    Handles gray, RGB and palette images at 1-16 bits, with alpha
+    composited onto black, so channels is always 1 or 3.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("Not a PNG file")
+    
+    pos = 8
+    idat = []
+    header = palette = None
+    while pos < len(data):
+        if pos + 8 > len(data):
+            raise ValueError("Truncated PNG chunk")
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        chunk = data[pos + 8:pos + 8 + length]
+        if len(chunk) < length:
+            raise ValueError("Truncated PNG chunk")
+        pos += 12 + length
+        if kind == b"IHDR":
+            if length != 13:
+                raise ValueError("Bad PNG header")
+            header = struct.unpack(">IIBBBBB", chunk)
+        elif kind == b"PLTE":
+            palette = chunk
+        elif kind == b"IDAT":
+            idat.append(chunk)
+        elif kind == b"IEND":
+            break
+    
+    if header is None:
+        raise ValueError("PNG without an IHDR chunk")
+    width, height, depth, color_type, _, _, interlace = header
+    if interlace:
+        raise ValueError("Interlaced PNGs are not supported")
+    if not (width and height):
+        raise ValueError("Empty PNG image")
+    if depth not in PNG_DEPTHS.get(color_type, ()):
+        raise ValueError(f"Invalid PNG color type {color_type} at depth {depth}")
+    samples = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color_type]
+    bits = depth * samples
+    bpp = max(bits // 8, 1)
+    stride = (width * bits + 7) // 8
+    try:
+        filtered = zlib.decompress(b"".join(idat))
+    except zlib.error as e:
+        raise ValueError(f"Corrupt PNG data ({e})")
+    if len(filtered) < height * (stride + 1):
+        raise ValueError("Truncated PNG image data")
+    raw = _unfilter(filtered, height, stride, bpp)
+    
+    if depth == 16:
+        raw = raw[0::2]
+    elif depth < 8:
+        # Unpack 1/2/4-bit samples, one row at a time (rows are byte aligned)
+        per_byte = 8 // depth
+        mask = (1 << depth) - 1
+        scale = 1 if color_type == 3 else 255 // mask
+        unpacked = bytearray()
+        for y in range(height):
+            row = raw[y * stride:(y + 1) * stride]
+            values = [(byte >> (8 - depth * (k + 1))) & mask
+                      for byte in row for k in range(per_byte)]
+            unpacked += bytes(v * scale for v in values[:width])
+        raw = unpacked
+    
+    if color_type == 3:
+        if palette is None:
+            raise ValueError("Palette PNG without a PLTE chunk")
+        colors = [palette[i * 3:i * 3 + 3] for i in range(len(palette) // 3)]
+        colors += [b"\0\0\0"] * (256 - len(colors))
+        return width, height, 3, b"".join(map(colors.__getitem__, raw))
+    if color_type in (4, 6):
+        channels = samples - 1
+        if np is not None:
+            pixels = np.frombuffer(bytes(raw), dtype=np.uint8).reshape(-1, samples).astype(np.uint16)
+            blended = pixels[:, :channels] * pixels[:, channels:] // 255
+            return width, height, channels, blended.astype(np.uint8).tobytes()
+        blended = bytearray()
+        for i in range(0, len(raw), samples):
+            alpha = raw[i + channels]
+            blended += bytes(v * alpha // 255 for v in raw[i:i + channels])
+        return width, height, channels, bytes(blended)
+    return width, height, samples, bytes(raw)
+
+
+def read_image(path):
+    """Read a PNG or raw PPM/PGM file"""
+    with open(path, "rb") as f:
+        magic = f.read(8)
+    if magic.startswith(b"\x89PNG"):
+        return read_png(path)
+    if magic[:2] in (b"P6", b"P5"):
+        return read_ppm(path)
+    raise ValueError("Unsupported image format (use PNG or raw PPM/PGM)")
+
+
+def _resample(width, height, channels, pixels, cols, rows):
+    """Resize to cols x rows RGB pixels, box-averaging when shrinking.
+    
+    Returns a flat list (or NumPy array) of (r, g, b) rows.
+    """
+    if np is not None:
+        image = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, channels)
+        if channels == 1:
+            image = np.repeat(image, 3, axis=2)
+        bw, bh = width // cols, height // rows
+        if bw >= 1 and bh >= 1:
+            # Crop to whole blocks, then average each block in one go
+            top, left = (height - bh * rows) // 2, (width - bw * cols) // 2
+            block = image[top:top + bh * rows, left:left + bw * cols].astype(np.uint32)
+            return block.reshape(rows, bh, cols, bw, 3).mean(axis=(1, 3)).astype(np.uint8)
+        ys = np.arange(rows) * height // rows
+        xs = np.arange(cols) * width // cols
+        return image[np.ix_(ys, xs)]
+    
+    bw, bh = width // cols, height // rows
+    result = []
+    if bw >= 1 and bh >= 1:
+        top, left = (height - bh * rows) // 2, (width - bw * cols) // 2
+        area = bw * bh
+        for r in range(rows):
+            row = []
+            for c in range(cols):
+                totals = [0, 0, 0]
+                for y in range(top + r * bh, top + (r + 1) * bh):
+                    start = (y * width + left + c * bw) * channels
+                    chunk = pixels[start:start + bw * channels]
+                    for k in range(3):
+                        totals[k] += sum(chunk[k % channels::channels])
+                row.append(tuple(t // area for t in totals))
+            result.append(row)
+        return result
+    
+    for r in range(rows):
+        y = r * height // rows
+        row = []
+        for c in range(cols):
+            start = (y * width + c * width // cols) * channels
+            pixel = pixels[start:start + channels]
+            row.append(tuple(pixel) * 3 if channels == 1 else tuple(pixel))
+        result.append(row)
+    return result
+
+
+def _color_keys(image, mode):
+    """One integer per pixel: packed RGB in truecolor, palette index otherwise"""
+    if np is not None:
+        rgb = image.astype(np.uint32)
+        if mode == "truecolor":
+            return (rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]).tolist()
+        if mode not in _LUTS:
+            quantize((0, 0, 0), mode)
+        lut = np.frombuffer(_LUTS[mode], dtype=np.uint8)
+        return lut[(rgb[..., 0] >> 3) << 10 | (rgb[..., 1] >> 3) << 5 | rgb[..., 2] >> 3].tolist()
+    
+    if mode == "truecolor":
+        return [[r << 16 | g << 8 | b for r, g, b in row] for row in image]
+    return [[quantize(rgb, mode) for rgb in row] for row in image]
+
+
+def image_to_halfblocks(width, height, channels, pixels, cols, mode=None):
+    """Render an image as lines of '▀' cells, two pixels per cell.
+    
+    The top pixel is the foreground color and the bottom one the
+    background. Escape sequences are only emitted for the half of the
+    cell whose color actually changed, and cells whose two pixels match
+    become a plain space that only needs the background.
+    """
+    mode = mode or detect_color_mode()
+    cols = max(1, min(cols, width))
+    rows = max(1, round(height * cols / width / 2))
+    keys = _color_keys(_resample(width, height, channels, pixels, cols, rows * 2), mode)
+    
+    if mode == "truecolor":
+        def params(key, background):
+            return _color_params((key >> 16, key >> 8 & 0xFF, key & 0xFF), background)
+    else:
+        params = _color_params
+    fg_codes, bg_codes = {}, {}
+    
+    lines = []
+    for r in range(rows):
+        out = []
+        fg = bg = None
+        for top, bottom in zip(keys[2 * r], keys[2 * r + 1]):
+            changes = []
+            if bottom != bg:
+                code = bg_codes.get(bottom)
+                if code is None:
+                    code = bg_codes[bottom] = params(bottom, True)
+                changes.append(code)
+                bg = bottom
+            if top == bottom:
+                char = " "
+            else:
+                char = "▀"
+                if top != fg:
+                    code = fg_codes.get(top)
+                    if code is None:
+                        code = fg_codes[top] = params(top, False)
+                    changes.append(code)
+                    fg = top
+            if changes:
+                out.append(f"\033[{';'.join(changes)}m")
+            out.append(char)
+        out.append(Colors.RESET)
+        lines.append("".join(out))
+    return lines
+
+
+def show_image(path=None, cols=None, mode=None):
+    """Draw an image file in the terminal with half blocks"""
+    import shutil
+    
+    if path is None:
+        path = input("\nPath to a PNG or PPM image: ").strip()
+    try:
+        image = read_image(path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read image: {e}")
+        return
+    
+    cols = cols or shutil.get_terminal_size().columns - 1
+    started = time.perf_counter()
+    lines = image_to_halfblocks(*image, cols, mode)
+    elapsed = time.perf_counter() - started
+    text = "\n".join(lines)
+    print(text)
+    print(f"\n🖼️  {image[0]}x{image[1]} image, {cols} columns, "
+          f"{len(text.encode()):,} bytes, rendered in {elapsed * 1000:.1f} ms")
+
+
 def display_color_demo():
     """Display all available colors"""
     print("\n🎨 Color Palette:\n")
     
-    print("Regular Colors:")
     colors = [
-        ("Red", Colors.RED),
-        ("Green", Colors.GREEN),
-        ("Yellow", Colors.YELLOW),
-        ("Blue", Colors.BLUE),
-        ("Magenta", Colors.MAGENTA),
-        ("Cyan", Colors.CYAN),
-        ("White", Colors.WHITE),
+        ("Red", Colors.RED, "Bright Red", Colors.BRIGHT_RED),
+        ("Green", Colors.GREEN, "Bright Green", Colors.BRIGHT_GREEN),
+        ("Yellow", Colors.YELLOW, "Bright Yellow", Colors.BRIGHT_YELLOW),
+        ("Blue", Colors.BLUE, "Bright Blue", Colors.BRIGHT_BLUE),
+        ("Magenta", Colors.MAGENTA, "Bright Magenta", Colors.BRIGHT_MAGENTA),
+        ("Cyan", Colors.CYAN, "Bright Cyan", Colors.BRIGHT_CYAN),
+        ("White", Colors.WHITE, "Bright White", Colors.BRIGHT_WHITE),
     ]
     
-    for name, color in colors:
-        print(f"  {color}■■■ {name}{Colors.RESET}")
-    
-    print("\nBright Colors:")
-    bright_colors = [
-        ("Bright Red", Colors.BRIGHT_RED),
-        ("Bright Green", Colors.BRIGHT_GREEN),
-        ("Bright Yellow", Colors.BRIGHT_YELLOW),
-        ("Bright Blue", Colors.BRIGHT_BLUE),
-        ("Bright Magenta", Colors.BRIGHT_MAGENTA),
-        ("Bright Cyan", Colors.BRIGHT_CYAN),
-        ("Bright White", Colors.BRIGHT_WHITE),
-    ]
-    
-    for name, color in bright_colors:
-        print(f"  {color}■■■ {name}{Colors.RESET}")
+    # Escape codes take no room on screen, so pad by display width
+    print(f"  {pad('Regular Colors:', 20)}Bright Colors:")
+    for name, color, bright_name, bright in colors:
+        swatch = f"{color}■■■ {name}{Colors.RESET}"
+        print(f"  {pad(swatch, 20)}{bright}■■■ {bright_name}{Colors.RESET}")
     
     print("\nText Styles:")
     print(f"  {Colors.BOLD}Bold Text{Colors.RESET}")
@@ -84,24 +554,30 @@ def display_color_demo():
     print(f"  {Colors.RED}{Colors.BOLD}Bold Red Text{Colors.RESET}")
 
 
-def rainbow_text(text):
+RAINBOW = [1, 3, 2, 6, 4, 5]  # red, yellow, green, cyan, blue, magenta
+
+
+def rainbow_text(text, mode=None):
     """Display text in rainbow colors"""
-    rainbow = [
-        Colors.RED,
-        Colors.YELLOW,
-        Colors.GREEN,
-        Colors.CYAN,
-        Colors.BLUE,
-        Colors.MAGENTA,
-    ]
-    
-    result = ""
-    for i, char in enumerate(text):
-        color = rainbow[i % len(rainbow)]
-        result += f"{color}{char}"
-    result += Colors.RESET
-    
-    return result
+    return render_styled(((char, Style(fg=RAINBOW[i % len(RAINBOW)]))
+                          for i, char in enumerate(text)), mode)
+
+
+def gradient_text(text, start, end, mode=None):
+    """Color text with a smooth gradient between two (r, g, b) colors"""
+    steps = max(len(text) - 1, 1)
+    return render_styled(
+        ((char, Style(fg=tuple(a + (b - a) * i // steps for a, b in zip(start, end))))
+         for i, char in enumerate(text)), mode)
+
+
+def gradient_demo():
+    """Show the same gradient in each color mode"""
+    text = input("\nEnter text for the gradient: ").strip() or "Smooth gradients in any terminal"
+    print(f"\n  (this terminal reports: {detect_color_mode()})\n")
+    for mode in ("truecolor", "256", "16"):
+        line = gradient_text(text, (255, 60, 0), (40, 120, 255), mode)
+        print(f"  {mode:>9}: {line}   ({len(line.encode())} bytes)")
 
 
 def animate_rainbow():
@@ -175,6 +651,8 @@ def run():
         print("  2. Rainbow Text Demo")
         print("  3. Rainbow Animation")
         print("  4. Colorize Custom Text")
+        print("  5. Gradient Text")
+        print("  6. Show Image (PNG/PPM)")
         print("  0. Return to Main Menu")
         
         choice = input("\nYour choice: ").strip()
@@ -202,6 +680,14 @@ def run():
             custom_text_color()
             time.sleep(1)
         
+        elif choice == "5":
+            gradient_demo()
+            input("\nPress Enter to continue...")
+        
+        elif choice == "6":
+            show_image()
+            input("\nPress Enter to continue...")
+        
         else:
             print("❌ Invalid choice!")
             time.sleep(1)
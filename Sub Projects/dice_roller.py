@@ -4,8 +4,21 @@ Dice Roller
 Roll dice of various types and combinations
 """
 
+import operator
 import random
+import re
 import time
+from array import array
+from collections import Counter, defaultdict
+from functools import lru_cache
+from math import exp, lgamma, log, sqrt
+
+from monte_carlo import simulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the distribution engine falls back to pure Python
+    np = None
 
 
 def roll_dice(num_dice, num_sides):
@@ -14,6 +27,751 @@ def roll_dice(num_dice, num_sides):
     return rolls
 
 
+# Convolutions with more than this many multiply-adds switch to FFT
+FFT_THRESHOLD = 4_000_000
+# Exploding dice are followed until the remaining chance is this small
+EXPLODE_EPSILON = 1e-12
+# Keep-highest/lowest distributions needing more array cell updates than
+# this are refused (pure Python gets the smaller budget); simulate instead
+KEEP_WORK_LIMIT = 100_000_000
+KEEP_WORK_LIMIT_PURE = 5_000_000
+# Multiplied or divided results are refused if they would need a
+# probability list longer than this, or more pairs than this to combine
+SPAN_LIMIT = 10_000_000
+COMBINE_WORK_LIMIT = 5_000_000
+
+
+def convolve(a, b):
+    """Probability lists of two independent variables -> list for their sum"""
+    if np is not None:
+        if len(a) * len(b) > FFT_THRESHOLD:
+            size = len(a) + len(b) - 1
+            result = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)
+            # FFT round-off can leave tiny negative values in the tails
+            return np.clip(result, 0, None).tolist()
+        return np.convolve(a, b).tolist()
+    
+    result = [0.0] * (len(a) + len(b) - 1)
+    for i, p in enumerate(a):
+        if p:
+            for j, q in enumerate(b):
+                result[i + j] += p * q
+    return result
+
+
+class Distribution:
+    """Exact probability distribution of an integer-valued dice result.
+    
+    probs[i] is the chance of rolling offset + i. Adding two
+    distributions convolves them; adding a number shifts them.
+    """
+    
+    __slots__ = ("offset", "probs")
+    
+    def __init__(self, offset, probs):
+        # Trim impossible values from both ends
+        start = 0
+        while start < len(probs) - 1 and not probs[start]:
+            start += 1
+        end = len(probs)
+        while end > start + 1 and not probs[end - 1]:
+            end -= 1
+        self.offset = offset + start
+        self.probs = list(probs[start:end])
+    
+    @classmethod
+    def constant(cls, value):
+        return cls(value, [1.0])
+    
+    @classmethod
+    def die(cls, sides):
+        return cls(1, [1.0 / sides] * sides)
+    
+    @property
+    def min(self):
+        return self.offset
+    
+    @property
+    def max(self):
+        return self.offset + len(self.probs) - 1
+    
+    def items(self):
+        """(value, probability) pairs in increasing order"""
+        return [(self.offset + i, p) for i, p in enumerate(self.probs)]
+    
+    def prob(self, value):
+        i = value - self.offset
+        return self.probs[i] if 0 <= i < len(self.probs) else 0.0
+    
+    def at_least(self, value):
+        return sum(self.probs[max(value - self.offset, 0):])
+    
+    def at_most(self, value):
+        return sum(self.probs[:max(value - self.offset + 1, 0)])
+    
+    def mean(self):
+        return sum(v * p for v, p in self.items())
+    
+    def variance(self):
+        mean = self.mean()
+        return sum((v - mean) ** 2 * p for v, p in self.items())
+    
+    def std(self):
+        return sqrt(self.variance())
+    
+    def __add__(self, other):
+        if isinstance(other, int):
+            return Distribution(self.offset + other, self.probs)
+        return Distribution(self.offset + other.offset, convolve(self.probs, other.probs))
+    
+    __radd__ = __add__
+    
+    def __neg__(self):
+        return Distribution(-self.max, self.probs[::-1])
+    
+    def __sub__(self, other):
+        return self + (-other)
+    
+    def map(self, fn):
+        """Distribution of fn(result) for an integer function fn"""
+        probs = defaultdict(float)
+        for value, p in self.items():
+            probs[fn(value)] += p
+        return Distribution._from_dict(probs)
+    
+    def combine(self, other, fn):
+        """Distribution of fn(a, b) for independent results a and b"""
+        if len(self.probs) * len(other.probs) > COMBINE_WORK_LIMIT:
+            raise ValueError("Too many combinations to work out exactly; "
+                             "try a bulk roll simulation instead")
+        probs = defaultdict(float)
+        for a, p in self.items():
+            for b, q in other.items():
+                probs[fn(a, b)] += p * q
+        return Distribution._from_dict(probs)
+    
+    @classmethod
+    def _from_dict(cls, probs):
+        """Distribution from a {value: probability} dict, refusing huge spans"""
+        low, high = min(probs), max(probs)
+        if high - low >= SPAN_LIMIT:
+            raise ValueError(f"Results spread from {low} to {high}, too wide to "
+                             "work out exactly; try a bulk roll simulation instead")
+        return cls(low, [probs.get(v, 0.0) for v in range(low, high + 1)])
+    
+    def repeat(self, count):
+        """Sum of `count` independent copies, by repeated squaring"""
+        result = Distribution.constant(0)
+        power = self
+        while count:
+            if count & 1:
+                result = result + power
+            count >>= 1
+            if count:
+                power = power + power
+        return result
+
+
+def _add_uniform(probs, width):
+    """Probability list for probs' value plus an independent 1..width roll"""
+    # Each output is a window sum of `width` inputs, taken from running sums
+    if np is not None:
+        sums = np.concatenate(([0.0], np.cumsum(probs)))
+        ends = np.arange(1, len(probs) + width)
+        window = sums[np.minimum(ends, len(probs))] - sums[np.maximum(ends - width, 0)]
+        # Differences of running sums can dip just below zero in the tails
+        return np.maximum(window / width, 0.0)
+    
+    result = []
+    window = 0.0
+    for i in range(len(probs) + width - 1):
+        if i < len(probs):
+            window += probs[i]
+        if i >= width:
+            window -= probs[i - width]
+        result.append(max(window / width, 0.0))
+    return result
+
+
+def keep_distribution(count, sides, keep, highest=True):
+    """Distribution of the sum of the best (or worst) `keep` of `count` dice.
+    
+    Conditions on v, the value of the keep-th best die: some a < keep
+    dice roll above v, at least keep - a roll exactly v and the rest
+    roll below. The kept total is then keep * v plus the a dice above
+    v, each uniform over the sides - v faces there, whose distribution
+    is grown one die at a time with a window sum. The chance of each
+    (v, a) split is a binomial tail, summed in log space so thousands of
+    dice don't underflow. That is about (keep * sides)² / 4 steps, and
+    keep-lowest is the mirror image of keep-highest. Raises ValueError
+    past KEEP_WORK_LIMIT.
+    """
+    keep = max(0, min(keep, count))
+    if keep == 0:
+        return Distribution.constant(0)
+    if keep == count:
+        return Distribution.die(sides).repeat(count)
+    if not highest:
+        return -keep_distribution(count, sides, keep) + keep * (sides + 1)
+    
+    work = keep * keep * sides * sides // 4 + sides * keep * (count - keep + 1)
+    if work > (KEEP_WORK_LIMIT if np is not None else KEEP_WORK_LIMIT_PURE):
+        raise ValueError(f"Keeping {keep} of {count}d{sides} is too much to work out "
+                         "exactly; try a bulk roll simulation instead")
+    
+    log_fact = [lgamma(n + 1) for n in range(count + 1)]
+    if np is not None:
+        log_fact = np.array(log_fact)
+    log_sides = log(sides)
+    # Index 0 is the smallest possible total, keep (every kept die a 1)
+    totals = np.zeros(keep * (sides - 1) + 1) if np is not None else [0.0] * (keep * (sides - 1) + 1)
+    
+    for v in range(1, sides + 1):
+        width = sides - v
+        above = [1.0]  # sum of the dice above v, less one per die
+        for a in range(keep if width else 1):
+            # log P(at least keep - a of the other count - a dice show v,
+            # the rest less than v)
+            rest = count - a
+            if v == 1:
+                tail = -rest * log_sides
+            else:
+                below = log(v - 1) - log_sides
+                if np is not None:
+                    e = np.arange(keep - a, rest + 1)
+                    terms = (log_fact[rest] - log_fact[e] - log_fact[rest - e] - e * log_sides
+                             + (rest - e) * below)
+                    top = terms.max()
+                    tail = top + log(np.exp(terms - top).sum())
+                else:
+                    terms = [log_fact[rest] - log_fact[e] - log_fact[rest - e] - e * log_sides
+                             + (rest - e) * below for e in range(keep - a, rest + 1)]
+                    top = max(terms)
+                    tail = top + log(sum(exp(t - top) for t in terms))
+            
+            weight = exp(log_fact[count] - log_fact[a] - log_fact[count - a]
+                         + (a * (log(width) - log_sides) if a else 0.0) + tail)
+            start = keep * (v - 1) + a
+            if np is not None:
+                totals[start:start + len(above)] += weight * np.asarray(above)
+            else:
+                for i, p in enumerate(above, start):
+                    totals[i] += weight * p
+            above = _add_uniform(above, width)
+    
+    # Rounding in the log-space weights leaves the total a hair off 1
+    if np is not None:
+        return Distribution(keep, (totals / totals.sum()).tolist())
+    total = sum(totals)
+    return Distribution(keep, [p / total for p in totals])
+
+
+def exploding_die(sides):
+    """Distribution of one exploding die: a maximum roll rolls again and adds"""
+    if sides < 2:
+        raise ValueError("Exploding dice need at least 2 sides")
+    probs = []
+    chance = 1.0 / sides
+    while chance > EXPLODE_EPSILON:
+        probs.extend([chance] * (sides - 1))
+        # The maximum face continues into the next block instead
+        probs.append(0.0)
+        chance /= sides
+    return Distribution(1, probs)
+
+
+@lru_cache(maxsize=256)
+def dice_distribution(count, sides, keep=None, highest=True, explode=False):
+    """Distribution of NdS with optional keep-highest/lowest or exploding"""
+    if explode:
+        return exploding_die(sides).repeat(count)
+    if keep is not None and keep < count:
+        return keep_distribution(count, sides, keep, highest)
+    return Distribution.die(sides).repeat(count)
+
+
+TOKEN_RE = re.compile(r"\s*(?:(\d+)|(kh|kl|dh|dl|k)|(d%|d)|([-+*/()!]))")
+OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+}
+MAX_EXPLOSIONS = 100
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.lower().rstrip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Unexpected {text[pos:].strip()[:10]!r} in dice expression")
+        number, modifier, dice, symbol = match.groups()
+        tokens.append(int(number) if number is not None else modifier or dice or symbol)
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing a tuple AST.
+    
+    Nodes: ("num", n), ("dice", count, sides, keep, highest, explode),
+    ("neg", node) and ("op", symbol, left, right).
+    """
+    
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.pos = 0
+    
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+    
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(f"Expected {expected or 'more input'} in dice expression")
+        self.pos += 1
+        return token
+    
+    def number(self):
+        token = self.take()
+        if not isinstance(token, int):
+            raise ValueError(f"Expected a number, found {token!r}")
+        return token
+    
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty dice expression")
+        node = self.expression()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected {self.peek()!r} in dice expression")
+        return node
+    
+    def expression(self):
+        node = self.term()
+        while self.peek() in ("+", "-"):
+            node = ("op", self.take(), node, self.term())
+        return node
+    
+    def term(self):
+        node = self.factor()
+        while self.peek() in ("*", "/"):
+            symbol = self.take()
+            right = self.factor()
+            if symbol == "/" and (right[0] != "num" or right[1] == 0):
+                raise ValueError("Division needs a non-zero number on the right")
+            node = ("op", symbol, node, right)
+        return node
+    
+    def factor(self):
+        token = self.peek()
+        if token == "-":
+            self.take()
+            return ("neg", self.factor())
+        if token == "(":
+            self.take()
+            node = self.expression()
+            self.take(")")
+            return node
+        count = self.number() if isinstance(token, int) else 1
+        if self.peek() in ("d", "d%"):
+            return self.dice(count)
+        if not isinstance(token, int):
+            raise ValueError(f"Unexpected {token!r} in dice expression")
+        return ("num", count)
+    
+    def dice(self, count):
+        sides = 100 if self.take() == "d%" else self.number()
+        if not 1 <= sides <= 1000 or not 1 <= count <= 10000:
+            raise ValueError("Dice must have 1-1000 sides, 1-10000 at a time")
+        keep, highest, explode = None, True, False
+        if self.peek() == "!":
+            self.take()
+            if sides < 2:
+                raise ValueError("Exploding dice need at least 2 sides")
+            explode = True
+        elif self.peek() in ("kh", "kl", "k", "dh", "dl"):
+            modifier = self.take()
+            amount = self.number()
+            if amount > count:
+                raise ValueError(f"Can't keep or drop {amount} of {count} dice")
+            highest = modifier in ("kh", "k", "dl")
+            keep = amount if modifier.startswith("k") else count - amount
+        return ("dice", count, sides, keep, highest, explode)
+
+
+def describe(node, precedence=0):
+    """Canonical text of an AST node, with only the parentheses it needs"""
+    kind = node[0]
+    if kind == "num":
+        return str(node[1])
+    if kind == "dice":
+        _, count, sides, keep, highest, explode = node
+        suffix = "!" if explode else ("" if keep is None else f"k{'h' if highest else 'l'}{keep}")
+        return f"{count}d{sides}{suffix}"
+    if kind == "neg":
+        return f"-{describe(node[1], 3)}"
+    _, symbol, left, right = node
+    own = 1 if symbol in "+-" else 2
+    # Left-associative: the right side needs parentheses at equal precedence
+    text = f"{describe(left, own)}{symbol}{describe(right, own + 1)}"
+    return f"({text})" if own < precedence else text
+
+
+def _lower(node):
+    """Turn an AST node into a closure roll(rng, log) -> int"""
+    kind = node[0]
+    if kind == "num":
+        value = node[1]
+        return lambda rng, log: value
+    
+    if kind == "neg":
+        inner = _lower(node[1])
+        return lambda rng, log: -inner(rng, log)
+    
+    if kind == "op":
+        _, symbol, left, right = node
+        fn, left, right = OPERATORS[symbol], _lower(left), _lower(right)
+        return lambda rng, log: fn(left(rng, log), right(rng, log))
+    
+    _, count, sides, keep, highest, explode = node
+    label = describe(node)
+    
+    def roll(rng, log):
+        randint = rng.randint
+        if explode:
+            rolls = []
+            for _ in range(count):
+                total = value = randint(1, sides)
+                for _ in range(MAX_EXPLOSIONS):
+                    if value != sides:
+                        break
+                    value = randint(1, sides)
+                    total += value
+                rolls.append(total)
+        else:
+            rolls = [randint(1, sides) for _ in range(count)]
+        kept = rolls if keep is None else sorted(rolls, reverse=highest)[:keep]
+        log.append((label, rolls, kept))
+        return sum(kept)
+    
+    return roll
+
+
+def _distribution(node):
+    kind = node[0]
+    if kind == "num":
+        return Distribution.constant(node[1])
+    if kind == "dice":
+        return dice_distribution(*node[1:])
+    if kind == "neg":
+        return -_distribution(node[1])
+    
+    _, symbol, left, right = node
+    left, right = _distribution(left), _distribution(right)
+    if symbol == "+":
+        return left + right
+    if symbol == "-":
+        return left - right
+    fn = OPERATORS[symbol]
+    if len(right.probs) == 1:
+        constant = right.offset
+        return left.map(lambda v: fn(v, constant))
+    if len(left.probs) == 1:
+        constant = left.offset
+        return right.map(lambda v: fn(constant, v))
+    return left.combine(right, fn)
+
+
+class DiceExpression:
+    """A dice expression parsed once into a closure and an AST.
+    
+    roll() runs the compiled closure; distribution gives the exact
+    distribution of the same expression, computed on first use.
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        self.tree = _Parser(text).parse()
+        self._roll = _lower(self.tree)
+        self._distribution = None
+    
+    def roll(self, rng=random):
+        """Roll once -> (total, [(dice label, all rolls, kept rolls), ...])"""
+        log = []
+        return self._roll(rng, log), log
+    
+    def total(self, rng=random):
+        return self._roll(rng, [])
+    
+    @property
+    def distribution(self):
+        if self._distribution is None:
+            self._distribution = _distribution(self.tree)
+        return self._distribution
+    
+    def __repr__(self):
+        return f"DiceExpression({self.text!r})"
+    
+    def __str__(self):
+        return describe(self.tree)
+
+
+@lru_cache(maxsize=256)
+def compile_dice(text):
+    """Parse dice notation like '4d6kh3+2', '2d20kl1', '3d6!' or '(1d8+2)*2'"""
+    return DiceExpression(text.strip())
+
+
+def distribution(expression):
+    """Exact distribution of a dice expression"""
+    return compile_dice(expression).distribution
+
+
+def _lower_vector(node, tally):
+    """Turn an AST node into a closure roll(rng, n) -> NumPy array of n totals.
+    
+    `tally` is a one-element list that counts individual dice rolled.
+    """
+    kind = node[0]
+    if kind == "num":
+        value = node[1]
+        return lambda rng, n: np.full(n, value, dtype=np.int64)
+    
+    if kind == "neg":
+        inner = _lower_vector(node[1], tally)
+        return lambda rng, n: -inner(rng, n)
+    
+    if kind == "op":
+        _, symbol, left, right = node
+        fn = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.floor_divide}[symbol]
+        left, right = _lower_vector(left, tally), _lower_vector(right, tally)
+        return lambda rng, n: fn(left(rng, n), right(rng, n))
+    
+    _, count, sides, keep, highest, explode = node
+    
+    def roll(rng, n):
+        rolls = rng.integers(1, sides + 1, size=(n, count), dtype=np.int64)
+        tally[0] += rolls.size
+        if explode:
+            live = rolls == sides
+            for _ in range(MAX_EXPLOSIONS):
+                if not live.any():
+                    break
+                extra = rng.integers(1, sides + 1, size=int(live.sum()), dtype=np.int64)
+                tally[0] += extra.size
+                rolls[live] += extra
+                live[live] = extra == sides
+        if keep is not None:
+            rolls.sort(axis=1)
+            rolls = rolls[:, count - keep:] if highest else rolls[:, :keep]
+        return rolls.sum(axis=1)
+    
+    return roll
+
+
+class RollStats:
+    """Streaming summary of many rolls of one expression.
+    
+    Blocks of totals are folded into running sums and a histogram as
+    they arrive, so memory stays bounded however many trials run.
+    """
+    
+    def __init__(self, target=None):
+        self.target = target
+        self.trials = 0
+        self.dice = 0
+        self.successes = 0
+        self.total = 0
+        self.total_sq = 0
+        self.counts = Counter()
+        self.seconds = 0.0
+    
+    def add_block(self, totals):
+        """Fold a block (NumPy array or array('q')) of totals into the summary"""
+        if np is not None and isinstance(totals, np.ndarray):
+            # Sums come from the block's histogram in Python ints, since
+            # squares of large totals overflow int64 long before the totals do
+            low, high = int(totals.min()), int(totals.max())
+            if high - low <= 4 * len(totals):
+                counts = np.bincount(totals - low)
+                values = np.flatnonzero(counts)
+                counts = counts[values]
+                values = (values + low).tolist()
+            else:
+                values, counts = np.unique(totals, return_counts=True)
+                values = values.tolist()
+            block = dict(zip(values, counts.tolist()))
+            self.trials += len(totals)
+            self.total += sum(v * c for v, c in block.items())
+            self.total_sq += sum(v * v * c for v, c in block.items())
+            if self.target is not None:
+                self.successes += sum(c for v, c in block.items() if v >= self.target)
+            self.counts.update(block)
+        else:
+            self.trials += len(totals)
+            self.total += sum(totals)
+            self.total_sq += sum(t * t for t in totals)
+            if self.target is not None:
+                self.successes += sum(1 for t in totals if t >= self.target)
+            self.counts.update(totals)
+    
+    def merge(self, other):
+        """Combine with the summary of another batch of the same expression"""
+        self.trials += other.trials
+        self.dice += other.dice
+        self.successes += other.successes
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.counts.update(other.counts)
+        return self
+    
+    def mean(self):
+        return self.total / self.trials if self.trials else 0.0
+    
+    def std(self):
+        if not self.trials:
+            return 0.0
+        mean = self.mean()
+        return sqrt(max(self.total_sq / self.trials - mean * mean, 0.0))
+    
+    def success_rate(self):
+        return self.successes / self.trials if self.trials else 0.0
+    
+    def rolls_per_second(self):
+        return self.dice / self.seconds if self.seconds else 0.0
+
+
+class _CountingRandom:
+    """Forwards randint to a random.Random and counts the dice rolled"""
+    
+    def __init__(self, rng):
+        self.rng = rng
+        self.rolled = 0
+    
+    def randint(self, low, high):
+        self.rolled += 1
+        return self.rng.randint(low, high)
+
+
+def bulk_roll(expression, trials, seed=None, target=None, block_size=1 << 20, rng=None):
+    """Roll an expression `trials` times and return streaming RollStats.
+    
+    With NumPy, totals are generated a block at a time from a seeded
+    Generator (about `block_size` dice per block). Without it, a seeded
+    random.Random fills array('q') blocks through the compiled roller.
+    `target` counts totals at or above it as successes.
+    """
+    compiled = compile_dice(expression)
+    stats = RollStats(target)
+    started = time.perf_counter()
+    
+    if np is not None:
+        rng = rng or np.random.default_rng(seed)
+        tally = [0]
+        roll = _lower_vector(compiled.tree, tally)
+        dice_per_trial = max(1, sum(node[1] for node in _dice_nodes(compiled.tree)))
+        rows = max(1, block_size // dice_per_trial)
+        done = 0
+        while done < trials:
+            n = min(rows, trials - done)
+            stats.add_block(roll(rng, n))
+            done += n
+        stats.dice = tally[0]
+    else:
+        counting = _CountingRandom(rng or random.Random(seed))
+        rows = max(1, min(block_size, 1 << 16))
+        done = 0
+        while done < trials:
+            n = min(rows, trials - done)
+            stats.add_block(array('q', (compiled.total(counting) for _ in range(n))))
+            done += n
+        stats.dice = counting.rolled
+    
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def _dice_nodes(node):
+    if node[0] == "dice":
+        yield node
+    elif node[0] == "neg":
+        yield from _dice_nodes(node[1])
+    elif node[0] == "op":
+        yield from _dice_nodes(node[2])
+        yield from _dice_nodes(node[3])
+
+
+class DiceExperiment:
+    """Picklable bulk-roll job for the Monte Carlo runner"""
+    
+    def __init__(self, expression, target=None):
+        self.expression = expression
+        self.target = target
+    
+    def __call__(self, trials, rng):
+        return bulk_roll(self.expression, trials, target=self.target, rng=rng)
+
+
+def simulate_dice(expression, trials, target=None, seed=None, workers=None):
+    """Bulk-roll across processes; a fixed seed gives the same stats for any worker count"""
+    compile_dice(expression)  # Fail fast on bad notation, before starting workers
+    stats, seed, seconds = simulate(DiceExperiment(expression, target), trials, seed, workers)
+    stats.seconds = seconds
+    return stats, seed
+
+
+def show_bulk_roll(expression, trials, target=None, seed=None, workers=None):
+    """Run a bulk simulation and compare it with the exact distribution"""
+    stats, seed = simulate_dice(expression, trials, target, seed, workers)
+    print("\n" + "─"*40)
+    print(f"🎲 {trials:,} rolls of {expression} (seed {seed})")
+    print(f"Mean: {stats.mean():.4f}   Std: {stats.std():.4f}")
+    if target is not None:
+        print(f"Success (≥ {target}): {100 * stats.success_rate():.3f}%")
+    try:
+        exact = distribution(expression)
+        line = f"Exact mean: {exact.mean():.4f}"
+        if target is not None:
+            line += f"   exact success: {100 * exact.at_least(target):.3f}%"
+        print(line)
+    except (ValueError, MemoryError):
+        pass
+    print("─"*40)
+    print(f"{stats.dice:,} dice in {stats.seconds:.2f}s = "
+          f"{stats.rolls_per_second() / 1e6:,.1f}M dice/s "
+          f"({stats.trials / stats.seconds / 1e6:,.2f}M trials/s)")
+    return stats
+
+
+def show_distribution(expression, rows=20):
+    """Print a summary and a bar chart of an expression's exact distribution"""
+    started = time.perf_counter()
+    dist = distribution(expression)
+    elapsed = time.perf_counter() - started
+    
+    print("\n" + "─"*40)
+    print(f"📈 {expression}: mean {dist.mean():.3f}, std {dist.std():.3f}, "
+          f"range {dist.min}..{dist.max}")
+    
+    # Group values into at most `rows` bars, skipping the negligible tails
+    values = [(v, p) for v, p in dist.items() if p >= 1e-6] or dist.items()
+    low, high = values[0][0], values[-1][0]
+    width = max(1, -(-(high - low + 1) // rows))
+    bars = []
+    for start in range(low, high + 1, width):
+        end = min(start + width - 1, high)
+        bars.append((start, end, sum(dist.prob(v) for v in range(start, end + 1))))
+    peak = max(p for _, _, p in bars) or 1
+    for start, end, p in bars:
+        label = f"{start}" if start == end else f"{start}-{end}"
+        print(f"  {label:>11} | {'█' * round(30 * p / peak):30} {100 * p:6.2f}%")
+    print("─"*40)
+    print(f"Computed exactly in {elapsed * 1000:.2f} ms")
+
+
 def display_dice_art(value):
     """Display ASCII art for a six-sided die"""
     dice_art = {
@@ -101,6 +859,8 @@ def run():
         print("  2. Roll custom dice")
         print("  3. Roll d20 (for tabletop RPGs)")
         print("  4. Roll multiple different dice")
+        print("  5. Probability distribution")
+        print("  6. Bulk roll simulation")
         print("  0. Return to Main Menu")
         
         choice = input("\nYour choice: ").strip()
@@ -172,33 +932,55 @@ def run():
         
         elif choice == "4":
             print("\n🎲 Roll multiple different dice")
-            print("Example: 2d6, 1d20, 3d4")
+            print("Examples: 2d6, 1d20, 3d4   4d6kh3+2   2d20kl1   3d6!   (1d8+2)*2")
             dice_input = input("Enter dice notation (or press Enter for 1d6+1d20): ").strip()
             
             if not dice_input:
                 dice_input = "1d6, 1d20"
             
             try:
-                dice_groups = dice_input.split(',')
-                all_rolls = []
+                expressions = [compile_dice(group) for group in dice_input.split(',') if group.strip()]
+                grand_total = 0
                 
                 print("\n" + "─"*40)
-                for group in dice_groups:
-                    group = group.strip().lower()
-                    if 'd' in group:
-                        parts = group.split('d')
-                        num = int(parts[0]) if parts[0] else 1
-                        sides = int(parts[1])
-                        
-                        rolls = roll_dice(num, sides)
-                        all_rolls.extend(rolls)
-                        print(f"{num}d{sides}: {rolls} (sum: {sum(rolls)})")
+                for expression in expressions:
+                    total, log = expression.roll()
+                    grand_total += total
+                    for label, rolls, kept in log:
+                        dropped = f" (kept {kept})" if len(kept) < len(rolls) else ""
+                        print(f"  {label}: {rolls}{dropped}")
+                    print(f"{expression.text} = {total}")
                 
                 print("─"*40)
-                print(f"Grand Total: {sum(all_rolls)}")
+                print(f"Grand Total: {grand_total}")
                 
-            except (ValueError, IndexError):
-                print("❌ Invalid dice notation!")
+            except ValueError as e:
+                print(f"❌ Invalid dice notation! {e}")
+            
+            input("\nPress Enter to continue...")
+        
+        elif choice == "5":
+            print("\n📈 Exact probability distribution")
+            print("Examples: 3d6, 2d6 + 1d8 + 2, 4d6kh3, 2d20kl1, 3d6!, (1d8+2)*2, 100d20")
+            expression = input("Enter dice expression (or press Enter for 3d6): ").strip() or "3d6"
+            try:
+                show_distribution(expression)
+            except ValueError as e:
+                print(f"❌ {e}")
+            
+            input("\nPress Enter to continue...")
+        
+        elif choice == "6":
+            print("\n🎲 Bulk roll simulation")
+            expression = input("Dice expression (or press Enter for 4d6kh3): ").strip() or "4d6kh3"
+            try:
+                trials = int(input("How many rolls? (Enter for 10,000,000): ").strip() or 10_000_000)
+                target = input("Count successes at or above (optional): ").strip()
+                seed = input("Seed for a repeatable run (optional): ").strip()
+                show_bulk_roll(expression, trials, int(target) if target else None,
+                               int(seed) if seed else None)
+            except ValueError as e:
+                print(f"❌ {e}")
             
             input("\nPress Enter to continue...")
         
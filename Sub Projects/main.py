@@ -6,6 +6,8 @@ A launcher for all mini Python programs
 
 import sys
 
+from text_width import pad
+
 # Import all Python mini programs
 from ascii_animator import run as ascii_animator
 from coin_flip import run as coin_flip
@@ -55,7 +57,7 @@ PROGRAMS = [
 def display_menu():
     """Display the main menu with all available programs"""
     print("\n" + "="*50)
-    print("🎮  MINI PROJECTS LAUNCHER  🎮")
+    print(pad("🎮  MINI PROJECTS LAUNCHER  🎮", 50, "^").rstrip())
     print("="*50)
     print("\nPlease select a mini program to play:\n")
     
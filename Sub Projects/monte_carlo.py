@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo
+Run large simulations across a process pool with reproducible random streams
+"""
+
+import hashlib
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; streams fall back to random.Random
+    np = None
+
+
+# Trials per chunk. Chunks, not workers, decide which random stream a
+# trial comes from, so the result doesn't depend on the worker count.
+CHUNK_SIZE = 1_000_000
+
+
+def chunk_streams(seed, chunks):
+    """Independent seeds for each chunk, all derived from one seed.
+
+    With NumPy these are SeedSequence children; otherwise integers
+    hashed from (seed, chunk) for random.Random.
+    """
+    if np is not None:
+        return np.random.SeedSequence(seed).spawn(chunks)
+    return [int.from_bytes(hashlib.sha256(f"{seed}/{i}".encode()).digest()[:16], "big")
+            for i in range(chunks)]
+
+
+def make_rng(stream):
+    """Generator for one chunk's stream"""
+    if np is not None:
+        return np.random.default_rng(stream)
+    return random.Random(stream)
+
+
+def _run_chunk(experiment, trials, stream):
+    return experiment(trials, make_rng(stream))
+
+
+def simulate(experiment, trials, seed=None, workers=None, chunk_size=CHUNK_SIZE):
+    """Run `experiment(trials, rng)` over `trials` trials split into chunks.
+
+    `experiment` must be picklable (a module-level function or class
+    instance) and return a result with a merge() method. Chunks run on
+    up to `workers` processes (default: one per CPU) and are merged in
+    chunk order, so a fixed seed gives identical results for any
+    worker count. Returns (merged result, seed, seconds).
+    """
+    if trials < 1:
+        raise ValueError("Need at least one trial")
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    sizes = [chunk_size] * (trials // chunk_size)
+    if trials % chunk_size:
+        sizes.append(trials % chunk_size)
+    streams = chunk_streams(seed, len(sizes))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(sizes)))
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [_run_chunk(experiment, n, stream) for n, stream in zip(sizes, streams)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_chunk, repeat(experiment), sizes, streams))
+
+    merged = results[0]
+    for result in results[1:]:
+        merged.merge(result)
+    return merged, seed, time.perf_counter() - started
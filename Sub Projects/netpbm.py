@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Netpbm
+Read raw PPM (P6) and PGM (P5) images, one or many to a file
+"""
+
+import os
+
+
+def _read_token(f):
+    token = b""
+    while True:
+        c = f.read(1)
+        if not c:
+            return token or None
+        if c == b"#":
+            f.readline()
+        elif c.isspace():
+            if token:
+                return token
+        else:
+            token += c
+
+
+def iter_ppm_images(path):
+    """Yield (width, height, channels, pixels) for each image in `path`.
+    
+    `path` is either one file holding one or more concatenated P6/P5
+    images or a directory of them, read in name order. Images are read
+    one at a time, so long sequences never sit in memory all at once.
+    Samples above 8 bits are rejected; other maxvals are scaled to 255.
+    """
+    if os.path.isdir(path):
+        names = sorted(n for n in os.listdir(path) if n.lower().endswith((".ppm", ".pgm", ".pnm")))
+        for name in names:
+            yield from iter_ppm_images(os.path.join(path, name))
+        return
+    
+    with open(path, "rb") as f:
+        while True:
+            magic = _read_token(f)
+            if magic is None:
+                return
+            if magic not in (b"P6", b"P5"):
+                raise ValueError(f"{path}: only raw PPM (P6) and PGM (P5) are supported")
+            try:
+                width, height, maxval = (int(_read_token(f)) for _ in range(3))
+            except (TypeError, ValueError):
+                raise ValueError(f"{path}: bad or truncated PPM header")
+            if not (width and height and maxval):
+                raise ValueError(f"{path}: empty image")
+            if maxval > 255:
+                raise ValueError(f"{path}: 16-bit images are not supported")
+            channels = 3 if magic == b"P6" else 1
+            pixels = f.read(width * height * channels)
+            if len(pixels) < width * height * channels:
+                raise ValueError(f"{path}: truncated image data")
+            if maxval != 255:
+                pixels = pixels.translate(bytes(min(v * 255 // maxval, 255) for v in range(256)))
+            yield width, height, channels, pixels
+
+
+def read_ppm(path):
+    """Read the first image of a raw PPM/PGM file -> (width, height, channels, pixels)"""
+    for image in iter_ppm_images(path):
+        return image
+    raise ValueError(f"{path}: no image found")
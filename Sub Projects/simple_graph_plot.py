@@ -4,8 +4,195 @@ Simple Graph Plotter
 Create and display simple graphs and charts
 """
 
+import csv
+import json
+import os
+import shutil
+import sys
+import threading
 import time
+from array import array
+from itertools import islice
 
+from braille import BRAILLE_DOTS, BRAILLE_TABLE
+from text_width import pad
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python paths below still work
+    np = None
+
+
+# ---------------------------------------------------------------------------
+# Computation layer
+# ---------------------------------------------------------------------------
+
+def as_numeric(values):
+    """Turn an array, memoryview or iterable into a flat numeric sequence"""
+    if isinstance(values, memoryview) and values.ndim > 1:
+        values = values.cast('B').cast(values.format)
+    
+    if np is not None:
+        if isinstance(values, (list, tuple, memoryview, array)) or hasattr(values, '__array__'):
+            arr = np.asarray(values)
+            if arr.dtype.kind not in 'iuf':
+                arr = arr.astype(np.float64)
+            return arr.ravel()
+        return np.fromiter(values, dtype=np.float64)
+    
+    if isinstance(values, memoryview):
+        return values.tolist()
+    if isinstance(values, (list, tuple, array)):
+        return values
+    return list(values)
+
+
+def value_range(values):
+    """Return (min, max) of a numeric sequence"""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.min().item(), values.max().item()
+    # min()/max() run in C, which beats a single interpreted pass
+    return min(values), max(values)
+
+
+def histogram_counts(values, bins, min_val, max_val):
+    """Count how many values fall into each of `bins` equal-width bins"""
+    span = max_val - min_val
+    
+    if np is not None and isinstance(values, np.ndarray):
+        if span == 0:
+            indices = np.full(len(values), bins - 1, dtype=np.intp)
+        else:
+            indices = ((values - min_val) / (span / bins)).astype(np.intp)
+            np.clip(indices, 0, bins - 1, out=indices)
+        return np.bincount(indices, minlength=bins).tolist()
+    
+    bin_counts = [0] * bins
+    if span == 0:
+        bin_counts[-1] = len(values)
+        return bin_counts
+    
+    bin_width = span / bins
+    last = bins - 1
+    for value in values:
+        bin_index = int((value - min_val) / bin_width)
+        bin_counts[bin_index if bin_index < last else last] += 1
+    
+    return bin_counts
+
+
+def normalize_values(values, height, min_val, max_val):
+    """Scale values to integer rows in the range 0..height-1"""
+    if max_val == min_val:
+        return [height // 2] * len(values)
+    
+    span = max_val - min_val
+    
+    if np is not None and isinstance(values, np.ndarray):
+        return ((values - min_val) / span * (height - 1)).astype(np.intp).tolist()
+    
+    return [int((v - min_val) / span * (height - 1)) for v in values]
+
+
+def lttb_indices(values, n_out):
+    """Pick `n_out` indices with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept. Every other bucket keeps
+    the point forming the largest triangle with the previously kept point
+    and the average of the next bucket, which preserves visual peaks.
+    Linear time, but not streamable: bucket edges depend on the series
+    length and each bucket looks ahead at the next one, so `values` must
+    be a whole in-memory sequence (live views keep a window instead).
+    """
+    n = len(values)
+    if n_out >= n:
+        return list(range(n))
+    if n_out < 3:
+        return [0, n - 1][:max(n_out, 1)]
+    
+    every = (n - 2) / (n_out - 2)
+    use_numpy = np is not None and isinstance(values, np.ndarray)
+    selected = [0]
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_start = end
+        next_end = min(int((i + 2) * every) + 1, n)
+        
+        ax, ay = a, values[a]
+        
+        if use_numpy:
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = values[next_start:next_end].mean()
+            xs = np.arange(start, end)
+            areas = np.abs((ax - avg_x) * (values[start:end] - ay) - (ax - xs) * (avg_y - ay))
+            a = start + int(areas.argmax())
+        else:
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+            best_area = -1
+            for j in range(start, end):
+                area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+                if area > best_area:
+                    best_area = area
+                    a = j
+        
+        selected.append(a)
+    
+    selected.append(n - 1)
+    return selected
+
+
+def minmax_indices(values, n_out):
+    """Pick about `n_out` indices by keeping the min and max of each bucket"""
+    n = len(values)
+    buckets = n_out // 2
+    if n_out >= n or buckets < 1:
+        return list(range(n))
+    
+    selected = []
+    
+    if np is not None and isinstance(values, np.ndarray):
+        # Equal-length buckets reshape cleanly; the remainder joins the last one
+        size = n // buckets
+        body = values[:size * buckets].reshape(buckets, size)
+        lows = body.argmin(axis=1) + np.arange(buckets) * size
+        highs = body.argmax(axis=1) + np.arange(buckets) * size
+        tail = values[size * buckets:]
+        if len(tail):
+            last = slice((buckets - 1) * size, n)
+            lows[-1] = last.start + int(values[last].argmin())
+            highs[-1] = last.start + int(values[last].argmax())
+        pairs = zip(lows.tolist(), highs.tolist())
+    else:
+        edges = [i * n // buckets for i in range(buckets + 1)]
+        pairs = []
+        for start, end in zip(edges, edges[1:]):
+            bucket = values[start:end]
+            low = min(range(len(bucket)), key=bucket.__getitem__)
+            high = max(range(len(bucket)), key=bucket.__getitem__)
+            pairs.append((start + low, start + high))
+    
+    for low, high in pairs:
+        if low == high:
+            selected.append(low)
+        else:
+            selected.extend(sorted((low, high)))
+    return selected
+
+
+def downsample(values, n_out, method="lttb"):
+    """Return the indices of the points to draw when a series is too long"""
+    if method == "minmax":
+        return minmax_indices(values, n_out)
+    return lttb_indices(values, n_out)
+
+
+# ---------------------------------------------------------------------------
+# Charts
+# ---------------------------------------------------------------------------
 
 def plot_bar_chart(data, title="Bar Chart"):
     """Create a simple ASCII bar chart"""
@@ -23,31 +210,45 @@ def plot_bar_chart(data, title="Bar Chart"):
     for label, value in data.items():
         bar_length = int(value * scale)
         bar = "█" * bar_length
-        print(f"{label:15} | {bar} {value}")
+        print(f"{pad(str(label), 15)} | {bar} {value}")
     
     print("="*60)
 
 
-def plot_line_graph(data, title="Line Graph"):
-    """Create a simple ASCII line graph"""
-    if not data:
+def plot_line_graph(data, title="Line Graph", max_points=None, method="lttb"):
+    """Create a simple ASCII line graph
+    
+    `data` is a dict of label -> value or a plain sequence of values.
+    Series longer than `max_points` (default: what fits the terminal) are
+    downsampled with LTTB, or min/max per bucket when method="minmax".
+    """
+    if isinstance(data, dict):
+        values = as_numeric(list(data.values()))
+        labels = list(data.keys())
+    else:
+        values = as_numeric(data)
+        labels = None
+    
+    if len(values) == 0:
         print("❌ No data to plot!")
         return
     
-    values = list(data.values())
-    labels = list(data.keys())
+    min_value, max_value = value_range(values)
+    
+    if max_points is None:
+        max_points = max((shutil.get_terminal_size().columns - 1) // 2, 3)
     
-    max_value = max(values)
-    min_value = min(values)
+    if len(values) > max_points:
+        indices = downsample(values, max_points, method)
+        values = values[indices] if np is not None and isinstance(values, np.ndarray) else [values[i] for i in indices]
+        if labels is not None:
+            labels = [labels[i] for i in indices]
     
     height = 15
     width = len(values)
     
     # Normalize values to fit in height
-    if max_value == min_value:
-        normalized = [height // 2] * len(values)
-    else:
-        normalized = [int((v - min_value) / (max_value - min_value) * (height - 1)) for v in values]
+    normalized = normalize_values(values, height, min_value, max_value)
     
     print("\n" + "="*60)
     print(f"📈 {title}")
@@ -70,10 +271,11 @@ def plot_line_graph(data, title="Line Graph"):
     print("─" * (width * 2 + 1))
     
     # Draw labels
-    label_line = ""
-    for label in labels:
-        label_line += f" {str(label)[:1]}"
-    print(label_line)
+    if labels is not None:
+        label_line = ""
+        for label in labels:
+            label_line += f" {str(label)[:1]}"
+        print(label_line)
     
     print(f"Min: {min_value}")
     print("="*60)
@@ -100,39 +302,37 @@ def plot_pie_chart(data, title="Pie Chart"):
         symbol = symbols[i % len(symbols)]
         bar = symbol * bar_length
         
-        print(f"{label:15} {symbol} {bar} {percentage:.1f}% ({value})")
+        print(f"{pad(str(label), 15)} {symbol} {bar} {percentage:.1f}% ({value})")
     
     print("="*60)
 
 
 def plot_histogram(values, bins=10, title="Histogram"):
     """Create a simple ASCII histogram"""
-    if not values:
+    values = as_numeric(values)
+    
+    if len(values) == 0:
         print("❌ No data to plot!")
         return
     
-    min_val = min(values)
-    max_val = max(values)
-    
-    bin_width = (max_val - min_val) / bins
+    min_val, max_val = value_range(values)
     
     # Create bins
-    bin_counts = [0] * bins
+    bin_counts = histogram_counts(values, bins, min_val, max_val)
     
-    for value in values:
-        if value == max_val:
-            bin_index = bins - 1
-        else:
-            bin_index = int((value - min_val) / bin_width)
-        
-        if 0 <= bin_index < bins:
-            bin_counts[bin_index] += 1
+    render_histogram(bin_counts, min_val, max_val, len(values), title)
+
+
+def render_histogram(bin_counts, min_val, max_val, total, title="Histogram"):
+    """Print already-counted histogram bins as ASCII bars"""
+    bins = len(bin_counts)
+    bin_width = (max_val - min_val) / bins
     
     print("\n" + "="*60)
     print(f"📊 {title}")
     print("="*60)
     print(f"Range: {min_val:.2f} to {max_val:.2f}")
-    print(f"Total values: {len(values)}\n")
+    print(f"Total values: {total}\n")
     
     max_count = max(bin_counts) if bin_counts else 1
     scale = 40 / max_count if max_count > 0 else 1
@@ -148,6 +348,1366 @@ def plot_histogram(values, bins=10, title="Histogram"):
     print("="*60)
 
 
+def plot_box_plot(summary, title="Box Plot"):
+    """Draw a horizontal ASCII box plot from a five-number summary"""
+    width = 50
+    low, high = summary['min'], summary['max']
+    span = high - low
+    
+    def column(value):
+        if span == 0:
+            return width // 2
+        return int((value - low) / span * (width - 1))
+    
+    q1, median, q3 = column(summary['q1']), column(summary['median']), column(summary['q3'])
+    
+    cells = [' '] * width
+    for col in range(0, width):
+        if col < q1 or col > q3:
+            cells[col] = '─'
+        else:
+            cells[col] = '█'
+    cells[0] = '├'
+    cells[-1] = '┤'
+    cells[q1] = '['
+    cells[q3] = ']'
+    cells[median] = '┃'
+    
+    print("\n" + "="*60)
+    print(f"📦 {title}")
+    print("="*60)
+    print(f"  {''.join(cells)}")
+    print(f"  {low:<{width // 2}.2f}{high:>{width - width // 2}.2f}")
+    print()
+    for key in ('min', 'q1', 'median', 'q3', 'max'):
+        print(f"  {key:>6}: {summary[key]:.2f}")
+    if 'count' in summary:
+        print(f"  {'count':>6}: {summary['count']}")
+    print("="*60)
+
+
+# ---------------------------------------------------------------------------
+# Streaming histogram
+# ---------------------------------------------------------------------------
+
+def iter_numbers(lines):
+    """Yield every number found in lines of text, skipping anything else"""
+    for line in lines:
+        for token in line.replace(',', ' ').split():
+            try:
+                yield float(token)
+            except ValueError:
+                continue
+
+
+class StreamingHistogram:
+    """Fixed-memory histogram that can be fed one value or chunk at a time.
+    
+    The first `resolution` values are buffered exactly. After that the
+    sketch keeps `resolution` equal-width bins; when a value lands outside
+    the covered range, neighbouring bins are merged pairwise so the range
+    doubles. Memory therefore never depends on how many values were seen,
+    and quantiles are accurate to within one bin width.
+    """
+    
+    CHUNK_SIZE = 65536
+    
+    def __init__(self, resolution=1024):
+        if resolution < 2 or resolution % 2:
+            raise ValueError("resolution must be an even number >= 2")
+        self.resolution = resolution
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.lo = None
+        self.width = None
+        self.counts = None
+        self._buffer = []
+    
+    # -- feeding ---------------------------------------------------------
+    
+    def add(self, value):
+        """Add a single value"""
+        self._track(value, value, 1, value)
+        if self.counts is None:
+            self._buffer.append(value)
+            if len(self._buffer) >= self.resolution:
+                self._start_bins()
+            return
+        self._grow_to(value)
+        self.counts[self._index(value)] += 1
+    
+    def extend(self, values):
+        """Add every value from an iterable, array or memoryview"""
+        if np is not None and (isinstance(values, memoryview) or hasattr(values, '__array__')):
+            self._extend_chunk(as_numeric(values))
+            return
+        
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, self.CHUNK_SIZE))
+            if not chunk:
+                break
+            self._extend_chunk(as_numeric(chunk))
+    
+    def extend_from_file(self, path):
+        """Add every number found in a text file (one or more per line)"""
+        with open(path) as f:
+            self.extend(iter_numbers(f))
+    
+    def merge(self, other):
+        """Fold another sketch (e.g. from a worker process) into this one"""
+        if other.count == 0:
+            return self
+        
+        if other.counts is None:
+            self.extend(other._buffer)
+            return self
+        
+        pending = None
+        if self.counts is None:
+            pending = self._buffer
+            self._buffer = []
+            self.lo = other.lo
+            self.width = other.width * len(other.counts) / self.resolution
+            self.counts = [0] * self.resolution
+            self.count, self.total = 0, 0.0
+            self.min = self.max = None
+        
+        self._grow_to(other.min)
+        self._grow_to(other.max)
+        for i, c in enumerate(other.counts):
+            if c:
+                center = other.lo + (i + 0.5) * other.width
+                center = min(max(center, other.min), other.max)
+                self.counts[self._index(center)] += c
+        self._track(other.min, other.max, other.count, other.total)
+        
+        if pending:
+            self.extend(pending)
+        return self
+    
+    # -- queries ---------------------------------------------------------
+    
+    def mean(self):
+        """Exact arithmetic mean of every value seen"""
+        return self.total / self.count if self.count else None
+    
+    def quantile(self, q):
+        """Approximate value below which a fraction `q` of the data falls"""
+        if self.count == 0:
+            return None
+        
+        if self.counts is None:
+            ordered = sorted(self._buffer)
+            pos = q * (len(ordered) - 1)
+            i = int(pos)
+            if i + 1 >= len(ordered):
+                return ordered[-1]
+            return ordered[i] + (ordered[i + 1] - ordered[i]) * (pos - i)
+        
+        target = q * self.count
+        cumulative = 0
+        for i, c in enumerate(self.counts):
+            if c and cumulative + c >= target:
+                value = self.lo + (i + (target - cumulative) / c) * self.width
+                return min(max(value, self.min), self.max)
+            cumulative += c
+        return self.max
+    
+    def box_plot_summary(self):
+        """Five-number summary plus count and mean"""
+        return {
+            'min': self.min,
+            'q1': self.quantile(0.25),
+            'median': self.quantile(0.5),
+            'q3': self.quantile(0.75),
+            'max': self.max,
+            'count': self.count,
+            'mean': self.mean(),
+        }
+    
+    def histogram(self, bins=10):
+        """Re-bin the sketch into `bins` equal bins spanning [min, max]"""
+        if self.counts is None:
+            return histogram_counts(as_numeric(self._buffer), bins, self.min, self.max)
+        
+        bin_counts = [0] * bins
+        span = self.max - self.min
+        for i, c in enumerate(self.counts):
+            if not c:
+                continue
+            center = self.lo + (i + 0.5) * self.width
+            if span == 0:
+                index = bins - 1
+            else:
+                index = int((center - self.min) / span * bins)
+            bin_counts[min(max(index, 0), bins - 1)] += c
+        return bin_counts
+    
+    def plot(self, bins=10, title="Streaming Histogram"):
+        """Render through the regular ASCII histogram output"""
+        if self.count == 0:
+            print("❌ No data to plot!")
+            return
+        render_histogram(self.histogram(bins), self.min, self.max, self.count, title)
+    
+    def plot_box(self, title="Box Plot"):
+        """Render a box plot of the data seen so far"""
+        if self.count == 0:
+            print("❌ No data to plot!")
+            return
+        plot_box_plot(self.box_plot_summary(), title)
+    
+    # -- internals -------------------------------------------------------
+    
+    def _track(self, low, high, count, total):
+        self.count += count
+        self.total += total
+        if self.min is None or low < self.min:
+            self.min = low
+        if self.max is None or high > self.max:
+            self.max = high
+    
+    def _extend_chunk(self, chunk):
+        if len(chunk) == 0:
+            return
+        
+        if self.counts is None:
+            room = self.resolution - len(self._buffer)
+            head = chunk[:room]
+            low, high = value_range(head)
+            self._track(low, high, len(head), float(sum(head)))
+            self._buffer.extend(head.tolist() if hasattr(head, 'tolist') else head)
+            if len(self._buffer) < self.resolution:
+                return
+            self._start_bins()
+            chunk = chunk[room:]
+            if len(chunk) == 0:
+                return
+        
+        low, high = value_range(chunk)
+        self._grow_to(low)
+        self._grow_to(high)
+        
+        if np is not None and isinstance(chunk, np.ndarray):
+            indices = ((chunk - self.lo) / self.width).astype(np.intp)
+            np.clip(indices, 0, self.resolution - 1, out=indices)
+            added = np.bincount(indices, minlength=self.resolution)
+            self.counts = (np.asarray(self.counts) + added).tolist()
+            self._track(low, high, len(chunk), float(chunk.sum()))
+            return
+        
+        for value in chunk:
+            self.counts[self._index(value)] += 1
+        self._track(low, high, len(chunk), sum(chunk))
+    
+    def _start_bins(self):
+        low, high = min(self._buffer), max(self._buffer)
+        span = high - low
+        if span == 0:
+            span = abs(low) or 1.0
+        self.lo = low
+        self.width = span / self.resolution
+        self.counts = [0] * self.resolution
+        for value in self._buffer:
+            self.counts[self._index(value)] += 1
+        self._buffer = []
+    
+    def _index(self, value):
+        index = int((value - self.lo) / self.width)
+        return index if index < self.resolution else self.resolution - 1
+    
+    def _grow_to(self, value):
+        while value < self.lo:
+            self._double_left()
+        while value > self.lo + self.width * self.resolution:
+            self._double_right()
+    
+    def _merged_pairs(self):
+        counts = self.counts
+        return [counts[i] + counts[i + 1] for i in range(0, len(counts), 2)]
+    
+    def _double_right(self):
+        merged = self._merged_pairs()
+        self.counts = merged + [0] * (self.resolution - len(merged))
+        self.width *= 2
+    
+    def _double_left(self):
+        merged = self._merged_pairs()
+        self.lo -= self.width * len(self.counts)
+        self.counts = [0] * (self.resolution - len(merged)) + merged
+        self.width *= 2
+
+
+# ---------------------------------------------------------------------------
+# Braille canvas
+# ---------------------------------------------------------------------------
+
+SERIES_COLORS = ['\033[96m', '\033[93m', '\033[95m', '\033[92m', '\033[91m', '\033[94m']
+RESET = '\033[0m'
+
+
+class BrailleCanvas:
+    """Pixel canvas packed into Unicode braille cells (2x4 dots per cell).
+    
+    Dots live in one preallocated bytearray, one bitmask byte per cell,
+    with a parallel bytearray recording which series last drew in each
+    cell so several series can be coloured. Pixel (0, 0) is top-left.
+    """
+    
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.px_width = cols * 2
+        self.px_height = rows * 4
+        self.cells = bytearray(cols * rows)
+        self.owner = bytearray(cols * rows)
+        self._blank = bytes(cols * rows)
+    
+    def clear(self):
+        """Erase every dot without reallocating"""
+        self.cells[:] = self._blank
+        self.owner[:] = self._blank
+    
+    def set(self, x, y, series=0):
+        """Turn on the dot at pixel (x, y); off-canvas dots are clipped"""
+        if 0 <= x < self.px_width and 0 <= y < self.px_height:
+            i = (y >> 2) * self.cols + (x >> 1)
+            self.cells[i] |= BRAILLE_DOTS[y & 3][x & 1]
+            self.owner[i] = series + 1
+    
+    def line(self, x0, y0, x1, y1, series=0):
+        """Draw a straight line with Bresenham's algorithm"""
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        
+        while True:
+            self.set(x0, y0, series)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+    
+    def plot(self, values, min_value, max_value, series=0):
+        """Draw a series as connected line segments scaled to the canvas"""
+        n = len(values)
+        if n == 0:
+            return
+        
+        if n > self.px_width:
+            indices = lttb_indices(values, self.px_width)
+            values = values[indices] if np is not None and isinstance(values, np.ndarray) else [values[i] for i in indices]
+            n = len(values)
+        
+        top = self.px_height - 1
+        rows = normalize_values(values, self.px_height, min_value, max_value)
+        
+        previous = None
+        for i, row in enumerate(rows):
+            x = i * (self.px_width - 1) // (n - 1) if n > 1 else 0
+            point = (x, top - min(max(row, 0), top))
+            if previous is None:
+                self.set(*point, series=series)
+            else:
+                self.line(*previous, *point, series=series)
+            previous = point
+    
+    def row_text(self, row, colors=None):
+        """Return one row of cells as braille text, optionally coloured"""
+        start = row * self.cols
+        cells = self.cells[start:start + self.cols]
+        text = cells.decode('latin-1').translate(BRAILLE_TABLE)
+        if not colors:
+            return text
+        
+        # Emit an escape only where the owning series changes
+        parts = []
+        current = 0
+        owners = self.owner[start:start + self.cols]
+        for i, owner in enumerate(owners):
+            if cells[i] and owner != current:
+                parts.append(colors[(owner - 1) % len(colors)])
+                current = owner
+            parts.append(text[i])
+        if current:
+            parts.append(RESET)
+        return ''.join(parts)
+    
+    def lines(self, colors=None):
+        """Return every row of the canvas as a list of strings"""
+        return [self.row_text(row, colors) for row in range(self.rows)]
+
+
+def plot_braille_graph(series, title="High-Resolution Line Graph", width=None, height=12, color=True):
+    """Plot one or more series on a braille canvas with axis ticks
+    
+    `series` is a dict of name -> values, or a single sequence of values.
+    Each terminal cell holds 2x4 dots, so this has eight times the
+    resolution of plot_line_graph. The frame goes out in one write.
+    """
+    if not isinstance(series, dict):
+        series = {"series": series}
+    
+    arrays = {name: as_numeric(values) for name, values in series.items()}
+    arrays = {name: values for name, values in arrays.items() if len(values)}
+    if not arrays:
+        print("❌ No data to plot!")
+        return
+    
+    ranges = [value_range(values) for values in arrays.values()]
+    min_value = min(low for low, _ in ranges)
+    max_value = max(high for _, high in ranges)
+    
+    gutter = 10
+    if width is None:
+        width = max(shutil.get_terminal_size().columns - gutter - 2, 10)
+    canvas = BrailleCanvas(width, height)
+    
+    for index, values in enumerate(arrays.values()):
+        canvas.plot(values, min_value, max_value, series=index)
+    
+    colors = SERIES_COLORS if color else None
+    out = ["\n" + "="*60, f"📈 {title}", "="*60]
+    
+    middle = height // 2
+    for row, text in enumerate(canvas.lines(colors)):
+        if row == 0:
+            label = f"{max_value:.4g}"
+        elif row == height - 1:
+            label = f"{min_value:.4g}"
+        elif row == middle:
+            label = f"{(max_value + min_value) / 2:.4g}"
+        else:
+            label = ""
+        tick = "┤" if label else "│"
+        out.append(f"{label:>{gutter - 1}} {tick}{text}")
+    
+    # X axis with a tick every 10 cells, labelled by data index
+    longest = max(len(values) for values in arrays.values())
+    axis = ["─"] * width
+    labels = [" "] * (width + 8)
+    for col in range(0, width, 10):
+        axis[col] = "┬"
+        index = str(round(col / max(width - 1, 1) * (longest - 1)))
+        labels[col:col + len(index)] = index
+    out.append(" " * gutter + "└" + "".join(axis))
+    out.append(" " * (gutter + 1) + "".join(labels).rstrip())
+    
+    if len(arrays) > 1:
+        legend = []
+        for index, name in enumerate(arrays):
+            dot = "●"
+            if colors:
+                dot = f"{colors[index % len(colors)]}●{RESET}"
+            legend.append(f"{dot} {name}")
+        out.append(" " * (gutter + 1) + "   ".join(legend))
+    
+    out.append("="*60 + "\n")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
+
+
+# ---------------------------------------------------------------------------
+# Live streaming charts
+# ---------------------------------------------------------------------------
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of floats that keeps only the newest values"""
+    
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = array('d', bytes(8 * capacity))
+        self.head = 0
+        self.size = 0
+        self.total = 0
+    
+    def extend(self, values):
+        """Append a batch of floats, overwriting the oldest when full"""
+        n = len(values)
+        self.total += n
+        if n >= self.capacity:
+            self.data[:] = array('d', values[-self.capacity:])
+            self.head = 0
+            self.size = self.capacity
+            return
+        
+        first = min(n, self.capacity - self.head)
+        self.data[self.head:self.head + first] = array('d', values[:first])
+        if first < n:
+            self.data[:n - first] = array('d', values[first:])
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+    
+    def values(self):
+        """Return the buffered values, oldest first"""
+        if self.size < self.capacity:
+            return self.data[:self.size]
+        return self.data[self.head:] + self.data[:self.head]
+
+
+class DiffRenderer:
+    """Draws frames of plain text, sending only the cells that changed.
+    
+    Frames are lists of strings made of single-width characters. Each
+    frame is compared with the previous one, changed runs are turned into
+    cursor moves plus text, and everything goes out in one os.write.
+    """
+    
+    # Unchanged gaps shorter than this are rewritten rather than skipped,
+    # since a cursor move costs more bytes than a few characters
+    GAP = 6
+    
+    def __init__(self, fd=1):
+        self.fd = fd
+        self.previous = []
+        self.bytes_written = 0
+    
+    def reset(self):
+        """Forget the previous frame so the next one is drawn in full"""
+        self.previous = []
+        self.write("\033[2J")
+    
+    def draw(self, lines):
+        """Update the terminal to show `lines`"""
+        out = []
+        for r, line in enumerate(lines):
+            old = self.previous[r] if r < len(self.previous) else ""
+            if line == old:
+                continue
+            
+            width = max(len(line), len(old))
+            new, old = line.ljust(width), old.ljust(width)
+            c = 0
+            while c < width:
+                if new[c] == old[c]:
+                    c += 1
+                    continue
+                start = end = c
+                while c < width and c - end <= self.GAP:
+                    if new[c] != old[c]:
+                        end = c + 1
+                    c += 1
+                out.append(f"\033[{r + 1};{start + 1}H{new[start:end]}")
+        
+        for r in range(len(lines), len(self.previous)):
+            out.append(f"\033[{r + 1};1H\033[2K")
+        
+        self.previous = list(lines)
+        if out:
+            self.write("".join(out))
+    
+    def write(self, text):
+        """Write raw text to the terminal in as few syscalls as possible"""
+        data = text.encode()
+        self.bytes_written += len(data)
+        while data:
+            data = data[os.write(self.fd, data):]
+
+
+def read_number_batches(fd, follow=False, stop=None, chunk_size=65536):
+    """Yield lists of numbers read from a file descriptor as data arrives
+    
+    With `follow`, keep polling for appended data at end of file (like
+    tail -f) until `stop` is set; otherwise stop at end of file.
+    """
+    pending = b""
+    while stop is None or not stop.is_set():
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            if not follow:
+                break
+            time.sleep(0.05)
+            continue
+        
+        pending += chunk
+        cut = pending.rfind(b"\n") + 1
+        if not cut:
+            continue
+        text, pending = pending[:cut], pending[cut:]
+        numbers = list(iter_numbers(text.decode(errors="ignore").splitlines()))
+        if numbers:
+            yield numbers
+    
+    if pending:
+        numbers = list(iter_numbers([pending.decode(errors="ignore")]))
+        if numbers:
+            yield numbers
+
+
+def sparkline(values, width):
+    """Render the newest `width` values as a one-line sparkline"""
+    values = values[-width:]
+    if len(values) == 0:
+        return ""
+    low, high = value_range(values)
+    rows = normalize_values(as_numeric(values), len(SPARK_CHARS), low, high)
+    return "".join(SPARK_CHARS[r] for r in rows)
+
+
+class LiveChart:
+    """Live sparkline, line or histogram view of a stream of numbers.
+    
+    Values are ingested on a background thread into a ring buffer (and
+    a StreamingHistogram for the histogram view) while the main thread
+    redraws at no more than `fps` frames per second, so rendering never
+    holds up ingest for longer than copying the buffer out.
+    """
+    
+    MODES = ("sparkline", "line", "histogram")
+    
+    def __init__(self, mode="sparkline", fps=10, window=2000):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+        self.mode = mode
+        self.fps = fps
+        self.buffer = RingBuffer(window)
+        self.sketch = StreamingHistogram() if mode == "histogram" else None
+        self.lock = threading.Lock()
+        self.version = 0
+        self.renderer = DiffRenderer()
+        self.started = time.monotonic()
+    
+    def feed(self, numbers):
+        """Add a batch of numbers (called from the ingest thread)"""
+        with self.lock:
+            self.buffer.extend(numbers)
+            if self.sketch is not None:
+                self.sketch.extend(numbers)
+            self.version += 1
+    
+    def frame(self, cols, rows):
+        """Build the current frame as a list of plain text lines"""
+        with self.lock:
+            values = self.buffer.values()
+            total = self.buffer.total
+            hist = None
+            if self.sketch is not None and self.sketch.count:
+                hist = (self.sketch.histogram(max(rows - 4, 1)), self.sketch.min, self.sketch.max)
+        
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        last = f"{values[-1]:.4g}" if len(values) else "-"
+        lines = [
+            f"LIVE {self.mode.upper()}  points: {total:,}  rate: {total / elapsed:,.0f}/s  last: {last}"[:cols],
+            "─" * cols,
+        ]
+        
+        if len(values) == 0:
+            lines.append("waiting for data...")
+            return lines
+        
+        low, high = value_range(values)
+        
+        if self.mode == "sparkline":
+            lines.append(f"max {high:.4g}")
+            lines.append(sparkline(values, cols))
+            lines.append(f"min {low:.4g}")
+        
+        elif self.mode == "line":
+            canvas = BrailleCanvas(cols, max(rows - 4, 1))
+            canvas.plot(as_numeric(values), low, high)
+            lines.append(f"max {high:.4g}")
+            lines.extend(canvas.lines())
+            lines.append(f"min {low:.4g}")
+        
+        elif hist is not None:
+            counts, low, high = hist
+            bin_width = (high - low) / len(counts)
+            peak = max(counts) or 1
+            bar_room = max(cols - 24, 1)
+            for i, count in enumerate(counts):
+                start = low + i * bin_width
+                bar = "█" * int(count / peak * bar_room)
+                lines.append(f"{start:10.4g} | {bar} {count}"[:cols])
+        
+        return lines
+    
+    def run(self, fd, follow=False):
+        """Ingest from `fd` and redraw until the stream ends or Ctrl+C"""
+        stop = threading.Event()
+        
+        def ingest():
+            for numbers in read_number_batches(fd, follow=follow, stop=stop):
+                self.feed(numbers)
+            stop.set()
+        
+        reader = threading.Thread(target=ingest, daemon=True)
+        reader.start()
+        
+        interval = 1 / self.fps
+        drawn_version = -1
+        size = None
+        deadline = time.monotonic()
+        
+        self.renderer.write("\033[?25l")
+        try:
+            while True:
+                finished = stop.is_set()
+                
+                current = shutil.get_terminal_size()
+                if current != size:
+                    size = current
+                    self.renderer.reset()
+                    drawn_version = -1
+                
+                if self.version != drawn_version:
+                    drawn_version = self.version
+                    self.renderer.draw(self.frame(size.columns - 1, size.lines - 1))
+                
+                if finished:
+                    break
+                
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    deadline = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            rows = len(self.renderer.previous)
+            self.renderer.write(f"\033[{rows + 1};1H\033[?25h")
+
+
+def live_chart(source=None, mode="sparkline", fps=10, window=2000, follow=None):
+    """Watch a live chart of numbers from stdin or a (tailed) file"""
+    chart = LiveChart(mode=mode, fps=fps, window=window)
+    
+    if source is None or source == "-":
+        chart.run(sys.stdin.fileno(), follow=False)
+        return chart
+    
+    with open(source, "rb") as f:
+        chart.run(f.fileno(), follow=True if follow is None else follow)
+    return chart
+
+
+# ---------------------------------------------------------------------------
+# Framebuffer dashboards
+# ---------------------------------------------------------------------------
+
+SHADES = " ░▒▓█"
+STACK_SYMBOLS = "█▓▒░▪●"
+
+
+class Framebuffer:
+    """Preallocated character grid that several charts can draw into.
+    
+    Every cell holds one single-width character and an optional style
+    escape. Charts draw into rectangular Regions of the grid, and the
+    finished frame is emitted with a single write, merging runs of
+    cells that share a style.
+    """
+    
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.chars = [" "] * (cols * rows)
+        self.styles = [""] * (cols * rows)
+    
+    def clear(self):
+        """Blank every cell in place"""
+        self.chars[:] = [" "] * len(self.chars)
+        self.styles[:] = [""] * len(self.styles)
+    
+    def region(self, x=0, y=0, width=None, height=None):
+        """Return a clipped drawing area with its own origin"""
+        width = self.cols - x if width is None else width
+        height = self.rows - y if height is None else height
+        return Region(self, x, y, width, height)
+    
+    def render(self):
+        """Return the whole frame as one string"""
+        lines = []
+        for row in range(self.rows):
+            start = row * self.cols
+            end = start + self.cols
+            while end > start and self.chars[end - 1] == " " and not self.styles[end - 1]:
+                end -= 1
+            chars = self.chars[start:end]
+            styles = self.styles[start:end]
+            if not any(styles):
+                lines.append("".join(chars))
+                continue
+            
+            parts = []
+            current = ""
+            for char, style in zip(chars, styles):
+                if style != current:
+                    parts.append(style or RESET)
+                    current = style
+                parts.append(char)
+            if current:
+                parts.append(RESET)
+            lines.append("".join(parts))
+        return "\n".join(lines)
+    
+    def flush(self, fd=None, home=False):
+        """Write the frame to the terminal in one syscall"""
+        frame = ("\033[H" if home else "") + self.render() + "\n"
+        data = frame.encode()
+        fd = sys.stdout.fileno() if fd is None else fd
+        sys.stdout.flush()
+        while data:
+            data = data[os.write(fd, data):]
+
+
+class Region:
+    """Rectangular window onto a Framebuffer; drawing outside it is clipped"""
+    
+    def __init__(self, fb, x, y, width, height):
+        self.fb = fb
+        self.x = x
+        self.y = y
+        self.width = max(min(width, fb.cols - x), 0)
+        self.height = max(min(height, fb.rows - y), 0)
+    
+    def put(self, x, y, char, style=""):
+        """Set one cell"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = (self.y + y) * self.fb.cols + self.x + x
+            self.fb.chars[i] = char
+            self.fb.styles[i] = style
+    
+    def text(self, x, y, string, style=""):
+        """Write a string starting at (x, y), clipped to the region"""
+        if not 0 <= y < self.height:
+            return
+        string = string[max(-x, 0):max(self.width - x, 0)]
+        x = max(x, 0)
+        i = (self.y + y) * self.fb.cols + self.x + x
+        self.fb.chars[i:i + len(string)] = string
+        self.fb.styles[i:i + len(string)] = [style] * len(string)
+    
+    def sub(self, x, y, width, height):
+        """Return a nested region relative to this one"""
+        width = min(width, self.width - x)
+        height = min(height, self.height - y)
+        return Region(self.fb, self.x + x, self.y + y, width, height)
+    
+    def box(self, title=""):
+        """Draw a border with a title and return the region inside it"""
+        w, h = self.width, self.height
+        if w < 2 or h < 2:
+            return self.sub(0, 0, 0, 0)
+        self.text(0, 0, "┌" + "─" * (w - 2) + "┐")
+        for row in range(1, h - 1):
+            self.put(0, row, "│")
+            self.put(w - 1, row, "│")
+        self.text(0, h - 1, "└" + "─" * (w - 2) + "┘")
+        if title:
+            self.text(2, 0, f" {title} "[:w - 4])
+        return self.sub(1, 1, w - 2, h - 2)
+
+
+def block_average(matrix, rows, cols):
+    """Shrink a 2D matrix to at most rows x cols by averaging blocks"""
+    if np is not None:
+        m = np.asarray(matrix, dtype=np.float64)
+        rows, cols = min(rows, m.shape[0]), min(cols, m.shape[1])
+        row_edges = np.arange(rows) * m.shape[0] // rows
+        col_edges = np.arange(cols) * m.shape[1] // cols
+        sums = np.add.reduceat(np.add.reduceat(m, row_edges, axis=0), col_edges, axis=1)
+        sizes = np.outer(np.diff(np.append(row_edges, m.shape[0])),
+                         np.diff(np.append(col_edges, m.shape[1])))
+        return (sums / sizes).tolist()
+    
+    height, width = len(matrix), len(matrix[0])
+    rows, cols = min(rows, height), min(cols, width)
+    row_edges = [r * height // rows for r in range(rows + 1)]
+    col_edges = [c * width // cols for c in range(cols + 1)]
+    result = []
+    for r0, r1 in zip(row_edges, row_edges[1:]):
+        # Sum each column over the row block once, then over column blocks
+        column_sums = [sum(col) for col in zip(*matrix[r0:r1])]
+        row = []
+        for c0, c1 in zip(col_edges, col_edges[1:]):
+            row.append(sum(column_sums[c0:c1]) / ((r1 - r0) * (c1 - c0)))
+        result.append(row)
+    return result
+
+
+def draw_bars(region, data, title="Bar Chart"):
+    """Draw a horizontal bar chart into a region"""
+    area = region.box(title)
+    if not data or area.width < 4:
+        return
+    label_width = min(max(len(str(label)) for label in data), area.width // 3)
+    peak = max(max(data.values()), 0) or 1
+    value_width = max(len(f"{value:g}") for value in data.values())
+    room = max(area.width - label_width - value_width - 2, 1)
+    for row, (label, value) in enumerate(list(data.items())[:area.height]):
+        bar = "█" * int(max(value, 0) / peak * room)
+        area.text(0, row, f"{str(label)[:label_width]:{label_width}} {bar} {value:g}")
+
+
+def draw_stacked_bars(region, data, title="Stacked Bars"):
+    """Draw bars made of several stacked segments
+    
+    `data` maps each bar label to a dict of segment name -> value.
+    """
+    area = region.box(title)
+    if not data or area.width < 4:
+        return
+    segments = []
+    for parts in data.values():
+        for name in parts:
+            if name not in segments:
+                segments.append(name)
+    
+    label_width = min(max(len(str(label)) for label in data), area.width // 3)
+    totals = [sum(parts.values()) for parts in data.values()]
+    peak = max(totals) or 1
+    room = max(area.width - label_width - max(len(f"{t:g}") for t in totals) - 2, 1)
+    
+    for row, (label, parts) in enumerate(list(data.items())[:area.height - 1]):
+        area.text(0, row, f"{str(label)[:label_width]:{label_width}}")
+        x = label_width + 1
+        for name, value in parts.items():
+            i = segments.index(name)
+            length = int(round(value / peak * room))
+            area.text(x, row, STACK_SYMBOLS[i % len(STACK_SYMBOLS)] * length,
+                      SERIES_COLORS[i % len(SERIES_COLORS)])
+            x += length
+        area.text(x + 1, row, f"{sum(parts.values()):g}")
+    
+    legend_x = 0
+    for i, name in enumerate(segments):
+        entry = f"{STACK_SYMBOLS[i % len(STACK_SYMBOLS)]} {name}  "
+        area.text(legend_x, area.height - 1, entry, SERIES_COLORS[i % len(SERIES_COLORS)])
+        legend_x += len(entry)
+
+
+def draw_lines(region, series, title="Line Graph"):
+    """Draw one or more series on a braille canvas inside a region"""
+    area = region.box(title)
+    if not isinstance(series, dict):
+        series = {"series": series}
+    arrays = [as_numeric(values) for values in series.values()]
+    arrays = [values for values in arrays if len(values)]
+    if not arrays or area.width < 2 or area.height < 1:
+        return
+    
+    ranges = [value_range(values) for values in arrays]
+    low = min(r[0] for r in ranges)
+    high = max(r[1] for r in ranges)
+    
+    canvas = BrailleCanvas(area.width, area.height)
+    for index, values in enumerate(arrays):
+        canvas.plot(values, low, high, series=index)
+    
+    for row in range(canvas.rows):
+        text = canvas.row_text(row)
+        start = row * canvas.cols
+        for col, char in enumerate(text):
+            owner = canvas.owner[start + col]
+            if owner:
+                area.put(col, row, char, SERIES_COLORS[(owner - 1) % len(SERIES_COLORS)])
+    area.text(0, 0, f"{high:.4g}")
+    area.text(0, area.height - 1, f"{low:.4g}")
+
+
+def draw_histogram(region, values, title="Histogram"):
+    """Draw a histogram into a region, one bin per row"""
+    area = region.box(title)
+    values = as_numeric(values)
+    if len(values) == 0 or area.height < 1:
+        return
+    low, high = value_range(values)
+    counts = histogram_counts(values, area.height, low, high)
+    bin_width = (high - low) / len(counts)
+    peak = max(counts) or 1
+    room = max(area.width - 13 - len(str(peak)), 1)
+    for row, count in enumerate(counts):
+        bar = "█" * int(count / peak * room)
+        area.text(0, row, f"{low + row * bin_width:8.3g} | {bar} {count}")
+
+
+def draw_heatmap(region, matrix, title="Heatmap"):
+    """Draw a 2D matrix as shaded cells, block-averaging large inputs"""
+    area = region.box(title)
+    if len(matrix) == 0 or len(matrix[0]) == 0 or area.width < 1 or area.height < 1:
+        return
+    cells = block_average(matrix, area.height, area.width)
+    flat = [v for row in cells for v in row]
+    low, high = min(flat), max(flat)
+    span = (high - low) or 1
+    top = len(SHADES) - 1
+    for y, row in enumerate(cells):
+        area.text(0, y, "".join(SHADES[int((v - low) / span * top)] for v in row))
+
+
+def dashboard(panels, columns=2, cols=None, rows=None, panel_height=None):
+    """Lay out several charts in a grid on one framebuffer
+    
+    `panels` is a list of (draw_function, data, title) tuples, e.g.
+    (draw_heatmap, matrix, "Load"). Returns the filled Framebuffer;
+    call its flush() to send the whole dashboard in one write.
+    """
+    size = shutil.get_terminal_size()
+    cols = size.columns - 1 if cols is None else cols
+    grid_rows = -(-len(panels) // columns)
+    if panel_height is None:
+        panel_height = max(((size.lines - 2) if rows is None else rows) // max(grid_rows, 1), 6)
+    rows = panel_height * grid_rows if rows is None else rows
+    
+    fb = Framebuffer(cols, rows)
+    panel_width = cols // columns
+    for i, (draw, data, title) in enumerate(panels):
+        r, c = divmod(i, columns)
+        draw(fb.region(c * panel_width, r * panel_height, panel_width, panel_height), data, title)
+    return fb
+
+
+def dashboard_demo():
+    """Show a four-panel dashboard built on one framebuffer"""
+    import math
+    import random
+    
+    points = range(600)
+    series = {
+        'cpu': [50 + 30 * math.sin(i / 40) + random.uniform(-5, 5) for i in points],
+        'mem': [40 + 20 * math.cos(i / 90) for i in points],
+    }
+    usage = {
+        'web': {'user': 30, 'system': 12, 'io': 5},
+        'db': {'user': 22, 'system': 18, 'io': 25},
+        'cache': {'user': 10, 'system': 4, 'io': 2},
+        'batch': {'user': 45, 'system': 8, 'io': 12},
+    }
+    latencies = [random.lognormvariate(3, 0.4) for _ in range(20000)]
+    matrix = [[math.sin(r / 25) * math.cos(c / 40) + random.random() * 0.3
+               for c in range(400)] for r in range(240)]
+    
+    fb = dashboard([
+        (draw_lines, series, "CPU / Memory %"),
+        (draw_stacked_bars, usage, "Time by service"),
+        (draw_histogram, latencies, "Latency (ms)"),
+        (draw_heatmap, matrix, "Load heatmap 240x400"),
+    ], panel_height=12)
+    print()
+    fb.flush()
+
+
+# ---------------------------------------------------------------------------
+# File ingestion
+# ---------------------------------------------------------------------------
+
+NAN = float("nan")
+
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def infer_type(samples):
+    """Return 'int', 'float' or 'str' for a column from sample values"""
+    kind = "int"
+    for value in samples:
+        if value is None or value == "":
+            continue
+        if isinstance(value, bool):
+            return "str"
+        if isinstance(value, int):
+            continue
+        if isinstance(value, float):
+            kind = "float"
+            continue
+        if kind == "int":
+            try:
+                int(value)
+                continue
+            except (TypeError, ValueError):
+                kind = "float"
+        try:
+            float(value)
+        except (TypeError, ValueError):
+            return "str"
+    return kind
+
+
+def _exact_int(value):
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value!r} is not a whole number")
+    return int(value)
+
+
+def to_typed_array(raw, kind):
+    """Convert raw column values into array('q'), array('d') or a list"""
+    if kind == "str":
+        return ["" if v is None else str(v) for v in raw]
+    try:
+        if kind == "int":
+            return array("q", map(_exact_int, raw))
+        return array("d", map(float, raw))
+    except (TypeError, ValueError, OverflowError):
+        # Blanks, stray text or fractions in an int column (JSON 2.5 after
+        # a sample of whole numbers): fall back to floats, NaN for bad cells
+        return array("d", map(_parse_float, raw))
+
+
+class TabularFile:
+    """Chunked reader for CSV or JSON-lines files with inferred column types.
+    
+    Column types are guessed from the first `sample_rows` rows. Chunks are
+    parsed column by column straight into typed arrays, so memory per
+    chunk is a few bytes per cell and nothing holds the whole file.
+    """
+    
+    JSON_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+    
+    def __init__(self, path, sample_rows=1000, delimiter=","):
+        self.path = path
+        self.delimiter = delimiter
+        self.is_json = path.lower().endswith(self.JSON_EXTENSIONS)
+        
+        self.columns = []
+        samples = {}
+        for chunk in self._raw_chunks(sample_rows):
+            for name, raw in chunk.items():
+                samples[name] = raw
+            break
+        self.types = {name: infer_type(samples.get(name, [])) for name in self.columns}
+    
+    def _raw_chunks(self, chunk_rows, columns=None):
+        """Yield dicts of column name -> list of raw (unparsed) values"""
+        if self.is_json:
+            yield from self._raw_json_chunks(chunk_rows, columns)
+            return
+        
+        with open(self.path, newline="") as f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            header = next(reader, None)
+            if header is None:
+                return
+            self.columns = [name.strip() for name in header]
+            wanted = [(name, self.columns.index(name)) for name in (columns or self.columns)]
+            
+            while True:
+                rows = list(islice(reader, chunk_rows))
+                if not rows:
+                    break
+                chunk = {}
+                for name, i in wanted:
+                    try:
+                        chunk[name] = [row[i] for row in rows]
+                    except IndexError:
+                        chunk[name] = [row[i] if i < len(row) else "" for row in rows]
+                yield chunk
+    
+    def _raw_json_chunks(self, chunk_rows, columns=None):
+        with open(self.path) as f:
+            lines = (line for line in f if line.strip())
+            while True:
+                objects = [json.loads(line) for line in islice(lines, chunk_rows)]
+                if not objects:
+                    break
+                if not self.columns:
+                    for obj in objects:
+                        for key in obj:
+                            if key not in self.columns:
+                                self.columns.append(key)
+                yield {name: [obj.get(name) for obj in objects] for name in (columns or self.columns)}
+    
+    def chunks(self, columns=None, chunk_rows=65536):
+        """Yield dicts of column name -> typed array, one chunk at a time"""
+        for raw in self._raw_chunks(chunk_rows, columns):
+            yield {name: to_typed_array(values, self.types.get(name, "str")) for name, values in raw.items()}
+    
+    def column(self, name, chunk_rows=65536):
+        """Load one whole column as a typed array"""
+        kind = self.types.get(name, "str")
+        result = [] if kind == "str" else array("q" if kind == "int" else "d")
+        for chunk in self.chunks([name], chunk_rows):
+            values = chunk[name]
+            if isinstance(result, array) and result.typecode != values.typecode:
+                result = array("d", result)
+                values = array("d", values)
+            result.extend(values)
+        return result
+    
+    def numeric_values(self, name, chunk_rows=65536):
+        """Yield the non-missing numbers of a column, chunk by chunk"""
+        for chunk in self.chunks([name], chunk_rows):
+            values = chunk[name]
+            if isinstance(values, array) and values.typecode == "d":
+                values = array("d", (v for v in values if v == v))
+            yield values
+    
+    def group_by(self, key, value=None, agg="sum", chunk_rows=65536):
+        """Aggregate `value` per distinct `key` across the whole file
+        
+        `agg` is one of sum, count, mean, min or max. Without a value
+        column the rows in each group are counted. Raises ValueError for
+        a text value column unless only counting.
+        """
+        if value is not None and self.types.get(value) == "str":
+            if agg != "count":
+                raise ValueError(f"Column '{value}' is not numeric")
+            value = None
+        if value is None:
+            agg = "count"
+        columns = [key] if value is None else [key, value]
+        sums, counts, extremes = {}, {}, {}
+        
+        for chunk in self.chunks(columns, chunk_rows):
+            keys = chunk[key]
+            values = chunk[value] if value is not None else None
+            
+            if np is not None and agg in ("sum", "count", "mean"):
+                labels, inverse = np.unique(np.asarray(keys), return_inverse=True)
+                group_sums = None
+                if values is None:
+                    group_counts = np.bincount(inverse, minlength=len(labels))
+                else:
+                    weights = np.asarray(values, dtype=np.float64)
+                    valid = ~np.isnan(weights)
+                    group_counts = np.bincount(inverse, weights=valid, minlength=len(labels))
+                    group_sums = np.bincount(inverse, weights=np.where(valid, weights, 0.0),
+                                             minlength=len(labels))
+                for i, label in enumerate(labels.tolist()):
+                    counts[label] = counts.get(label, 0) + int(group_counts[i])
+                    if group_sums is not None:
+                        sums[label] = sums.get(label, 0.0) + float(group_sums[i])
+                continue
+            
+            if values is None:
+                for k in keys:
+                    counts[k] = counts.get(k, 0) + 1
+                continue
+            
+            for k, v in zip(keys, values):
+                if v != v:
+                    continue
+                counts[k] = counts.get(k, 0) + 1
+                sums[k] = sums.get(k, 0) + v
+                if agg in ("min", "max"):
+                    current = extremes.get(k)
+                    if current is None or (v < current if agg == "min" else v > current):
+                        extremes[k] = v
+        
+        if agg == "count":
+            return counts
+        if agg == "mean":
+            return {k: sums.get(k, 0) / counts[k] for k in counts if counts[k]}
+        if agg in ("min", "max"):
+            return extremes
+        return sums
+
+
+def plot_file(path, column, kind="histogram", group=None, agg="sum", bins=10):
+    """Chart a column of a CSV/JSONL file without loading every row at once
+    
+    kind is 'histogram' (streamed through StreamingHistogram), 'line'
+    (one typed array, downsampled to the terminal) or 'bar' (group-by
+    aggregation of `column` per distinct value of `group`).
+    """
+    table = TabularFile(path)
+    
+    if kind == "bar":
+        if group is None:
+            group, column = column, None
+        if column is not None and agg != "count" and table.types.get(column) == "str":
+            print(f"❌ Column '{column}' is not numeric!")
+            return
+        data = table.group_by(group, column, agg)
+        if len(data) > 20:
+            data = dict(sorted(data.items(), key=lambda item: item[1], reverse=True)[:20])
+        label = f"{agg} of {column}" if column else "count"
+        plot_bar_chart({str(k): round(v, 2) for k, v in data.items()}, f"{label} by {group}")
+        return
+    
+    if table.types.get(column) == "str":
+        print(f"❌ Column '{column}' is not numeric!")
+        return
+    
+    if kind == "line":
+        values = as_numeric(table.column(column))
+        if np is not None and isinstance(values, np.ndarray):
+            values = values[~np.isnan(values)] if values.dtype.kind == "f" else values
+        else:
+            values = [v for v in values if v == v]
+        plot_line_graph(values, f"{column} ({path})")
+        return
+    
+    sketch = StreamingHistogram()
+    for values in table.numeric_values(column):
+        sketch.extend(values)
+    sketch.plot(bins=bins, title=f"{column} ({path})")
+
+
+def chart_file_menu():
+    """Prompt for a data file and chart one of its columns"""
+    print("\n📂 Chart a CSV/JSONL File")
+    print("─"*50)
+    path = input("Path to file: ").strip()
+    
+    try:
+        table = TabularFile(path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read file: {e}")
+        return
+    
+    if not table.columns:
+        print("❌ No columns found!")
+        return
+    
+    print("\nColumns:")
+    for i, name in enumerate(table.columns, 1):
+        print(f"  {i}. {name} ({table.types[name]})")
+    
+    def pick(prompt):
+        try:
+            return table.columns[int(input(prompt).strip()) - 1]
+        except (ValueError, IndexError):
+            return None
+    
+    column = pick("\nColumn to chart: ")
+    if column is None:
+        print("❌ Invalid column!")
+        return
+    
+    print("\nChart type:")
+    print("  1. Histogram")
+    print("  2. Line Graph")
+    print("  3. Bar Chart (group by another column)")
+    kind = input("\nYour choice (1-3): ").strip()
+    
+    if kind == "1":
+        plot_file(path, column, "histogram")
+    elif kind == "2":
+        plot_file(path, column, "line")
+    elif kind == "3":
+        group = pick("Group by column: ")
+        if group is None:
+            print("❌ Invalid column!")
+            return
+        agg = input("Aggregate - sum, mean, count, min, max [sum]: ").strip().lower() or "sum"
+        if agg not in ("sum", "mean", "count", "min", "max"):
+            print("❌ Invalid aggregate!")
+            return
+        plot_file(path, column, "bar", group=group, agg=agg)
+    else:
+        print("❌ Invalid choice!")
+
+
 def create_custom_chart():
     """Allow user to create a custom chart"""
     print("\n📊 Create Custom Chart")
@@ -194,6 +1754,35 @@ def create_custom_chart():
         print("❌ Invalid choice!")
 
 
+def streaming_histogram_demo():
+    """Build a histogram from a file, or from merged random worker sketches"""
+    import random
+    
+    print("\n🌊 Streaming Histogram")
+    print("─"*50)
+    path = input("Path to a file of numbers (Enter for a random demo): ").strip()
+    
+    if path:
+        sketch = StreamingHistogram()
+        try:
+            sketch.extend_from_file(path)
+        except OSError as e:
+            print(f"❌ Could not read file: {e}")
+            return
+        title = f"Streaming Histogram of {path}"
+    else:
+        # Four independent "workers" each sketch part of the data, then merge
+        sketch = StreamingHistogram()
+        for worker in range(4):
+            partial = StreamingHistogram()
+            partial.extend(random.gauss(50 + worker * 5, 15) for _ in range(50000))
+            sketch.merge(partial)
+        title = "Merged Streaming Histogram (4 workers, 200,000 values)"
+    
+    sketch.plot(bins=10, title=title)
+    sketch.plot_box(title="Box Plot Summary")
+
+
 def run():
     """Main function for simple graph plotter"""
     
@@ -208,6 +1797,11 @@ def run():
         print("  4. Sample Histogram")
         print("  5. Create Custom Chart")
         print("  6. Random Data Visualization")
+        print("  7. Streaming Histogram & Box Plot")
+        print("  8. High-Resolution Line Graph (braille)")
+        print("  9. Live Chart from File")
+        print(" 10. Dashboard (multiple charts)")
+        print(" 11. Chart a CSV/JSONL File")
         print("  0. Return to Main Menu")
         
         choice = input("\nYour choice: ").strip()
@@ -293,10 +1887,66 @@ def run():
             
             input("\nPress Enter to continue...")
         
+        elif choice == "7":
+            streaming_histogram_demo()
+            input("\nPress Enter to continue...")
+        
+        elif choice == "8":
+            import math
+            points = range(400)
+            series = {
+                'sin': [math.sin(i / 20) for i in points],
+                'cos': [math.cos(i / 30) * 0.8 for i in points],
+                'damped': [math.sin(i / 8) * math.exp(-i / 150) for i in points],
+            }
+            plot_braille_graph(series, "Waves (braille, 8x resolution)")
+            input("\nPress Enter to continue...")
+        
+        elif choice == "9":
+            path = input("\nFile to watch (numbers are read as they are appended): ").strip()
+            mode = input("Mode - sparkline, line or histogram [sparkline]: ").strip().lower() or "sparkline"
+            if mode not in LiveChart.MODES:
+                print("❌ Invalid mode!")
+                time.sleep(1)
+                continue
+            print("Press Ctrl+C to stop watching")
+            time.sleep(1)
+            try:
+                live_chart(path, mode=mode)
+            except OSError as e:
+                print(f"❌ Could not open file: {e}")
+            input("\nPress Enter to continue...")
+        
+        elif choice == "10":
+            dashboard_demo()
+            input("\nPress Enter to continue...")
+        
+        elif choice == "11":
+            chart_file_menu()
+            input("\nPress Enter to continue...")
+        
         else:
             print("❌ Invalid choice!")
             time.sleep(1)
 
 
+def main(argv=None):
+    """Command-line entry point: the menu, or a live chart of piped data"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Simple Graph Plotter")
+    parser.add_argument("file", nargs="?", help="file to tail (default: stdin)")
+    parser.add_argument("--live", choices=LiveChart.MODES, help="show a live chart of incoming numbers")
+    parser.add_argument("--fps", type=float, default=10, help="maximum redraws per second")
+    parser.add_argument("--window", type=int, default=2000, help="number of recent points to keep")
+    args = parser.parse_args(argv)
+    
+    if args.live is None and args.file is None and sys.stdin.isatty():
+        run()
+        return
+    
+    live_chart(args.file, mode=args.live or "sparkline", fps=args.fps, window=args.window)
+
+
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    main()
\ No newline at end of file
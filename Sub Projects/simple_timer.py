@@ -4,30 +4,119 @@ Simple Timer
 Countdown timer and stopwatch with multiple features
 """
 
+import asyncio
+import functools
+import json
+import math
+import os
+import selectors
+import threading
 import time
 import sys
+import uuid
 
 
-def countdown_timer(seconds):
-    """Countdown from specified seconds"""
+class JitterStats:
+    """Running statistics of how late each tick fired, in nanoseconds"""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+    
+    def add(self, late_ns):
+        """Record one measurement (Welford's online algorithm)"""
+        self.count += 1
+        delta = late_ns - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (late_ns - self.mean)
+        if self.min is None or late_ns < self.min:
+            self.min = late_ns
+        if self.max is None or late_ns > self.max:
+            self.max = late_ns
+    
+    def stddev(self):
+        """Standard deviation of the lateness"""
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+    
+    def summary(self):
+        """One-line human readable report in milliseconds"""
+        if not self.count:
+            return "no ticks measured"
+        return (f"{self.count} ticks, jitter mean {self.mean / 1e6:.3f} ms, "
+                f"stddev {self.stddev() / 1e6:.3f} ms, max {self.max / 1e6:.3f} ms")
+
+
+class DeadlineScheduler:
+    """Fires ticks on absolute monotonic deadlines.
+    
+    Tick n is due at start + n * interval, so time spent printing or
+    formatting between ticks never accumulates into drift. How late
+    each tick actually woke up is recorded in `jitter`.
+    """
+    
+    def __init__(self, interval=1.0):
+        self.interval_ns = int(round(interval * 1_000_000_000))
+        self.start_ns = None
+        self.ticks = 0
+        self.jitter = JitterStats()
+    
+    def start(self):
+        """Set tick 0 to now"""
+        self.start_ns = time.monotonic_ns()
+        self.ticks = 0
+    
+    def deadline(self, tick):
+        """Absolute monotonic time (ns) at which `tick` is due"""
+        return self.start_ns + tick * self.interval_ns
+    
+    def wait_next(self):
+        """Sleep until the next tick is due and return its number"""
+        if self.start_ns is None:
+            self.start()
+        self.ticks += 1
+        deadline = self.deadline(self.ticks)
+        remaining = deadline - time.monotonic_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1_000_000_000)
+        self.jitter.add(time.monotonic_ns() - deadline)
+        return self.ticks
+
+
+def format_duration(seconds):
+    """Format whole seconds as MM:SS, or HH:MM:SS past an hour"""
+    mins, secs = divmod(seconds, 60)
+    hours, mins = divmod(mins, 60)
+    if hours > 0:
+        return f'{hours:02d}:{mins:02d}:{secs:02d}'
+    return f'{mins:02d}:{secs:02d}'
+
+
+def countdown_timer(seconds, show_jitter=True, on_checkpoint=None):
+    """Countdown from specified seconds
+    
+    Returns the seconds still left: 0 once the countdown reached zero
+    (even if Ctrl+C cut the beeps short), more if it was stopped early.
+    `on_checkpoint(remaining)` is called after every tick.
+    """
     print(f"\n⏱️  Starting {seconds} second countdown...\n")
     
+    scheduler = DeadlineScheduler(1.0)
+    scheduler.start()
+    remaining = seconds
+    
     try:
-        while seconds > 0:
-            mins, secs = divmod(seconds, 60)
-            hours, mins = divmod(mins, 60)
-            
-            # Format time display
-            if hours > 0:
-                timeformat = f'{hours:02d}:{mins:02d}:{secs:02d}'
-            else:
-                timeformat = f'{mins:02d}:{secs:02d}'
-            
-            print(f'\r⏱️  {timeformat}', end='', flush=True)
-            time.sleep(1)
-            seconds -= 1
+        while remaining > 0:
+            print(f'\r⏱️  {format_duration(remaining)}', end='', flush=True)
+            remaining = seconds - scheduler.wait_next()
+            if on_checkpoint is not None:
+                on_checkpoint(remaining)
         
         print('\r⏱️  00:00    ')
+        if show_jitter:
+            print(f'📏 Timing: {scheduler.jitter.summary()}')
         print('\n🔔 TIME\'S UP! 🔔\n')
         
         # Beep sound (text)
@@ -38,60 +127,437 @@ def countdown_timer(seconds):
         
     except KeyboardInterrupt:
         print('\n\n⏸️  Timer stopped!')
+        return max(remaining, 0)
+    
+    return 0
+
+
+def format_ns(ns, digits=9):
+    """Format nanoseconds as HH:MM:SS with `digits` fractional digits"""
+    secs, frac = divmod(ns, 1_000_000_000)
+    mins, secs = divmod(secs, 60)
+    hours, mins = divmod(mins, 60)
+    text = f'{hours:02d}:{mins:02d}:{secs:02d}'
+    if digits:
+        text += '.' + f'{frac:09d}'[:digits]
+    return text
+
+
+class Stopwatch:
+    """Stopwatch that keeps nothing but perf_counter_ns timestamps"""
+    
+    def __init__(self):
+        self.start_ns = None
+        self.stop_ns = None
+        self.laps = []
+    
+    def start(self):
+        """Start timing from now"""
+        self.start_ns = time.perf_counter_ns()
+        self.stop_ns = None
+        self.laps = []
+    
+    def elapsed(self, now_ns=None):
+        """Nanoseconds since start (frozen once stopped)"""
+        if self.stop_ns is not None:
+            now_ns = self.stop_ns
+        elif now_ns is None:
+            now_ns = time.perf_counter_ns()
+        return now_ns - self.start_ns
+    
+    def lap(self, now_ns=None):
+        """Mark a lap; return (lap time, split time) in nanoseconds"""
+        now_ns = time.perf_counter_ns() if now_ns is None else now_ns
+        previous = self.laps[-1] if self.laps else self.start_ns
+        self.laps.append(now_ns)
+        return now_ns - previous, now_ns - self.start_ns
+    
+    def split(self, now_ns=None):
+        """Total time so far, without starting a new lap"""
+        return self.elapsed(now_ns)
+    
+    def stop(self):
+        """Freeze the stopwatch and return the total time"""
+        self.stop_ns = time.perf_counter_ns()
+        return self.stop_ns - self.start_ns
+
+
+class KeyReader:
+    """Non-blocking keyboard input for stdin built on selectors.
+    
+    On POSIX terminals stdin is switched to cbreak mode so single key
+    presses arrive without Enter. Where stdin cannot be watched (e.g.
+    Windows consoles) wait() simply sleeps and reports no keys.
+    """
+    
+    def __init__(self):
+        self.selector = None
+        self._saved = None
+    
+    def __enter__(self):
+        if os.name == 'nt':
+            return self
+        try:
+            self.fd = sys.stdin.fileno()
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.fd, selectors.EVENT_READ)
+        except (AttributeError, ValueError, OSError):
+            self.selector = None
+            return self
+        
+        if sys.stdin.isatty():
+            try:
+                import termios
+                import tty
+                self._saved = termios.tcgetattr(self.fd)
+                tty.setcbreak(self.fd)
+            except (ImportError, OSError):
+                self._saved = None
+        return self
+    
+    def wait(self, timeout):
+        """Block until a key arrives or `timeout` seconds pass"""
+        if self.selector is None:
+            time.sleep(1.0 if timeout is None else timeout)
+            return ''
+        if not self.selector.select(timeout):
+            return ''
+        data = os.read(self.fd, 64)
+        if not data:
+            # End of input: stop watching stdin, keep the timing going
+            self.selector.unregister(self.fd)
+            self.selector = None
+        return data.decode(errors='ignore')
+    
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved)
+        if self.selector is not None:
+            self.selector.close()
+        return False
 
 
-def stopwatch():
-    """Simple stopwatch"""
+def stopwatch(refresh_hz=10):
+    """Stopwatch with laps and splits that redraws only when the display changes
+    
+    The display refreshes at most `refresh_hz` times a second (0 means
+    only when a key is pressed); lap and split times are exact to the
+    nanosecond whatever the refresh rate.
+    """
     print("\n⏱️  Stopwatch Started!")
-    print("Press Ctrl+C to stop\n")
+    print("Press L for a lap, S for a split, Q or Ctrl+C to stop\n")
+    
+    watch = Stopwatch()
+    digits = 1 if refresh_hz <= 10 else 2
+    interval_ns = int(1_000_000_000 / refresh_hz) if refresh_hz > 0 else None
+    shown = None
     
-    start_time = time.time()
+    def draw(now_ns):
+        nonlocal shown
+        text = format_ns(watch.elapsed(now_ns), digits)
+        if text != shown:
+            print(f'\r⏱️  {text}', end='', flush=True)
+            shown = text
     
     try:
-        while True:
-            elapsed = time.time() - start_time
-            
-            hours, remainder = divmod(int(elapsed), 3600)
-            mins, secs = divmod(remainder, 60)
+        with KeyReader() as keys:
+            watch.start()
+            next_draw = watch.start_ns
+            running = True
             
-            # Include milliseconds
-            millisecs = int((elapsed - int(elapsed)) * 100)
-            
-            timeformat = f'{hours:02d}:{mins:02d}:{secs:02d}.{millisecs:02d}'
-            
-            print(f'\r⏱️  {timeformat}', end='', flush=True)
-            time.sleep(0.01)
+            while running:
+                now = time.perf_counter_ns()
+                if interval_ns is not None and now >= next_draw:
+                    draw(now)
+                    next_draw += interval_ns
+                    if next_draw <= now:
+                        next_draw = now + interval_ns
+                
+                timeout = None
+                if interval_ns is not None:
+                    timeout = max(next_draw - time.perf_counter_ns(), 0) / 1_000_000_000
+                pressed = keys.wait(timeout)
+                stamp = time.perf_counter_ns()
+                
+                for key in pressed.lower():
+                    if key == 'l':
+                        lap_ns, split_ns = watch.lap(stamp)
+                        print(f'\r🏁 Lap {len(watch.laps)}: {format_ns(lap_ns)}'
+                              f'  (split {format_ns(split_ns)})')
+                        shown = None
+                    elif key == 's':
+                        print(f'\r📍 Split: {format_ns(watch.split(stamp))}')
+                        shown = None
+                    elif key == 'q':
+                        running = False
+                        break
+                    if interval_ns is None:
+                        draw(stamp)
     
     except KeyboardInterrupt:
-        print('\n')
-        final_time = time.time() - start_time
-        hours, remainder = divmod(int(final_time), 3600)
-        mins, secs = divmod(remainder, 60)
-        millisecs = int((final_time - int(final_time)) * 100)
+        pass
+    
+    final_time = watch.stop()
+    print('\n')
+    print(f'⏹️  Final Time: {format_ns(final_time)}\n')
+    
+    if watch.laps:
+        print("Laps:")
+        previous = watch.start_ns
+        for i, stamp in enumerate(watch.laps, 1):
+            print(f"  {i:3}. {format_ns(stamp - previous)}  (split {format_ns(stamp - watch.start_ns)})")
+            previous = stamp
+        print()
+    
+    return watch
+
+
+JOURNAL_PATH = os.path.join(os.path.expanduser("~"), ".simple_timer_journal.jsonl")
+
+
+class TimerJournal:
+    """Append-only journal of timer events with batched fsync.
+    
+    Each line is one JSON event (start, tick, pause, resume, complete or
+    snapshot) for a timer id. Lines are flushed as they are written but
+    only fsynced every `fsync_interval` seconds, or at once for events
+    that must survive a crash. Once the file passes `compact_after`
+    lines it is rewritten in a background thread as one snapshot per
+    unfinished timer, so replay stays quick.
+    """
+    
+    def __init__(self, path=JOURNAL_PATH, fsync_interval=2.0, compact_after=5000):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.compact_after = compact_after
+        self.lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._last_sync = time.monotonic()
+        self._dirty = False
+        self._compacting = None
+        with open(path, encoding='utf-8') as f:
+            self.lines = sum(1 for _ in f)
+    
+    def record(self, timer_id, event, durable=False, **fields):
+        """Append one event; `durable` forces an fsync before returning"""
+        entry = {'id': timer_id, 'ev': event, 'wall': time.time()}
+        entry.update(fields)
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        
+        with self.lock:
+            self._file.write(line)
+            self._file.flush()
+            self._dirty = True
+            self.lines += 1
+            if durable or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+        
+        if self.lines > self.compact_after:
+            self.compact_in_background()
+    
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+        self._dirty = False
+    
+    def replay(self):
+        """Rebuild the latest state of every timer from the journal"""
+        with self.lock:
+            self._file.flush()
+            return self._replay()
+    
+    def _replay(self):
+        states = {}
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crash mid-line
+                
+                event = entry.pop('ev', None)
+                timer_id = entry.pop('id', None)
+                if event in ('start', 'snapshot'):
+                    state = dict(entry)
+                    state.setdefault('status', 'running')
+                    states[timer_id] = state
+                    continue
+                
+                state = states.get(timer_id)
+                if state is None:
+                    continue
+                if event == 'complete':
+                    state['status'] = 'complete'
+                    continue
+                for key in ('phase', 'remaining'):
+                    if key in entry:
+                        state[key] = entry[key]
+                state['wall'] = entry.get('wall', state.get('wall'))
+                state['status'] = 'paused' if event == 'pause' else 'running'
         
-        print(f'⏹️  Final Time: {hours:02d}:{mins:02d}:{secs:02d}.{millisecs:02d}\n')
+        for timer_id, state in states.items():
+            state['id'] = timer_id
+        return states
+    
+    def unfinished(self):
+        """Timers that were paused or cut off before completing"""
+        states = self.replay().values()
+        return sorted((s for s in states if s['status'] != 'complete'), key=lambda s: s.get('wall', 0))
+    
+    def compact(self):
+        """Rewrite the journal as one snapshot line per unfinished timer"""
+        with self.lock:
+            self._file.flush()
+            states = self._replay()
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as tmp:
+                count = 0
+                for timer_id, state in states.items():
+                    if state['status'] == 'complete':
+                        continue
+                    entry = {'id': timer_id, 'ev': 'snapshot'}
+                    entry.update((k, v) for k, v in state.items() if k != 'id')
+                    tmp.write(json.dumps(entry, separators=(',', ':')) + '\n')
+                    count += 1
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            
+            self._file.close()
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            self.lines = count
+            self._last_sync = time.monotonic()
+            self._dirty = False
+    
+    def compact_in_background(self):
+        """Start compaction on a daemon thread unless one is running"""
+        if self._compacting is not None and self._compacting.is_alive():
+            return
+        self._compacting = threading.Thread(target=self.compact, daemon=True)
+        self._compacting.start()
+    
+    def close(self):
+        """Wait for compaction, fsync anything pending and close the file"""
+        if self._compacting is not None:
+            self._compacting.join()
+        with self.lock:
+            if self._dirty:
+                self._sync()
+            self._file.close()
+
+
+_journal = None
+
+
+def get_journal():
+    """Open the shared journal once; None if it can't be written"""
+    global _journal
+    if _journal is None:
+        try:
+            _journal = TimerJournal()
+        except OSError as e:
+            print(f"⚠️  Timer journal unavailable ({e}); progress won't be saved.")
+            _journal = False
+    return _journal or None
 
 
-def pomodoro_timer():
-    """Pomodoro technique timer (25 min work, 5 min break)"""
+class JournaledTimer:
+    """A countdown, interval set or pomodoro session backed by the journal.
+    
+    Progress is checkpointed on every tick. After a crash the timer is
+    resumed from the remaining time of its last checkpoint, which was
+    measured on the monotonic clock; downtime is not counted.
+    """
+    
+    def __init__(self, journal, kind, name, phases, timer_id=None, **meta):
+        self.journal = journal
+        self.kind = kind
+        self.name = name
+        self.phases = [tuple(phase) for phase in phases]
+        self.id = timer_id or uuid.uuid4().hex[:12]
+        self.meta = meta
+    
+    @classmethod
+    def from_state(cls, journal, state):
+        """Rebuild a timer from a replayed journal state"""
+        meta = {k: v for k, v in state.items()
+                if k not in ('id', 'kind', 'name', 'phases', 'phase', 'remaining', 'status', 'wall')}
+        return cls(journal, state['kind'], state['name'], state['phases'], state['id'], **meta)
+    
+    def _record(self, event, durable=False, **fields):
+        if self.journal is not None:
+            self.journal.record(self.id, event, durable=durable, **fields)
+    
+    def begin(self):
+        """Record the start of the timer"""
+        self._record('start', durable=True, kind=self.kind, name=self.name,
+                     phases=self.phases, phase=0, remaining=self.phases[0][1], **self.meta)
+        return self
+    
+    def run_phase(self, phase, seconds=None):
+        """Count down one phase, checkpointing; return the seconds left.
+        
+        Anything but 0 means the phase was paused, and callers should stop
+        there rather than move on or complete the timer.
+        """
+        seconds = self.phases[phase][1] if seconds is None else seconds
+        
+        def checkpoint(remaining):
+            self._record('tick', phase=phase, remaining=remaining)
+        
+        self._record('resume', phase=phase, remaining=seconds)
+        remaining = countdown_timer(seconds, on_checkpoint=checkpoint)
+        if remaining:
+            self._record('pause', durable=True, phase=phase, remaining=remaining)
+            if self.journal is not None:
+                print("💾 Progress saved - pick it up again with 'Resume Unfinished Timer'.")
+        return remaining
+    
+    def complete(self):
+        """Record that the timer finished (or was abandoned)"""
+        self._record('complete', durable=True)
+
+
+def pomodoro_timer(start_session=1, resume=None):
+    """Pomodoro technique timer (25 min work, 5 min break)
+    
+    `resume` is an optional (JournaledTimer, phase, remaining) tuple used
+    to pick up an interrupted session from the journal.
+    """
     print("\n🍅 POMODORO TIMER")
     print("="*50)
     print("Work: 25 minutes | Break: 5 minutes")
     print("="*50)
     
-    session = 1
+    session = start_session
+    journal = get_journal()
     
     try:
         while True:
-            print(f"\n📚 Session {session} - WORK TIME (25 minutes)")
-            countdown_timer(25 * 60)
+            if resume is not None:
+                timer, phase, remaining = resume
+                resume = None
+            else:
+                timer = JournaledTimer(journal, 'pomodoro', f"Pomodoro session {session}",
+                                       [("Work", 25 * 60), ("Break", 5 * 60)], session=session).begin()
+                phase, remaining = 0, None
             
-            take_break = input("\nTake a 5-minute break? (y/n): ").strip().lower()
-            if take_break != 'y':
-                break
+            if phase == 0:
+                print(f"\n📚 Session {session} - WORK TIME (25 minutes)")
+                if timer.run_phase(0, remaining):
+                    return
+                
+                take_break = input("\nTake a 5-minute break? (y/n): ").strip().lower()
+                if take_break != 'y':
+                    timer.complete()
+                    break
+                remaining = None
             
             print(f"\n☕ Session {session} - BREAK TIME (5 minutes)")
-            countdown_timer(5 * 60)
+            if timer.run_phase(1, remaining):
+                return
+            timer.complete()
             
             session += 1
             
@@ -105,6 +571,27 @@ def pomodoro_timer():
         print(f"\n\n⏸️  Pomodoro stopped after {session} session(s)!")
 
 
+def run_intervals(timer, start_phase=0, first_remaining=None):
+    """Run the phases of an interval timer, optionally mid-way through"""
+    intervals = timer.phases
+    
+    try:
+        for i in range(start_phase, len(intervals)):
+            name, duration = intervals[i]
+            print(f"\n▶️  Interval {i + 1}/{len(intervals)}: {name}")
+            if timer.run_phase(i, first_remaining if i == start_phase else None):
+                return
+            
+            if i + 1 < len(intervals):
+                input("Press Enter for next interval...")
+        
+        timer.complete()
+        print("\n🎉 All intervals complete!")
+    
+    except KeyboardInterrupt:
+        print("\n\n⏸️  Interval timer stopped!")
+
+
 def interval_timer():
     """Create custom interval timer"""
     print("\n⏱️  INTERVAL TIMER")
@@ -152,18 +639,59 @@ def interval_timer():
     if start != 'y':
         return
     
+    timer = JournaledTimer(get_journal(), 'interval', "Interval timer", intervals).begin()
+    run_intervals(timer)
+
+
+def countdown_with_journal(seconds, name="Countdown"):
+    """Run a single countdown that can be resumed after a crash"""
+    timer = JournaledTimer(get_journal(), 'countdown', name, [(name, seconds)]).begin()
+    if timer.run_phase(0) == 0:
+        timer.complete()
+
+
+def resume_timer():
+    """List unfinished timers from the journal and resume one"""
+    journal = get_journal()
+    if journal is None:
+        return
+    
+    pending = journal.unfinished()
+    if not pending:
+        print("\n✅ No unfinished timers to resume!")
+        return
+    
+    print("\n♻️  UNFINISHED TIMERS")
+    print("="*50)
+    for i, state in enumerate(pending, 1):
+        phase_name = state['phases'][state['phase']][0]
+        status = "paused" if state['status'] == 'paused' else "interrupted"
+        print(f"  {i}. {state['name']} - {phase_name}: "
+              f"{format_duration(state['remaining'])} left ({status})")
+    print("  0. Back")
+    
     try:
-        for i, (name, duration) in enumerate(intervals, 1):
-            print(f"\n▶️  Interval {i}/{len(intervals)}: {name}")
-            countdown_timer(duration)
-            
-            if i < len(intervals):
-                input("Press Enter for next interval...")
-        
-        print("\n🎉 All intervals complete!")
+        choice = int(input("\nResume which timer? ").strip())
+    except ValueError:
+        print("❌ Invalid choice!")
+        return
+    if choice == 0:
+        return
+    if not 1 <= choice <= len(pending):
+        print("❌ Invalid choice!")
+        return
     
-    except KeyboardInterrupt:
-        print("\n\n⏸️  Interval timer stopped!")
+    state = pending[choice - 1]
+    timer = JournaledTimer.from_state(journal, state)
+    phase, remaining = state['phase'], state['remaining']
+    
+    if timer.kind == 'pomodoro':
+        pomodoro_timer(start_session=timer.meta.get('session', 1), resume=(timer, phase, remaining))
+    elif timer.kind == 'interval':
+        run_intervals(timer, phase, remaining)
+    else:
+        if timer.run_phase(phase, remaining) == 0:
+            timer.complete()
 
 
 def quick_timer():
@@ -189,11 +717,647 @@ def quick_timer():
     if choice in presets:
         name, duration = presets[choice]
         print(f"\n🎯 Starting {name} timer...")
-        countdown_timer(duration)
+        countdown_with_journal(duration, f"{name} timer")
     else:
         print("❌ Invalid choice!")
 
 
+class TimerHandle:
+    """A timer scheduled on a TimingWheel; pass it to cancel()"""
+    
+    __slots__ = ('expires', 'interval', 'callback', 'args', 'bucket', 'deadline_ns')
+    
+    def __init__(self, expires, interval, callback, args, deadline_ns):
+        self.expires = expires
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self.bucket = None
+        self.deadline_ns = deadline_ns
+    
+    @property
+    def active(self):
+        """True while the timer is still waiting to fire"""
+        return self.bucket is not None
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with O(1) insert and cancel.
+    
+    Time is counted in integer ticks. Level 0 has one bucket per tick;
+    each higher level has buckets `slots` times wider. A timer goes into
+    the lowest level whose span covers its delay, and is cascaded down a
+    level when the wheel below wraps around to its bucket. Timers too far
+    out for the top level wait in an overflow set.
+    """
+    
+    def __init__(self, slots=256, levels=4):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.bits = slots.bit_length() - 1
+        self.mask = slots - 1
+        self.levels = levels
+        self.spans = [slots ** level for level in range(levels + 1)]
+        self.wheels = [[set() for _ in range(slots)] for _ in range(levels)]
+        self.overflow = set()
+        self.current = 0
+        self.pending = 0
+    
+    def add(self, handle):
+        """Schedule a handle to expire at its `expires` tick"""
+        if handle.expires <= self.current:
+            # The current tick's bucket has already been emptied, so a
+            # late timer fires on the next tick instead
+            handle.expires = self.current + 1
+        self._place(handle)
+        self.pending += 1
+        return handle
+    
+    def cancel(self, handle):
+        """Remove a pending timer; cancelling twice is harmless"""
+        if handle.bucket is not None:
+            handle.bucket.discard(handle)
+            handle.bucket = None
+            self.pending -= 1
+        handle.interval = 0
+    
+    def _place(self, handle):
+        delta = handle.expires - self.current
+        for level in range(self.levels):
+            if delta < self.spans[level + 1]:
+                index = (handle.expires >> (self.bits * level)) & self.mask
+                bucket = self.wheels[level][index]
+                break
+        else:
+            bucket = self.overflow
+        bucket.add(handle)
+        handle.bucket = bucket
+    
+    def next_event(self):
+        """First tick at which advance() has anything to do, or None.
+        
+        That is the nearest filled level-0 bucket or the nearest boundary
+        where a filled higher-level bucket (or the overflow set) cascades;
+        every tick before it is a no-op that can be skipped.
+        """
+        if not self.pending:
+            return None
+        now = self.current
+        slots = self.mask + 1
+        due = None
+        wheel = self.wheels[0]
+        for tick in range(now + 1, now + slots + 1):
+            if wheel[tick & self.mask]:
+                due = tick
+                break
+        
+        for level in range(1, self.levels):
+            span = self.spans[level]
+            wheel = self.wheels[level]
+            tick = (now // span + 1) * span
+            for _ in range(slots):
+                if due is not None and tick >= due:
+                    break
+                if wheel[(tick >> (self.bits * level)) & self.mask]:
+                    due = tick
+                    break
+                tick += span
+        
+        if self.overflow:
+            top_span = self.spans[self.levels - 1]
+            boundary = (now // top_span + 1) * top_span
+            due = boundary if due is None else min(due, boundary)
+        return due
+    
+    def advance(self, tick):
+        """Move time forward to `tick` and return every expired handle.
+        
+        Repeating timers are re-armed before being returned, so callers
+        only need to fire the batch. Stretches of ticks with nothing to
+        expire or cascade are skipped in one step.
+        """
+        if not self.pending:
+            # Nothing to expire or cascade, so jump straight there
+            self.current = max(self.current, tick)
+            return []
+        
+        expired = []
+        top_span = self.spans[self.levels - 1]
+        
+        while self.current < tick:
+            due = self.next_event()
+            if due is None or due > tick:
+                self.current = tick
+                break
+            self.current = now = due
+            
+            # Cascade every level whose lower levels just wrapped, top first
+            level = 0
+            while level + 1 < self.levels and now % self.spans[level + 1] == 0:
+                level += 1
+            if level == self.levels - 1 and now % top_span == 0 and self.overflow:
+                waiting, self.overflow = self.overflow, set()
+                for handle in waiting:
+                    self._place(handle)
+            for lvl in range(level, 0, -1):
+                bucket = self.wheels[lvl][(now >> (self.bits * lvl)) & self.mask]
+                if bucket:
+                    moving = list(bucket)
+                    bucket.clear()
+                    for handle in moving:
+                        self._place(handle)
+            
+            bucket = self.wheels[0][now & self.mask]
+            if bucket:
+                batch = list(bucket)
+                bucket.clear()
+                for handle in batch:
+                    handle.bucket = None
+                    if handle.interval:
+                        handle.expires += handle.interval
+                        self._place(handle)
+                    else:
+                        self.pending -= 1
+                expired.extend(batch)
+        
+        return expired
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class TimerService:
+    """Runs many concurrent timers on one asyncio loop.
+    
+    Timers live in a TimingWheel with `tick` seconds of resolution. A
+    single background task sleeps until the wheel's next event (not
+    every tick, so a lone timer an hour out costs a handful of wakeups),
+    advances the wheel and fires every expired callback in one batch.
+    Callbacks may be plain functions or coroutine functions.
+    """
+    
+    def __init__(self, tick=0.001, slots=256, levels=4):
+        self.tick_ns = int(tick * 1_000_000_000)
+        self.wheel = TimingWheel(slots, levels)
+        self.origin_ns = time.monotonic_ns()
+        self.fired = 0
+        self.on_fire = None
+        self._task = None
+        self._sleeper = None
+        self._wake_tick = None
+        # Tasks of coroutine callbacks; the loop only keeps weak references
+        self._tasks = set()
+    
+    def _tick_at(self, when_ns):
+        # Round up so a timer never fires before its deadline
+        return -(-(when_ns - self.origin_ns) // self.tick_ns)
+    
+    def call_later(self, delay, callback, *args):
+        """Run callback(*args) once after `delay` seconds"""
+        deadline_ns = time.monotonic_ns() + int(delay * 1_000_000_000)
+        handle = TimerHandle(self._tick_at(deadline_ns), 0, callback, args, deadline_ns)
+        return self._add(handle)
+    
+    def call_every(self, interval, callback, *args):
+        """Run callback(*args) every `interval` seconds until cancelled"""
+        ticks = max(1, round(interval * 1_000_000_000 / self.tick_ns))
+        deadline_ns = time.monotonic_ns() + ticks * self.tick_ns
+        handle = TimerHandle(self._tick_at(deadline_ns), ticks, callback, args, deadline_ns)
+        return self._add(handle)
+    
+    def cancel(self, handle):
+        """Stop a timer from firing"""
+        self.wheel.cancel(handle)
+    
+    def countdown(self, seconds, on_done, on_tick=None):
+        """Start a countdown; on_tick(remaining) runs every second"""
+        state = {'remaining': seconds}
+        
+        def tick():
+            state['remaining'] -= 1
+            if state['remaining'] <= 0:
+                self.cancel(ticker)
+                on_done()
+            elif on_tick is not None:
+                on_tick(state['remaining'])
+        
+        ticker = self.call_every(1.0, tick)
+        return ticker
+    
+    def sequence(self, phases, on_phase_done, on_done=None):
+        """Run (name, seconds) phases back to back, e.g. intervals or a pomodoro"""
+        phases = list(phases)
+        
+        def start(i):
+            if i == len(phases):
+                if on_done is not None:
+                    on_done()
+                return
+            name, seconds = phases[i]
+            
+            def finished():
+                on_phase_done(name)
+                start(i + 1)
+            self.call_later(seconds, finished)
+        
+        start(0)
+    
+    def _add(self, handle):
+        if not self.wheel.pending:
+            # After an idle spell the wheel is behind the clock; catch it up
+            # first so the new timer isn't filed relative to a stale tick
+            self.wheel.advance((time.monotonic_ns() - self.origin_ns) // self.tick_ns)
+        self.wheel.add(handle)
+        # Wake the service early if it is sleeping past this timer
+        sleeper = self._sleeper
+        if sleeper is not None and not sleeper.done() and (
+                self._wake_tick is None or handle.expires < self._wake_tick):
+            sleeper.set_result(None)
+        return handle
+    
+    def start(self):
+        """Start the background task on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+    
+    def stop(self):
+        """Stop the background task; pending timers stay scheduled"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Sleep until the next tick with work, or until _add() brings
+            # in an earlier timer; with nothing pending, only _add() wakes us
+            self._wake_tick = due = self.wheel.next_event()
+            self._sleeper = loop.create_future()
+            if due is None:
+                await self._sleeper
+                continue
+            delay = self.origin_ns + due * self.tick_ns - time.monotonic_ns()
+            if delay > 0:
+                alarm = loop.call_later(delay / 1_000_000_000, _wake, self._sleeper)
+                try:
+                    await self._sleeper
+                finally:
+                    alarm.cancel()
+            
+            now_ns = time.monotonic_ns()
+            expired = self.wheel.advance((now_ns - self.origin_ns) // self.tick_ns)
+            if not expired:
+                continue
+            
+            self.fired += len(expired)
+            on_fire = self.on_fire
+            for handle in expired:
+                if on_fire is not None:
+                    on_fire(handle, now_ns)
+                try:
+                    result = handle.callback(*handle.args)
+                except Exception as e:
+                    # Report it like asyncio's own call_later does and keep
+                    # the other timers running
+                    loop.call_exception_handler({
+                        'message': f"Exception in timer callback {handle.callback!r}",
+                        'exception': e,
+                    })
+                    continue
+                if asyncio.iscoroutine(result):
+                    task = asyncio.ensure_future(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+
+def percentile(ordered, q):
+    """Value at fraction `q` of an already sorted list"""
+    if not ordered:
+        return 0
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def benchmark_timer_service(count=100_000, max_delay=2.0, cancel_fraction=0.1, tick=0.001):
+    """Schedule `count` timers, cancel some, and measure throughput and latency"""
+    import random
+    
+    async def scenario():
+        service = TimerService(tick=tick)
+        latencies = []
+        service.on_fire = lambda handle, now_ns: latencies.append(now_ns - handle.deadline_ns)
+        done = asyncio.Event()
+        remaining = [0]
+        
+        def fired():
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                done.set()
+        
+        # Leave a head start so scheduling itself doesn't count as latency
+        head_start = 0.5
+        delays = [random.uniform(head_start, head_start + max_delay) for _ in range(count)]
+        
+        start = time.perf_counter()
+        handles = [service.call_later(d, fired) for d in delays]
+        insert_secs = time.perf_counter() - start
+        
+        victims = random.sample(handles, int(count * cancel_fraction))
+        start = time.perf_counter()
+        for handle in victims:
+            service.cancel(handle)
+        cancel_secs = time.perf_counter() - start
+        
+        remaining[0] = count - len(victims)
+        service.start()
+        start = time.perf_counter()
+        await done.wait()
+        run_secs = time.perf_counter() - start
+        service.stop()
+        return insert_secs, cancel_secs, run_secs, len(victims), sorted(latencies)
+    
+    insert_secs, cancel_secs, run_secs, cancelled, latencies = asyncio.run(scenario())
+    
+    fired = len(latencies)
+    print("\n" + "="*50)
+    print("🏎️  TIMER SERVICE BENCHMARK")
+    print("="*50)
+    print(f"Timers scheduled: {count:,}  cancelled: {cancelled:,}  fired: {fired:,}")
+    print(f"Insert rate:      {count / insert_secs:,.0f} timers/s")
+    print(f"Cancel rate:      {cancelled / max(cancel_secs, 1e-9):,.0f} timers/s")
+    print(f"Expiry rate:      {fired / run_secs:,.0f} timers/s over {run_secs:.2f} s")
+    print("Expiry latency (fire time - deadline):")
+    for label, q in (("p50", 0.5), ("p99", 0.99), ("p99.9", 0.999)):
+        print(f"  {label:>6}: {percentile(latencies, q) / 1e6:.3f} ms")
+    print(f"  {'max':>6}: {latencies[-1] / 1e6 if latencies else 0:.3f} ms")
+    print("="*50)
+
+
+class LatencyHistogram:
+    """HDR-style latency histogram of nanosecond samples.
+    
+    Values below 2 * 2**sub_bits are counted exactly; above that each
+    power of two is split into 2**sub_bits linear sub-buckets, so every
+    value is stored to within 1 / 2**sub_bits relative error in a fixed,
+    preallocated list of counters.
+    """
+    
+    __slots__ = ('name', 'sub_bits', 'sub_count', '_top_bit', 'counts', 'count', 'total', 'min', 'max')
+    
+    EMPTY_MIN = 1 << 64
+    
+    def __init__(self, name="", sub_bits=6):
+        self.name = name
+        self.sub_bits = sub_bits
+        self.sub_count = 1 << sub_bits
+        self._top_bit = sub_bits + 1
+        self.counts = [0] * ((64 - sub_bits + 1) * self.sub_count)
+        self.count = 0
+        self.total = 0
+        self.min = self.EMPTY_MIN
+        self.max = 0
+    
+    def record(self, ns):
+        """Add one sample (a non-negative int)"""
+        shift = ns.bit_length() - self._top_bit
+        if shift > 0:
+            self.counts[(shift << self.sub_bits) + (ns >> shift)] += 1
+        else:
+            self.counts[ns] += 1
+        self.count += 1
+        self.total += ns
+        if ns < self.min:
+            self.min = ns
+        if ns > self.max:
+            self.max = ns
+    
+    def _bucket_range(self, index):
+        if index < 2 * self.sub_count:
+            return index, index + 1
+        shift = index // self.sub_count - 1
+        mantissa = index % self.sub_count + self.sub_count
+        return mantissa << shift, (mantissa + 1) << shift
+    
+    def percentile(self, q):
+        """Approximate value (ns) at fraction `q`, e.g. 0.99 for p99"""
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, c in enumerate(self.counts):
+            if c:
+                seen += c
+                if seen >= target:
+                    low, high = self._bucket_range(index)
+                    return min(max((low + high - 1) // 2, self.min), self.max)
+        return self.max
+    
+    def mean(self):
+        """Exact mean of all samples in ns"""
+        return self.total / self.count if self.count else 0.0
+    
+    def merge(self, other):
+        """Add another histogram's samples into this one"""
+        for index, c in enumerate(other.counts):
+            if c:
+                self.counts[index] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def summary(self):
+        """Dict of headline statistics, in nanoseconds"""
+        return {
+            'name': self.name,
+            'count': self.count,
+            'mean_ns': round(self.mean(), 1),
+            'min_ns': self.min if self.count else 0,
+            'p50_ns': self.percentile(0.5),
+            'p99_ns': self.percentile(0.99),
+            'p999_ns': self.percentile(0.999),
+            'max_ns': self.max,
+        }
+    
+    def to_dict(self):
+        """Summary plus the non-empty buckets as [low_ns, high_ns, count]"""
+        data = self.summary()
+        data['buckets'] = [list(self._bucket_range(i)) + [c] for i, c in enumerate(self.counts) if c]
+        return data
+
+
+class Profiler:
+    """Registry of named latency histograms"""
+    
+    def __init__(self):
+        self.histograms = {}
+    
+    def histogram(self, name):
+        """Get (or create) the histogram for `name`"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram(name)
+        return histogram
+    
+    def reset(self):
+        """Drop every histogram"""
+        self.histograms.clear()
+    
+    def to_json(self, indent=2, buckets=True):
+        """Export every histogram as a JSON string"""
+        data = {name: (h.to_dict() if buckets else h.summary())
+                for name, h in self.histograms.items()}
+        return json.dumps(data, indent=indent)
+    
+    def export_json(self, path, buckets=True):
+        """Write the JSON export to a file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json(buckets=buckets))
+    
+    def report(self):
+        """Print a table of p50/p99/p999 for every histogram"""
+        print("\n" + "="*78)
+        print("📈 LATENCY REPORT (microseconds)")
+        print("="*78)
+        print(f"{'name':30} {'count':>8} {'mean':>8} {'p50':>8} {'p99':>8} {'p999':>8} {'max':>8}")
+        for name, h in self.histograms.items():
+            s = h.summary()
+            print(f"{name[:30]:30} {s['count']:>8} {s['mean_ns'] / 1e3:>8.2f} "
+                  f"{s['p50_ns'] / 1e3:>8.2f} {s['p99_ns'] / 1e3:>8.2f} "
+                  f"{s['p999_ns'] / 1e3:>8.2f} {s['max_ns'] / 1e3:>8.2f}")
+        print("="*78)
+
+
+profiler = Profiler()
+
+
+class Timed:
+    """Context manager and decorator that records elapsed perf_counter_ns"""
+    
+    __slots__ = ('histogram', '_start')
+    
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self._start = 0
+    
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc):
+        self.histogram.record(time.perf_counter_ns() - self._start)
+        return False
+    
+    def __call__(self, func):
+        record = self.histogram.record
+        clock = time.perf_counter_ns
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+        
+        wrapper.histogram = self.histogram
+        return wrapper
+
+
+def timed(name, registry=None):
+    """Time a block (`with timed("x"):`) or a function (`@timed("x")`)"""
+    return Timed((registry or profiler).histogram(name))
+
+
+def instrument(owner, attribute, name=None, registry=None):
+    """Wrap a function or method in place with timing; returns an undo function
+    
+    e.g. instrument(tictactoe.ComputerPlayer, 'hard_move')
+    """
+    original = owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+    if name is None:
+        name = f"{getattr(owner, '__name__', type(owner).__name__)}.{attribute}"
+    setattr(owner, attribute, timed(name, registry)(original))
+    
+    def undo():
+        setattr(owner, attribute, original)
+    return undo
+
+
+def measure_overhead(samples=200_000):
+    """Return the per-sample cost in ns of the decorator and context manager"""
+    registry = Profiler()
+    
+    @timed("decorated", registry)
+    def noop():
+        pass
+    
+    def plain():
+        pass
+    
+    start = time.perf_counter_ns()
+    for _ in range(samples):
+        plain()
+    baseline = time.perf_counter_ns() - start
+    
+    start = time.perf_counter_ns()
+    for _ in range(samples):
+        noop()
+    decorated = time.perf_counter_ns() - start
+    
+    block = timed("block", registry)
+    start = time.perf_counter_ns()
+    for _ in range(samples):
+        with block:
+            pass
+    context = time.perf_counter_ns() - start
+    
+    return {
+        'decorator_ns': (decorated - baseline) / samples,
+        'context_manager_ns': context / samples,
+    }
+
+
+def profile_hot_paths(rounds=200, json_path=None):
+    """Profile tictactoe's hard AI and the password checker in place"""
+    import random
+    import password_tester
+    import tictactoe
+    
+    undo = [
+        instrument(tictactoe.ComputerPlayer, 'hard_move'),
+        instrument(tictactoe.ComputerPlayer, 'minimax'),
+        instrument(password_tester, 'check_password_strength'),
+    ]
+    
+    try:
+        player = tictactoe.ComputerPlayer('O', 'hard')
+        for _ in range(max(rounds // 20, 1)):
+            game = tictactoe.TicTacToe()
+            game.make_move(random.choice(game.available_moves()), 'X')
+            with timed("tictactoe game turn"):
+                player.get_move(game)
+        
+        alphabet = "abcXYZ123!@#"
+        for _ in range(rounds * 10):
+            password = "".join(random.choice(alphabet) for _ in range(random.randint(4, 20)))
+            password_tester.check_password_strength(password)
+    finally:
+        for restore in undo:
+            restore()
+    
+    overhead = measure_overhead()
+    profiler.report()
+    print(f"Timing overhead: decorator {overhead['decorator_ns']:.0f} ns, "
+          f"context manager {overhead['context_manager_ns']:.0f} ns per sample")
+    
+    if json_path:
+        profiler.export_json(json_path)
+        print(f"💾 Saved JSON report to {json_path}")
+
+
 def run():
     """Main function for simple timer"""
     
@@ -207,6 +1371,9 @@ def run():
         print("  3. Pomodoro Timer (25/5 min)")
         print("  4. Interval Timer")
         print("  5. Quick Timer Presets")
+        print("  6. Timer Service Benchmark (100k timers)")
+        print("  7. Resume Unfinished Timer")
+        print("  8. Profile Hot Paths (latency histograms)")
         print("  0. Return to Main Menu")
         
         choice = input("\nYour choice: ").strip()
@@ -224,7 +1391,7 @@ def run():
                     time.sleep(1)
                     continue
                 
-                countdown_timer(seconds)
+                countdown_with_journal(seconds)
                 input("\nPress Enter to continue...")
             
             except ValueError:
@@ -247,6 +1414,19 @@ def run():
             quick_timer()
             input("\nPress Enter to continue...")
         
+        elif choice == "6":
+            benchmark_timer_service()
+            input("\nPress Enter to continue...")
+        
+        elif choice == "7":
+            resume_timer()
+            input("\nPress Enter to continue...")
+        
+        elif choice == "8":
+            path = input("\nSave JSON report to (Enter to skip): ").strip()
+            profile_hot_paths(json_path=path or None)
+            input("\nPress Enter to continue...")
+        
         else:
             print("❌ Invalid choice!")
             time.sleep(1)
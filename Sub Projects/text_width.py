@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Text Width
+Measure, pad and wrap terminal text that contains colors, emoji or CJK
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+
+
+# CSI sequences (colors, cursor moves), OSC sequences (titles, links) and
+# the short two-character escapes
+ANSI_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]")
+
+ZWJ = 0x200D
+EMOJI_PRESENTATION = 0xFE0F
+
+# Range table of characters that aren't one column wide, built once on
+# first use: parallel lists of range starts, ends and widths (0 or 2)
+_starts = []
+_ends = []
+_widths = []
+
+
+def _build_table():
+    east_asian_width = unicodedata.east_asian_width
+    category = unicodedata.category
+
+    def width_of(cp):
+        char = chr(cp)
+        if east_asian_width(char) in "WF":
+            return 2
+        if category(char) in ("Mn", "Me", "Cf") or 0x1160 <= cp <= 0x11FF:
+            return 0
+        return 1
+
+    # Everything above U+1FFFF is either wide (CJK planes) or a tag /
+    # variation selector, so only the first two planes need scanning
+    ranges = []
+    start, current = 0x300, 1
+    for cp in range(0x300, 0x20000):
+        width = width_of(cp)
+        if width != current:
+            if current != 1:
+                ranges.append((start, cp - 1, current))
+            start, current = cp, width
+    if current != 1:
+        ranges.append((start, 0x1FFFF, current))
+    ranges += [(0x20000, 0x3FFFD, 2), (0xE0000, 0xE0FFF, 0)]
+
+    for start, end, width in ranges:
+        _starts.append(start)
+        _ends.append(end)
+        _widths.append(width)
+
+
+def char_width(cp):
+    """Columns taken by one code point: 0, 1 or 2"""
+    if cp < 0x300:
+        return 1 if cp >= 0x20 and not 0x7F <= cp < 0xA0 else 0
+    if not _starts:
+        _build_table()
+    i = bisect_right(_starts, cp) - 1
+    if i >= 0 and cp <= _ends[i]:
+        return _widths[i]
+    return 1
+
+
+def strip_ansi(text):
+    """Remove ANSI escape sequences"""
+    return ANSI_RE.sub("", text) if "\x1b" in text else text
+
+
+@lru_cache(maxsize=4096)
+def display_width(text):
+    """Number of terminal columns `text` occupies once printed"""
+    text = strip_ansi(text)
+    if text.isascii() and text.isprintable():
+        return len(text)
+
+    total = 0
+    last = 0
+    joined = False
+    for char in text:
+        cp = ord(char)
+        if cp == EMOJI_PRESENTATION:
+            # A variation selector turns a narrow symbol like ☀ into a wide emoji
+            if last == 1:
+                total += 1
+                last = 2
+            continue
+        if cp == ZWJ:
+            joined = True
+            continue
+        width = char_width(cp)
+        if joined and width:
+            # The next part of a ZWJ sequence draws inside the same glyph
+            joined = False
+            continue
+        total += width
+        if width:
+            last = width
+    return total
+
+
+def pad(text, width, align="<", fill=" "):
+    """Pad to `width` columns like format(text, f"{align}{width}") would"""
+    gap = width - display_width(text)
+    if gap <= 0:
+        return text
+    if align == ">":
+        return fill * gap + text
+    if align == "^":
+        return fill * (gap // 2) + text + fill * (gap - gap // 2)
+    return text + fill * gap
+
+
+def truncate(text, width, ellipsis="…"):
+    """Cut text to at most `width` columns, keeping its escape sequences"""
+    if display_width(text) <= width:
+        return text
+
+    limit = width - display_width(ellipsis)
+    out = []
+    used = 0
+    pos = 0
+    for match in ANSI_RE.finditer(text):
+        chunk, pos = text[pos:match.start()], match.end()
+        used = _take(chunk, limit, used, out)
+        out.append(match.group())
+    _take(text[pos:], limit, used, out)
+
+    # Put the ellipsis before any trailing escapes (usually a reset)
+    tail = []
+    while out and ANSI_RE.fullmatch(out[-1]):
+        tail.append(out.pop())
+    return "".join(out) + ellipsis + "".join(reversed(tail))
+
+
+def _take(chunk, limit, used, out):
+    for char in chunk:
+        width = display_width(char)
+        if used + width > limit:
+            return limit + 1
+        out.append(char)
+        used += width
+    return used
+
+
+def wrap(text, width):
+    """Word-wrap text to `width` columns; escape sequences cost nothing"""
+    lines = []
+    for paragraph in text.split("\n"):
+        line, used = [], 0
+        for word in paragraph.split(" "):
+            size = display_width(word)
+            if line and used + 1 + size > width:
+                lines.append(" ".join(line))
+                line, used = [], 0
+            used += size + (1 if line else 0)
+            line.append(word)
+        lines.append(" ".join(line))
+    return lines
@@ -8,6 +8,8 @@ import random
 import time
 from datetime import datetime
 
+from text_width import pad
+
 
 class WeatherChecker:
     def __init__(self):
@@ -246,7 +248,8 @@ def compare_cities():
         temp_c = weather['temperature']
         temp_f = checker.celsius_to_fahrenheit(temp_c)
         
-        print(f"{city:15} {weather['icon']} {temp_c:3}°C / {temp_f:3}°F  ({weather['condition']})")
+        # Icons are one or two columns wide depending on the emoji
+        print(f"{pad(city, 15)} {pad(weather['icon'], 2)} {temp_c:3}°C / {temp_f:3}°F  ({weather['condition']})")
     
     print("="*50)
 